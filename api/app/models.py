@@ -682,3 +682,21 @@ class DebugSession(Base):
     # Relationships
     execution = relationship("Execution")
     creator = relationship("User")
+
+
+class DebugEvent(Base):
+    __tablename__ = "debug_events"
+
+    # Integer key so events read back in the order they were recorded
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    session_id = Column(String, ForeignKey(
+        "debug_sessions.id", ondelete="CASCADE"), nullable=False, index=True)
+    kind = Column(String, nullable=False)  # breakpoint, snapshot or trace
+    # Reservoir slot of a snapshot or trace event; replacing the event in
+    # that slot updates this row
+    slot = Column(Integer)
+    payload = Column(Text)  # JSON with the event data
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
+
+    # Relationships
+    session = relationship("DebugSession")
@@ -535,6 +535,7 @@ async def get_debug_sessions(
     try:
         debug_manager = get_debug_manager(db)
         sessions = debug_manager.get_sessions_for_execution(execution_id)
+        debug_data = debug_manager.load_debug_data(sessions)
 
         return {
             "execution_id": execution_id,
@@ -543,7 +544,7 @@ async def get_debug_sessions(
                     "id": session.id,
                     "session_name": session.session_name,
                     "is_active": session.is_active,
-                    "debug_data": json.loads(session.debug_data),
+                    "debug_data": debug_data[session.id],
                     "created_by": session.created_by,
                     "created_at": session.created_at
                 }
@@ -580,7 +581,7 @@ async def get_debug_session(
             "execution_id": session.execution_id,
             "session_name": session.session_name,
             "is_active": session.is_active,
-            "debug_data": json.loads(session.debug_data),
+            "debug_data": debug_manager.load_debug_data([session])[session.id],
             "created_by": session.created_by,
             "created_at": session.created_at
         }
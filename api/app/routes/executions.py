@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from typing import List, Dict, Any, Optional
 import json
 import uuid
+from collections import Counter
 from datetime import datetime, timezone
 
 from app.database import get_session
@@ -301,27 +302,17 @@ async def get_execution_summary(
         ExecutionRule.execution_id == execution_id
     ).all()
 
-    # Get issues breakdown
-    issues = db.query(Issue).filter(Issue.execution_id == execution_id).all()
+    # Get issues breakdown; only the grouped columns are needed
+    issues = db.query(Issue.severity, Issue.category, Issue.rule_id).filter(
+        Issue.execution_id == execution_id).all()
 
     # Calculate summary statistics
-    issues_by_severity = {}
-    issues_by_category = {}
-    issues_by_rule = {}
-
-    for issue in issues:
-        # Count by severity
-        severity = issue.severity.value if hasattr(
-            issue.severity, 'value') else str(issue.severity)
-        issues_by_severity[severity] = issues_by_severity.get(severity, 0) + 1
-
-        # Count by category
-        category = issue.category or 'unknown'
-        issues_by_category[category] = issues_by_category.get(category, 0) + 1
-
-        # Count by rule
-        rule_id = issue.rule_id
-        issues_by_rule[rule_id] = issues_by_rule.get(rule_id, 0) + 1
+    issues_by_severity = dict(Counter(
+        severity.value if hasattr(severity, 'value') else str(severity)
+        for severity, _, _ in issues))
+    issues_by_category = dict(Counter(
+        category or 'unknown' for _, category, _ in issues))
+    issues_by_rule = dict(Counter(rule_id for _, _, rule_id in issues))
 
     return {
         "execution_id": execution_id,
@@ -141,8 +141,10 @@ async def update_rule(
             detail="Rule not found"
         )
 
-    # Always create a new version to preserve history
-    new_version = await create_rule_version(rule, rule_data, org_context.user, db)
+    # Always create a new version to preserve history; the request session
+    # commits it together with the original rule's is_latest change
+    new_version = await create_rule_version(
+        rule, rule_data, org_context.user, db, commit=False)
     return RuleResponse.model_validate(new_version)
 
 
@@ -172,7 +174,8 @@ async def activate_rule(
 
     # Create new version with is_active=True
     rule_update = RuleUpdate(is_active=True)
-    new_version = await create_rule_version(rule, rule_update, org_context.user, db)
+    new_version = await create_rule_version(
+        rule, rule_update, org_context.user, db, commit=False)
 
     return {
         "message": "Rule activated successfully",
@@ -207,7 +210,8 @@ async def deactivate_rule(
 
     # Create new version with is_active=False
     rule_update = RuleUpdate(is_active=False)
-    new_version = await create_rule_version(rule, rule_update, org_context.user, db)
+    new_version = await create_rule_version(
+        rule, rule_update, org_context.user, db, commit=False)
 
     return {
         "message": "Rule deactivated successfully",
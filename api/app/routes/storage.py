@@ -5,7 +5,7 @@ Shows how to use the storage backend in a storage-agnostic way.
 """
 
 from fastapi import APIRouter, UploadFile, File, HTTPException, Query
-from fastapi.responses import Response, StreamingResponse
+from fastapi.responses import StreamingResponse
 from typing import List
 import logging
 
@@ -27,11 +27,13 @@ async def upload_file(file: UploadFile = File(...)):
     or GCS (production) is configured - the abstraction layer handles it!
     """
     try:
-        # Read file data
-        data = await file.read()
+        # Measure the spooled upload instead of reading it into memory
+        file.file.seek(0, 2)
+        size_bytes = file.file.tell()
+        file.file.seek(0)
 
         # Check file size
-        file_size_mb = len(data) / (1024 * 1024)
+        file_size_mb = size_bytes / (1024 * 1024)
         if file_size_mb > storage_settings.max_file_size_bytes / (1024 * 1024):
             raise HTTPException(
                 status_code=413,
@@ -43,14 +45,15 @@ async def upload_file(file: UploadFile = File(...)):
         file_key = f"uploads/{file.filename}"
 
         # Upload to storage - works with both MinIO and GCS!
-        url = storage.upload_file(
+        url = await storage.upload_stream_async(
             bucket=storage_settings.storage_bucket,
             key=file_key,
-            data=data,
+            fileobj=file.file,
+            size=size_bytes,
             content_type=file.content_type or "application/octet-stream",
             metadata={
                 "original_filename": file.filename,
-                "size_bytes": str(len(data)),
+                "size_bytes": str(size_bytes),
             },
         )
 
@@ -59,7 +62,7 @@ async def upload_file(file: UploadFile = File(...)):
         return {
             "message": "File uploaded successfully",
             "filename": file.filename,
-            "size_bytes": len(data),
+            "size_bytes": size_bytes,
             "size_mb": round(file_size_mb, 2),
             "storage_key": file_key,
             "url": url,
@@ -83,25 +86,26 @@ async def download_file(file_key: str):
         file_key: The storage key/path of the file
     """
     try:
-        # Check if file exists
-        if not storage.file_exists(storage_settings.storage_bucket, file_key):
+        # Get file metadata; None means the file doesn't exist
+        metadata = await storage.stat_async(storage_settings.storage_bucket, file_key)
+        if metadata is None:
             raise HTTPException(status_code=404, detail="File not found")
 
-        # Get file metadata
-        metadata = storage.get_file_metadata(storage_settings.storage_bucket, file_key)
-
-        # Download file data
-        data = storage.download_file(storage_settings.storage_bucket, file_key)
-
         # Extract filename from key
         filename = file_key.split("/")[-1]
 
-        logger.info(f"Downloaded file {file_key}")
+        headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+        if metadata.get("size") is not None:
+            headers["Content-Length"] = str(metadata["size"])
+
+        logger.info(f"Downloading file {file_key}")
 
-        return Response(
-            content=data,
+        # Stream the file data in chunks instead of buffering it whole;
+        # the sync iterator is consumed in the threadpool
+        return StreamingResponse(
+            storage.download_stream(storage_settings.storage_bucket, file_key),
             media_type=metadata.get("content_type", "application/octet-stream"),
-            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+            headers=headers,
         )
 
     except FileNotFoundError:
@@ -127,11 +131,11 @@ async def get_signed_url(
     """
     try:
         # Check if file exists
-        if not storage.file_exists(storage_settings.storage_bucket, file_key):
+        if not await storage.file_exists_async(storage_settings.storage_bucket, file_key):
             raise HTTPException(status_code=404, detail="File not found")
 
         # Generate signed URL
-        signed_url = storage.get_signed_url(
+        signed_url = await storage.get_signed_url_async(
             bucket=storage_settings.storage_bucket, key=file_key, expiration=expiration
         )
 
@@ -164,7 +168,7 @@ async def list_files(
         max_results: Maximum number of results (1-1000)
     """
     try:
-        files = storage.list_files(
+        files = await storage.list_files_async(
             bucket=storage_settings.storage_bucket, prefix=prefix, max_results=max_results
         )
 
@@ -193,7 +197,7 @@ async def delete_file(file_key: str):
     """
     try:
         # Delete the file
-        deleted = storage.delete_file(storage_settings.storage_bucket, file_key)
+        deleted = await storage.delete_file_async(storage_settings.storage_bucket, file_key)
 
         if not deleted:
             raise HTTPException(status_code=404, detail="File not found")
@@ -220,7 +224,7 @@ async def get_file_metadata(file_key: str):
         file_key: The storage key/path of the file
     """
     try:
-        metadata = storage.get_file_metadata(storage_settings.storage_bucket, file_key)
+        metadata = await storage.get_file_metadata_async(storage_settings.storage_bucket, file_key)
 
         logger.info(f"Retrieved metadata for {file_key}")
 
@@ -248,7 +252,7 @@ async def storage_health():
         test_data = b"health check"
 
         # Try to upload
-        storage.upload_file(
+        await storage.upload_file_async(
             bucket=storage_settings.storage_bucket,
             key=test_key,
             data=test_data,
@@ -256,10 +260,10 @@ async def storage_health():
         )
 
         # Try to download
-        downloaded = storage.download_file(storage_settings.storage_bucket, test_key)
+        downloaded = await storage.download_file_async(storage_settings.storage_bucket, test_key)
 
         # Try to delete
-        storage.delete_file(storage_settings.storage_bucket, test_key)
+        await storage.delete_file_async(storage_settings.storage_bucket, test_key)
 
         # Check if operations succeeded
         success = downloaded == test_data
@@ -9,6 +9,7 @@ import signal
 import resource
 import time
 import threading
+from collections import OrderedDict
 from contextlib import contextmanager
 from typing import Any, Dict, List, Optional, Callable
 from datetime import datetime, timezone
@@ -18,6 +19,9 @@ from app.utils.logging_service import get_logger
 
 logger = get_logger()
 
+# Compiled code objects kept per executor; least recently used are evicted
+COMPILED_CODE_CACHE_SIZE = 256
+
 
 class SecurityError(Exception):
     """Exception raised for security violations."""
@@ -91,6 +95,10 @@ class SecureExecutor:
         # Thread-local storage for execution context
         self._local = threading.local()
 
+        # Validated and compiled code objects keyed by source string
+        self._compiled_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._compiled_cache_lock = threading.Lock()
+
     @contextmanager
     def _resource_limits(self):
         """Context manager for applying resource limits."""
@@ -170,6 +178,42 @@ class SecureExecutor:
 
         return tree
 
+    def _compile_code(self, code_str: str) -> tuple:
+        """
+        Validate and compile code, reusing the result for repeated code strings.
+
+        Args:
+            code_str: Code string to compile
+
+        Returns:
+            Tuple of (code object, mode) where mode is 'eval' or 'exec'
+
+        Raises:
+            SecurityError: If code contains security violations
+        """
+        with self._compiled_cache_lock:
+            cached = self._compiled_cache.get(code_str)
+            if cached is not None:
+                self._compiled_cache.move_to_end(code_str)
+                return cached
+
+        tree = self._validate_code(code_str)
+
+        # A single expression statement is evaluated for its value
+        if len(tree.body) == 1 and isinstance(tree.body[0], ast.Expr):
+            expression = ast.Expression(body=tree.body[0].value)
+            cached = (compile(expression, filename="<secure_code>",
+                              mode="eval"), 'eval')
+        else:
+            cached = (compile(tree, filename="<secure_code>",
+                              mode="exec"), 'exec')
+
+        with self._compiled_cache_lock:
+            self._compiled_cache[code_str] = cached
+            while len(self._compiled_cache) > COMPILED_CODE_CACHE_SIZE:
+                self._compiled_cache.popitem(last=False)
+        return cached
+
     def _create_safe_context(self, additional_context: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Create safe execution context.
@@ -223,8 +267,8 @@ class SecureExecutor:
             code_length=len(code_str)
         )
 
-        # Validate code
-        tree = self._validate_code(code_str)
+        # Validate and compile code
+        compiled_code, mode = self._compile_code(code_str)
 
         # Create safe context
         safe_context = self._create_safe_context(context)
@@ -238,17 +282,13 @@ class SecureExecutor:
 
             # Execute with resource limits
             with self._resource_limits():
-                # Compile and execute
+                # Execute
                 start_time = time.time()
 
-                try:
-                    compiled_code = compile(
-                        tree, filename="<secure_code>", mode="eval")
+                if mode == 'eval':
                     result = eval(compiled_code, safe_context)
-                except SyntaxError:
-                    # If it's not an expression, try as statement
-                    compiled_code = compile(
-                        tree, filename="<secure_code>", mode="exec")
+                else:
+                    # Statements report their outcome through _result
                     exec(compiled_code, safe_context)
                     result = safe_context.get('_result', None)
 
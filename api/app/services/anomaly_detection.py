@@ -27,6 +27,7 @@ from app.models import (
     Rule, RuleKind, Criticality
 )
 from app.services.data_import import DataImportService
+from app.utils import decode_rule_json
 
 
 class AnomalyDetectionService:
@@ -399,7 +400,7 @@ class MLAnomalyValidator:
         self.rule = rule
         self.df = df
         self.db = db
-        self.params = json.loads(rule.params) if rule.params else {}
+        self.params = dict(decode_rule_json(rule, 'params', {}))
         self.model_id = self.params.get('model_id')
         self.threshold = self.params.get('threshold', 0.5)
         self.anomaly_service = AnomalyDetectionService(db)
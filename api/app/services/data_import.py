@@ -4,6 +4,8 @@ import hashlib
 import uuid
 import os
 import logging
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Union
 from fastapi import UploadFile, HTTPException, status
@@ -26,6 +28,43 @@ logger = logging.getLogger(__name__)
 DATASET_STORAGE_PATH = Path("data/datasets")
 
 
+# Upper bound on the in-memory size of parsed datasets kept for reuse;
+# least recently used frames are evicted first
+DATASET_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+_dataset_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+_dataset_cache_bytes = 0
+_dataset_cache_lock = threading.Lock()
+
+
+def _read_dataset_parquet(path: str, mtime_ns: int) -> pd.DataFrame:
+    """Read a dataset file; mtime_ns is part of the cache key so rewrites invalidate it"""
+    global _dataset_cache_bytes
+    key = (path, mtime_ns)
+    with _dataset_cache_lock:
+        cached = _dataset_cache.get(key)
+        if cached is not None:
+            _dataset_cache.move_to_end(key)
+            return cached[0]
+
+    # Normalize dtypes once per cached file rather than once per execution.
+    # Floats keep full precision so range checks compare exactly.
+    df = OptimizedDataFrameOperations.optimize_dtypes(
+        pd.read_parquet(path), downcast_floats=False)
+    size = int(df.memory_usage(deep=True).sum())
+    if size > DATASET_CACHE_MAX_BYTES:
+        return df
+
+    with _dataset_cache_lock:
+        if key not in _dataset_cache:
+            _dataset_cache[key] = (df, size)
+            _dataset_cache_bytes += size
+            while _dataset_cache_bytes > DATASET_CACHE_MAX_BYTES:
+                _, (_, evicted_size) = _dataset_cache.popitem(last=False)
+                _dataset_cache_bytes -= evicted_size
+    return df
+
+
 class DataImportService:
 
     def __init__(self, db: Session):
@@ -66,6 +105,24 @@ class DataImportService:
 
         return pd.read_parquet(file_path)
 
+    def load_dataset_file_cached(self, dataset_id: str, version_no: int = 1) -> pd.DataFrame:
+        """
+        Load a dataset DataFrame, reusing the parsed file while it is unchanged on disk.
+        Returns a shallow copy: callers may add or replace columns, but must not
+        modify the cached values in place.
+        """
+        filename = f"{dataset_id}_v{version_no}.parquet"
+        file_path = DATASET_STORAGE_PATH / filename
+
+        if not file_path.exists():
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Dataset file not found: {filename}"
+            )
+
+        df = _read_dataset_parquet(str(file_path), file_path.stat().st_mtime_ns)
+        return df.copy(deep=False)
+
     def detect_source_type(self, filename: str) -> SourceType:
         """Detect source type based on file extension"""
         ext = filename.lower().split('.')[-1]
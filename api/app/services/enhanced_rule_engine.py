@@ -14,7 +14,7 @@ from app.models import (
     Rule, RuleKind, Execution, ExecutionRule, Issue,
     DatasetVersion, User, Criticality, ExecutionStatus
 )
-from app.services.rule_engine import RuleEngineService
+from app.services.rule_engine import IssueSummary, RuleEngineService
 from app.services.dependency_manager import DependencyManager
 from app.utils.parallel_executor import ParallelRuleExecutor, ExecutionMode
 from app.utils.logging_service import get_logger, ExecutionPhase
@@ -234,21 +234,17 @@ class EnhancedRuleEngineService(RuleEngineService):
             execution.finished_at = datetime.now(timezone.utc)
 
             # Calculate summary statistics
-            if all_issues:
-                execution.rows_affected = len(
-                    set(issue.row_index for issue in all_issues))
-                execution.columns_affected = len(
-                    set(issue.column_name for issue in all_issues))
-            else:
-                execution.rows_affected = 0
-                execution.columns_affected = 0
+            summary = IssueSummary()
+            summary.add_all(all_issues)
+            execution.rows_affected = summary.rows_affected
+            execution.columns_affected = summary.columns_affected
 
             execution.summary = json.dumps({
-                'total_issues': len(all_issues),
+                'total_issues': summary.total_issues,
                 'successful_rules': successful_rules,
                 'failed_rules': failed_rules,
-                'issues_by_severity': self._count_issues_by_severity(all_issues),
-                'issues_by_category': self._count_issues_by_category(all_issues)
+                'issues_by_severity': dict(summary.by_severity),
+                'issues_by_category': dict(summary.by_category)
             })
 
             self.db.commit()
@@ -452,29 +448,30 @@ class EnhancedRuleEngineService(RuleEngineService):
                     if 'row_index' not in issue_data or 'column_name' not in issue_data:
                         continue
 
-                    issue = Issue(
-                        execution_id=execution.id,
-                        rule_id=rule_id,
-                        rule_snapshot=lightweight_snapshot,
-                        row_index=issue_data['row_index'],
-                        column_name=issue_data['column_name'],
-                        current_value=issue_data.get('current_value'),
-                        suggested_value=issue_data.get('suggested_value'),
-                        message=issue_data.get(
+                    rule_issues.append({
+                        'execution_id': execution.id,
+                        'rule_id': rule_id,
+                        'rule_snapshot': lightweight_snapshot,
+                        'row_index': issue_data['row_index'],
+                        'column_name': issue_data['column_name'],
+                        'current_value': issue_data.get('current_value'),
+                        'suggested_value': issue_data.get('suggested_value'),
+                        'message': issue_data.get(
                             'message', 'Data quality issue found'),
-                        category=issue_data.get('category', 'unknown'),
-                        severity=rule.criticality
-                    )
-                    self.db.add(issue)
-                    rule_issues.append(issue)
-                    all_issues.append(issue)
+                        'category': issue_data.get('category', 'unknown'),
+                        'severity': rule.criticality
+                    })
+
+                if rule_issues:
+                    self.db.bulk_insert_mappings(Issue, rule_issues)
+                    all_issues.extend(rule_issues)
 
                 # Update execution rule stats
                 execution_rule.error_count = len(rule_issues)
                 execution_rule.rows_flagged = len(
-                    set(i.row_index for i in rule_issues)) if rule_issues else 0
+                    set(i['row_index'] for i in rule_issues)) if rule_issues else 0
                 execution_rule.cols_flagged = len(
-                    set(i.column_name for i in rule_issues)) if rule_issues else 0
+                    set(i['column_name'] for i in rule_issues)) if rule_issues else 0
 
                 # End rule tracking with success
                 self.logger.end_rule_tracking(
@@ -548,22 +545,23 @@ class EnhancedRuleEngineService(RuleEngineService):
                     if 'row_index' not in issue_data or 'column_name' not in issue_data:
                         continue
 
-                    issue = Issue(
-                        execution_id=execution.id,
-                        rule_id=rule_id,
-                        rule_snapshot=lightweight_snapshot,
-                        row_index=issue_data['row_index'],
-                        column_name=issue_data['column_name'],
-                        current_value=issue_data.get('current_value'),
-                        suggested_value=issue_data.get('suggested_value'),
-                        message=issue_data.get(
+                    rule_issues.append({
+                        'execution_id': execution.id,
+                        'rule_id': rule_id,
+                        'rule_snapshot': lightweight_snapshot,
+                        'row_index': issue_data['row_index'],
+                        'column_name': issue_data['column_name'],
+                        'current_value': issue_data.get('current_value'),
+                        'suggested_value': issue_data.get('suggested_value'),
+                        'message': issue_data.get(
                             'message', 'Data quality issue found'),
-                        category=issue_data.get('category', 'unknown'),
-                        severity='medium'  # Default severity for parallel execution
-                    )
-                    self.db.add(issue)
-                    rule_issues.append(issue)
-                    all_issues.append(issue)
+                        'category': issue_data.get('category', 'unknown'),
+                        'severity': 'medium'  # Default severity for parallel execution
+                    })
+
+                if rule_issues:
+                    self.db.bulk_insert_mappings(Issue, rule_issues)
+                    all_issues.extend(rule_issues)
 
                 # Update execution rule stats
                 execution_rule.error_count = len(rule_issues)
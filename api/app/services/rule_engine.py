@@ -1,8 +1,16 @@
+import numpy as np
 import pandas as pd
+import ast
 import json
 import re
 import logging
-from typing import List, Dict, Any, Optional
+import os
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import repeat
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 from abc import ABC, abstractmethod
@@ -12,41 +20,69 @@ from app.models import (
     Rule, RuleKind, Execution, ExecutionRule, Issue,
     DatasetVersion, User, Criticality, ExecutionStatus
 )
-from app.utils import ChunkedDataFrameReader, MemoryMonitor
+from app.utils import ChunkedDataFrameReader, MemoryMonitor, decode_rule_json
 from app.services.rule_versioning import create_rule_snapshot, create_lightweight_rule_snapshot
 from app.validators.statistical_validators import (
     StatisticalOutlierValidator, DistributionCheckValidator, CorrelationValidator
 )
 from app.services.anomaly_detection import MLAnomalyValidator
 
+try:
+    import pyarrow as pa
+    _ARROW_STRING = pd.ArrowDtype(pa.string())
+except ImportError:
+    _ARROW_STRING = None
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
 
+# AST nodes allowed in expressions evaluated column-wise with DataFrame.eval.
+# Calls and attribute access are excluded so the fast path cannot reach
+# DataFrame methods that bypass the sandbox.
+_VECTORIZABLE_NODES = (
+    ast.Module, ast.Expr, ast.Expression, ast.Compare, ast.BoolOp, ast.BinOp,
+    ast.UnaryOp, ast.Name, ast.Load, ast.Constant, ast.List, ast.Tuple,
+    ast.operator, ast.cmpop, ast.boolop, ast.unaryop,
+)
+
+
+# Local part, '@', and a domain containing at least one dot; no whitespace or extra '@'
+_EMAIL_PATTERN = re.compile(r'[^@\s]+@[^@\s]+\.[^@\s]+')
+
+
+@lru_cache(maxsize=1024)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a regex pattern once and reuse it across rule executions"""
+    return re.compile(pattern)
+
+
 class RuleValidator(ABC):
     """Abstract base class for all rule validators"""
 
-    def __init__(self, rule: Rule, df: pd.DataFrame, db: Session):
+    # Stateless chunking configuration shared by every validator instance
+    chunked_reader = ChunkedDataFrameReader(chunk_size=5000)
+
+    def __init__(self, rule: Rule, df: pd.DataFrame, db: Session,
+                 col_ctx: Optional[Dict[str, Dict[str, Any]]] = None):
         self.rule = rule
         self.df = df
         self.db = db
-        self.chunked_reader = ChunkedDataFrameReader(chunk_size=5000)
+        # Per-column values shared across the rules of one execution; only
+        # valid for the frame it was built from (not for chunks of it)
+        self.col_ctx = col_ctx
+        self._col_ctx_df = df
 
-        # Handle SQLAlchemy model attribute access
-        params_str = getattr(rule, 'params', None)
-        self.params = json.loads(params_str) if params_str else {}
+        # Handle SQLAlchemy model attribute access; decoded JSON is cached on
+        # the rule, so copy before merging to keep the cached dict untouched
+        self.params = dict(decode_rule_json(rule, 'params', {}))
 
         # Merge target_columns into params if not already present
         # This ensures validators can access columns from either location
-        target_columns_str = getattr(rule, 'target_columns', None)
-        print(
-            f"[DEBUG] Rule: {rule.name}, target_columns_str: {target_columns_str}, params before: {self.params}")
-        if target_columns_str:
-            target_columns = json.loads(target_columns_str) if isinstance(
-                target_columns_str, str) else target_columns_str
-            if target_columns and 'columns' not in self.params:
-                self.params['columns'] = target_columns
-        print(f"[DEBUG] Rule: {rule.name}, params after: {self.params}")
+        target_columns = decode_rule_json(rule, 'target_columns', [])
+        if target_columns and 'columns' not in self.params:
+            self.params['columns'] = target_columns
+        logger.debug("Rule %s resolved params: %s", rule.name, self.params)
 
     @abstractmethod
     def validate(self) -> List[Dict[str, Any]]:
@@ -91,6 +127,107 @@ class RuleValidator(ABC):
         self.df = original_df
         return issues
 
+    def _column_ctx(self, column: str) -> Optional[Dict[str, Any]]:
+        """Return the shared context of a column if it describes self.df"""
+        if self.col_ctx is None or self.df is not self._col_ctx_df:
+            return None
+        return self.col_ctx.get(column)
+
+    def _null_mask(self, column: str) -> np.ndarray:
+        """Boolean array marking the null cells of a column"""
+        ctx = self._column_ctx(column)
+        if ctx is not None:
+            return ctx['isna']
+        return self.df[column].isna().to_numpy()
+
+    def _string_values(self, column: str) -> pd.Series:
+        r"""
+        Return the non-null values of a column as strings. When pyarrow is
+        available they are Arrow-backed, so .str, isin and len run as Arrow
+        compute kernels instead of per-object Python calls. The result is
+        cached in the column context, so callers must not modify it.
+        Regex matching and case folding go through .astype(object) instead:
+        Arrow's RE2 and lowercase kernels disagree with Python on non-ASCII
+        text, \s/\w/\d classes and a trailing newline before $.
+        """
+        ctx = self._column_ctx(column)
+        if ctx is not None and 'str_values' in ctx:
+            return ctx['str_values']
+
+        values = self.df[column].dropna().astype(str)
+        if _ARROW_STRING is not None:
+            values = values.astype(_ARROW_STRING)
+        if ctx is not None:
+            ctx['str_values'] = values
+        return values
+
+    def _column_names(self):
+        """
+        Set-like collection of the DataFrame's column names for membership
+        checks. The shared column context already is one, so only frames
+        without a context pay for building a set.
+        """
+        if self.col_ctx is not None and self.df is self._col_ctx_df:
+            return self.col_ctx.keys()
+        return frozenset(self.df.columns)
+
+    def _existing_columns(self, columns: List[str]) -> List[str]:
+        """
+        Return the configured columns present in the DataFrame, in order.
+        Missing columns are logged once per call and skipped.
+        """
+        df_columns = self._column_names()
+        existing = [col for col in columns if col in df_columns]
+        if len(existing) != len(columns):
+            missing = [col for col in columns if col not in df_columns]
+            logger.warning(
+                "Rule %s references non-existent columns: %s", self.rule.name, missing)
+        return existing
+
+    def _flagged_rows(self, mask) -> List[int]:
+        """
+        Return the row numbers (index labels) of rows where ``mask`` is True.
+        Labels (not positions) are used so chunked slices keep their original row numbers.
+        """
+        positions = np.flatnonzero(np.asarray(mask, dtype=bool))
+        return self._row_numbers(self.df.index[positions])
+
+    @staticmethod
+    def _row_numbers(labels) -> List[int]:
+        """Convert index labels to plain ints with a single array cast"""
+        return np.asarray(labels).astype(np.int64).tolist()
+
+    @staticmethod
+    def _build_issues(
+        row_indices: List[int],
+        column_name: Any,
+        current_values: Any,
+        suggested_values: Any,
+        messages: Any,
+        category: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Materialize issue dicts from column-wise data for the flagged rows.
+        Arrays and Series hold one value per row; any other argument is shared by all rows.
+        """
+        def per_row(value):
+            if isinstance(value, (np.ndarray, pd.Series)):
+                return value.tolist()
+            if isinstance(value, list):
+                return value
+            return repeat(value)
+
+        return [{
+            'row_index': row_index,
+            'column_name': column,
+            'current_value': current,
+            'suggested_value': suggested,
+            'message': message,
+            'category': category
+        } for row_index, column, current, suggested, message in zip(
+            row_indices, per_row(column_name), per_row(current_values),
+            per_row(suggested_values), per_row(messages))]
+
 
 class MissingDataValidator(RuleValidator):
     """Validator for missing data detection with chunking support"""
@@ -111,34 +248,19 @@ class MissingDataValidator(RuleValidator):
         target_columns = self.params.get('columns', [])
 
         if not target_columns:
-            print(
-                f"Warning: Rule {self.rule.name} has no target columns configured")
+            logger.warning(
+                "Rule %s has no target columns configured", self.rule.name)
             return issues
 
         # Validate columns exist in dataset
-        missing_columns = [
-            col for col in target_columns if col not in self.df.columns]
-        if missing_columns:
-            print(
-                f"Warning: Rule {self.rule.name} references non-existent columns: {missing_columns}")
-
-        for column in target_columns:
-            if column not in self.df.columns:
-                print(f"Skipping column '{column}' - not found in dataset")
+        for column in self._existing_columns(target_columns):
+            null_mask = self._null_mask(column)
+            if not null_mask.any():
                 continue
 
-            null_mask = self.df[column].isnull()
-            null_indices = self.df[null_mask].index.tolist()
-
-            for idx in null_indices:
-                issues.append({
-                    'row_index': int(str(idx)) if not isinstance(idx, int) else idx,
-                    'column_name': column,
-                    'current_value': None,
-                    'suggested_value': self.params.get('default_value', ''),
-                    'message': f'Missing value in required field {column}',
-                    'category': 'missing_data'
-                })
+            issues.extend(self._build_issues(
+                self._flagged_rows(null_mask), column, None, self.params.get('default_value', ''),
+                f'Missing value in required field {column}', 'missing_data'))
 
         return issues
 
@@ -163,22 +285,12 @@ class StandardizationValidator(RuleValidator):
         standardization_type = self.params.get('type', 'date')
 
         if not target_columns:
-            print(
-                f"Warning: Rule {self.rule.name} has no target columns configured")
+            logger.warning(
+                "Rule %s has no target columns configured", self.rule.name)
             return issues
 
         # Validate columns exist in dataset
-        missing_columns = [
-            col for col in target_columns if col not in self.df.columns]
-        if missing_columns:
-            print(
-                f"Warning: Rule {self.rule.name} references non-existent columns: {missing_columns}")
-
-        for column in target_columns:
-            if column not in self.df.columns:
-                print(f"Skipping column '{column}' - not found in dataset")
-                continue
-
+        for column in self._existing_columns(target_columns):
             if standardization_type == 'date':
                 issues.extend(self._validate_dates(column))
             elif standardization_type == 'phone':
@@ -201,32 +313,25 @@ class StandardizationValidator(RuleValidator):
         issues = []
         date_format = self.params.get('format', '%Y-%m-%d')
 
-        for idx, value in self.df[column].items():
-            if pd.isnull(value):
-                continue
+        values = self.df[column].dropna()
+        if values.empty:
+            return issues
 
-            try:
-                # Try to parse the date
-                parsed_date = pd.to_datetime(value, format=date_format)
-                # Check if it matches expected format
-                if str(value) != parsed_date.strftime(date_format):
-                    issues.append({
-                        'row_index': int(str(idx)) if not isinstance(idx, int) else idx,
-                        'column_name': column,
-                        'current_value': str(value),
-                        'suggested_value': parsed_date.strftime(date_format),
-                        'message': f'Date format should be {date_format}',
-                        'category': 'date_standardization'
-                    })
-            except:
-                issues.append({
-                    'row_index': int(str(idx)) if not isinstance(idx, int) else idx,
-                    'column_name': column,
-                    'current_value': str(value),
-                    'suggested_value': '',
-                    'message': f'Invalid date format, expected {date_format}',
-                    'category': 'date_standardization'
-                })
+        # Parse the whole column in one call; unparseable values become NaT
+        parsed = pd.to_datetime(values, format=date_format, errors='coerce')
+        as_text = values.astype(str)
+        invalid = parsed.isna().to_numpy()
+        reformatted = parsed.dt.strftime(date_format)
+        # Check if parsed values match expected format
+        mismatch = ~invalid & (as_text != reformatted).to_numpy()
+
+        issues.extend(self._build_issues(
+            self._row_numbers(values.index[invalid]), column, as_text[invalid], '',
+            f'Invalid date format, expected {date_format}', 'date_standardization'))
+        issues.extend(self._build_issues(
+            self._row_numbers(values.index[mismatch]), column, as_text[mismatch],
+            reformatted[mismatch], f'Date format should be {date_format}',
+            'date_standardization'))
 
         return issues
 
@@ -234,41 +339,36 @@ class StandardizationValidator(RuleValidator):
         issues = []
         expected_format = self.params.get('format', '+1-XXX-XXX-XXXX')
 
-        for idx, value in self.df[column].items():
-            if pd.isnull(value):
-                continue
+        values = self._string_values(column)
+        stripped = values.str.strip()
+        # Basic phone validation - customize based on requirements
+        invalid = (~stripped.str.startswith('+') |
+                   (stripped.str.len() < 10)).to_numpy(dtype=bool)
+        if not invalid.any():
+            return issues
 
-            # Basic phone validation - customize based on requirements
-            phone_str = str(value).strip()
-            if not phone_str.startswith('+') or len(phone_str) < 10:
-                issues.append({
-                    'row_index': int(str(idx)) if not isinstance(idx, int) else idx,
-                    'column_name': column,
-                    'current_value': str(value),
-                    'suggested_value': f'+1-{phone_str}',
-                    'message': f'Phone format should be {expected_format}',
-                    'category': 'phone_standardization'
-                })
+        issues.extend(self._build_issues(
+            self._row_numbers(values.index[invalid]), column, values[invalid],
+            '+1-' + stripped[invalid], f'Phone format should be {expected_format}',
+            'phone_standardization'))
 
         return issues
 
     def _validate_emails(self, column: str) -> List[Dict[str, Any]]:
         issues = []
 
-        for idx, value in self.df[column].items():
-            if pd.isnull(value):
-                continue
+        values = self._string_values(column)
+        normalized = values.astype(object).str.strip().str.lower()
+        fullmatch = _EMAIL_PATTERN.fullmatch
+        invalid = np.fromiter(
+            (fullmatch(value) is None for value in normalized),
+            dtype=bool, count=len(normalized))
+        if not invalid.any():
+            return issues
 
-            email_str = str(value).strip().lower()
-            if '@' not in email_str or '.' not in email_str.split('@')[-1]:
-                issues.append({
-                    'row_index': int(str(idx)) if not isinstance(idx, int) else idx,
-                    'column_name': column,
-                    'current_value': str(value),
-                    'suggested_value': email_str,
-                    'message': 'Invalid email format',
-                    'category': 'email_standardization'
-                })
+        issues.extend(self._build_issues(
+            self._row_numbers(values.index[invalid]), column, values[invalid],
+            normalized[invalid], 'Invalid email format', 'email_standardization'))
 
         return issues
 
@@ -276,6 +376,16 @@ class StandardizationValidator(RuleValidator):
 class ValueListValidator(RuleValidator):
     """Validator for allowed values list"""
 
+    def __init__(self, rule: Rule, df: pd.DataFrame, db: Session,
+                 col_ctx: Optional[Dict[str, Dict[str, Any]]] = None):
+        super().__init__(rule, df, db, col_ctx)
+        # Case-folded once here so every chunk reuses the same lookup set
+        allowed_values = self.params.get('allowed_values', [])
+        if self.params.get('case_sensitive', True):
+            self.allowed_set = frozenset(allowed_values)
+        else:
+            self.allowed_set = frozenset(v.lower() for v in allowed_values)
+
     def validate(self) -> List[Dict[str, Any]]:
         """Main validation entry point"""
         # Use chunking for large DataFrames
@@ -294,45 +404,30 @@ class ValueListValidator(RuleValidator):
         case_sensitive = self.params.get('case_sensitive', True)
 
         if not target_columns:
-            print(
-                f"Warning: Rule {self.rule.name} has no target columns configured")
+            logger.warning(
+                "Rule %s has no target columns configured", self.rule.name)
             return issues
 
         if not allowed_values:
-            print(
-                f"Warning: Rule {self.rule.name} has no allowed values configured")
+            logger.warning(
+                "Rule %s has no allowed values configured", self.rule.name)
             return issues
 
+        suggested_value = allowed_values[0]
+        message = f'Value must be one of: {", ".join(allowed_values)}'
+
         # Validate columns exist in dataset
-        missing_columns = [
-            col for col in target_columns if col not in self.df.columns]
-        if missing_columns:
-            print(
-                f"Warning: Rule {self.rule.name} references non-existent columns: {missing_columns}")
-
-        for column in target_columns:
-            if column not in self.df.columns:
-                print(f"Skipping column '{column}' - not found in dataset")
+        for column in self._existing_columns(target_columns):
+            values = self._string_values(column)
+            check_values = (values if case_sensitive
+                            else values.astype(object).str.lower())
+            invalid = ~check_values.isin(self.allowed_set).to_numpy(dtype=bool)
+            if not invalid.any():
                 continue
 
-            for idx, value in self.df[column].items():
-                if pd.isnull(value):
-                    continue
-
-                check_value = str(
-                    value) if case_sensitive else str(value).lower()
-                check_allowed = allowed_values if case_sensitive else [
-                    v.lower() for v in allowed_values]
-
-                if check_value not in check_allowed:
-                    issues.append({
-                        'row_index': int(str(idx)) if not isinstance(idx, int) else idx,
-                        'column_name': column,
-                        'current_value': str(value),
-                        'suggested_value': allowed_values[0] if allowed_values else '',
-                        'message': f'Value must be one of: {", ".join(allowed_values)}',
-                        'category': 'value_list'
-                    })
+            issues.extend(self._build_issues(
+                self._row_numbers(values.index[invalid]), column, values[invalid],
+                suggested_value, message, 'value_list'))
 
         return issues
 
@@ -354,48 +449,34 @@ class LengthRangeValidator(RuleValidator):
         target_columns = self.params.get('columns', [])
         min_length = self.params.get('min_length', 0)
         max_length = self.params.get('max_length', float('inf'))
+        short_message = f'Value too short. Minimum length: {min_length}'
+        long_message = f'Value too long. Maximum length: {max_length}'
 
         if not target_columns:
-            print(
-                f"Warning: Rule {self.rule.name} has no target columns configured")
+            logger.warning(
+                "Rule %s has no target columns configured", self.rule.name)
             return issues
 
         # Validate columns exist in dataset
-        missing_columns = [
-            col for col in target_columns if col not in self.df.columns]
-        if missing_columns:
-            print(
-                f"Warning: Rule {self.rule.name} references non-existent columns: {missing_columns}")
-
-        for column in target_columns:
-            if column not in self.df.columns:
-                print(f"Skipping column '{column}' - not found in dataset")
+        for column in self._existing_columns(target_columns):
+            values = self._string_values(column)
+            lengths = values.str.len().to_numpy()
+            too_short = lengths < min_length
+            too_long = ~too_short & (lengths > max_length)
+            flagged = too_short | too_long
+            if not flagged.any():
                 continue
 
-            for idx, value in self.df[column].items():
-                if pd.isnull(value):
-                    continue
+            flagged_values = values[flagged]
+            is_short = too_short[flagged]
+            # Too-long values are suggested truncated to the maximum length
+            suggested = ['' if short else value[:max_length]
+                         for value, short in zip(flagged_values.tolist(), is_short)]
+            messages = np.where(is_short, short_message, long_message)
 
-                value_length = len(str(value))
-
-                if value_length < min_length:
-                    issues.append({
-                        'row_index': int(str(idx)) if not isinstance(idx, int) else idx,
-                        'column_name': column,
-                        'current_value': str(value),
-                        'suggested_value': '',
-                        'message': f'Value too short. Minimum length: {min_length}',
-                        'category': 'length_range'
-                    })
-                elif value_length > max_length:
-                    issues.append({
-                        'row_index': int(str(idx)) if not isinstance(idx, int) else idx,
-                        'column_name': column,
-                        'current_value': str(value),
-                        'suggested_value': str(value)[:max_length],
-                        'message': f'Value too long. Maximum length: {max_length}',
-                        'category': 'length_range'
-                    })
+            issues.extend(self._build_issues(
+                self._row_numbers(flagged_values.index), column, flagged_values,
+                suggested, messages, 'length_range'))
 
         return issues
 
@@ -408,38 +489,28 @@ class CharRestrictionValidator(RuleValidator):
         target_columns = self.params.get('columns', [])
         restriction_type = self.params.get('type', 'alphabetic')
 
-        for column in target_columns:
-            if column not in self.df.columns:
+        for column in self._existing_columns(target_columns):
+            values = self.df[column].dropna().astype(str)
+
+            if restriction_type == 'alphabetic':
+                valid = values.str.replace(' ', '', regex=False).str.isalpha()
+                message = 'Value must contain only alphabetic characters'
+            elif restriction_type == 'numeric':
+                valid = values.str.replace('.', '', regex=False).str.replace(
+                    '-', '', regex=False).str.isdigit()
+                message = 'Value must contain only numeric characters'
+            elif restriction_type == 'alphanumeric':
+                valid = values.str.replace(' ', '', regex=False).str.isalnum()
+                message = 'Value must contain only alphanumeric characters'
+            else:
                 continue
 
-            for idx, value in self.df[column].items():
-                if pd.isnull(value):
-                    continue
-
-                value_str = str(value)
-                valid = True
-                message = ''
-
-                if restriction_type == 'alphabetic':
-                    valid = value_str.replace(' ', '').isalpha()
-                    message = 'Value must contain only alphabetic characters'
-                elif restriction_type == 'numeric':
-                    valid = value_str.replace(
-                        '.', '').replace('-', '').isdigit()
-                    message = 'Value must contain only numeric characters'
-                elif restriction_type == 'alphanumeric':
-                    valid = value_str.replace(' ', '').isalnum()
-                    message = 'Value must contain only alphanumeric characters'
-
-                if not valid:
-                    issues.append({
-                        'row_index': int(str(idx)) if not isinstance(idx, int) else idx,
-                        'column_name': column,
-                        'current_value': str(value),
-                        'suggested_value': '',
-                        'message': message,
-                        'category': 'char_restriction'
-                    })
+            invalid = ~valid.to_numpy(dtype=bool)
+            if not invalid.any():
+                continue
+            issues.extend(self._build_issues(
+                self._row_numbers(values.index[invalid]), column, values[invalid],
+                '', message, 'char_restriction'))
 
         return issues
 
@@ -481,23 +552,16 @@ class CrossFieldValidator(RuleValidator):
         if not dependent_field or not required_field:
             return issues
 
-        if dependent_field not in self.df.columns or required_field not in self.df.columns:
+        df_columns = self._column_names()
+        if dependent_field not in df_columns or required_field not in df_columns:
             return issues
 
-        for idx, row in self.df.iterrows():
-            required_value = row[required_field]
-            dependent_value = row[dependent_field]
-
-            # If required field has value but dependent field doesn't
-            if pd.notna(required_value) and pd.isna(dependent_value):
-                issues.append({
-                    'row_index': int(str(idx)) if not isinstance(idx, int) else idx,
-                    'column_name': dependent_field,
-                    'current_value': None,
-                    'suggested_value': '',
-                    'message': f'{dependent_field} is required when {required_field} has a value',
-                    'category': 'cross_field_dependency'
-                })
+        # If required field has value but dependent field doesn't
+        mask = ~self._null_mask(required_field) & self._null_mask(dependent_field)
+        issues.extend(self._build_issues(
+            self._flagged_rows(mask), dependent_field, None, '',
+            f'{dependent_field} is required when {required_field} has a value',
+            'cross_field_dependency'))
 
         return issues
 
@@ -509,22 +573,23 @@ class CrossFieldValidator(RuleValidator):
         if len(fields) < 2:
             return issues
 
-        available_fields = [f for f in fields if f in self.df.columns]
+        df_columns = self._column_names()
+        available_fields = [f for f in fields if f in df_columns]
         if len(available_fields) < 2:
             return issues
 
-        for idx, row in self.df.iterrows():
-            filled_fields = [f for f in available_fields if pd.notna(row[f])]
+        filled = self.df[available_fields].notna().to_numpy()
+        mask = filled.sum(axis=1) > 1
+        filled_labels = [
+            ', '.join(f for f, is_filled in zip(available_fields, row_filled) if is_filled)
+            for row_filled in filled[mask]]
 
-            if len(filled_fields) > 1:
-                issues.append({
-                    'row_index': int(str(idx)) if not isinstance(idx, int) else idx,
-                    'column_name': ', '.join(filled_fields),
-                    'current_value': f"Multiple fields filled: {', '.join(filled_fields)}",
-                    'suggested_value': 'Only one field should have a value',
-                    'message': f'Fields {", ".join(available_fields)} are mutually exclusive',
-                    'category': 'cross_field_mutual_exclusion'
-                })
+        issues.extend(self._build_issues(
+            self._flagged_rows(mask), filled_labels,
+            [f"Multiple fields filled: {label}" for label in filled_labels],
+            'Only one field should have a value',
+            f'Fields {", ".join(available_fields)} are mutually exclusive',
+            'cross_field_mutual_exclusion'))
 
         return issues
 
@@ -539,35 +604,30 @@ class CrossFieldValidator(RuleValidator):
         if not all([condition_field, target_field]):
             return issues
 
-        if condition_field not in self.df.columns or target_field not in self.df.columns:
+        df_columns = self._column_names()
+        if condition_field not in df_columns or target_field not in df_columns:
             return issues
 
-        for idx, row in self.df.iterrows():
-            if str(row[condition_field]) == str(condition_value):
-                target_value = row[target_field]
-
-                if expected_value is not None:
-                    # Check for specific expected value
-                    if str(target_value) != str(expected_value):
-                        issues.append({
-                            'row_index': int(str(idx)) if not isinstance(idx, int) else idx,
-                            'column_name': target_field,
-                            'current_value': str(target_value),
-                            'suggested_value': str(expected_value),
-                            'message': f'When {condition_field} is {condition_value}, {target_field} must be {expected_value}',
-                            'category': 'cross_field_conditional'
-                        })
-                else:
-                    # Check for any value (not null)
-                    if pd.isna(target_value):
-                        issues.append({
-                            'row_index': int(str(idx)) if not isinstance(idx, int) else idx,
-                            'column_name': target_field,
-                            'current_value': None,
-                            'suggested_value': '',
-                            'message': f'When {condition_field} is {condition_value}, {target_field} must have a value',
-                            'category': 'cross_field_conditional'
-                        })
+        condition_mask = (self.df[condition_field].to_numpy().astype(str)
+                          == str(condition_value))
+        target = self.df[target_field]
+
+        if expected_value is not None:
+            # Check for specific expected value
+            target_str = target.to_numpy().astype(str)
+            mask = condition_mask & (target_str != str(expected_value))
+            issues.extend(self._build_issues(
+                self._flagged_rows(mask), target_field, target_str[mask],
+                str(expected_value),
+                f'When {condition_field} is {condition_value}, {target_field} must be {expected_value}',
+                'cross_field_conditional'))
+        else:
+            # Check for any value (not null)
+            mask = condition_mask & self._null_mask(target_field)
+            issues.extend(self._build_issues(
+                self._flagged_rows(mask), target_field, None, '',
+                f'When {condition_field} is {condition_value}, {target_field} must have a value',
+                'cross_field_conditional'))
 
         return issues
 
@@ -581,51 +641,57 @@ class CrossFieldValidator(RuleValidator):
         if not sum_fields:
             return issues
 
-        available_sum_fields = [f for f in sum_fields if f in self.df.columns]
+        df_columns = self._column_names()
+        available_sum_fields = [f for f in sum_fields if f in df_columns]
         if not available_sum_fields:
             return issues
 
-        for idx, row in self.df.iterrows():
-            # Calculate sum of numeric fields only
-            field_sum = 0
-            for field in available_sum_fields:
-                try:
-                    value = pd.to_numeric(row[field], errors='coerce')
-                    if pd.notna(value):
-                        field_sum += value
-                except:
-                    continue
-
-            # Check against total field or expected value
-            if total_field and total_field in self.df.columns:
-                try:
-                    expected = pd.to_numeric(row[total_field], errors='coerce')
-                    # Allow small floating point differences
-                    if pd.notna(expected) and abs(field_sum - expected) > 0.01:
-                        issues.append({
-                            'row_index': int(str(idx)) if not isinstance(idx, int) else idx,
-                            'column_name': total_field,
-                            'current_value': str(row[total_field]),
-                            'suggested_value': str(field_sum),
-                            'message': f'Sum of {", ".join(available_sum_fields)} ({field_sum}) does not match {total_field}',
-                            'category': 'cross_field_sum_check'
-                        })
-                except:
-                    continue
-            elif expected_total is not None:
-                try:
-                    expected = float(expected_total)
-                    if abs(field_sum - expected) > 0.01:
-                        issues.append({
-                            'row_index': int(str(idx)) if not isinstance(idx, int) else idx,
-                            'column_name': ', '.join(available_sum_fields),
-                            'current_value': str(field_sum),
-                            'suggested_value': str(expected_total),
-                            'message': f'Sum of {", ".join(available_sum_fields)} ({field_sum}) does not equal expected total ({expected_total})',
-                            'category': 'cross_field_sum_check'
-                        })
-                except:
-                    continue
+        # Sum numeric values only; non-numeric cells are coerced to NaN and skipped.
+        # The fields are extracted once into a float64 matrix and reduced row-wise.
+        numeric_fields = [pd.to_numeric(self.df[f], errors='coerce')
+                          for f in available_sum_fields]
+        matrix = np.column_stack([
+            col.to_numpy(dtype=np.float64, na_value=np.nan) for col in numeric_fields])
+        field_sums = np.nansum(matrix, axis=1)
+        # Sums of whole numbers are shown as ints; integer columns with missing
+        # values are float64 in pandas, so check the values instead of the dtype
+        whole = ((np.isnan(matrix) | (matrix == np.floor(matrix))).all(axis=1)
+                 & np.isfinite(field_sums))
+        fields_label = ", ".join(available_sum_fields)
+
+        def format_sums(mask):
+            return [str(int(field_sum)) if is_whole else str(field_sum)
+                    for field_sum, is_whole in zip(field_sums[mask].tolist(),
+                                                   whole[mask].tolist())]
+
+        # Check against total field or expected value
+        if total_field and total_field in df_columns:
+            expected = pd.to_numeric(self.df[total_field], errors='coerce').to_numpy(
+                dtype=np.float64, na_value=np.nan)
+            # Allow small floating point differences
+            mask = ~np.isnan(expected) & (np.abs(field_sums - expected) > 0.01)
+            sums = format_sums(mask)
+
+            issues.extend(self._build_issues(
+                self._flagged_rows(mask), total_field,
+                self.df[total_field].to_numpy()[mask].astype(str), sums,
+                [f'Sum of {fields_label} ({field_sum}) does not match {total_field}'
+                 for field_sum in sums],
+                'cross_field_sum_check'))
+        elif expected_total is not None:
+            try:
+                expected = float(expected_total)
+            except (TypeError, ValueError):
+                return issues
+
+            mask = np.abs(field_sums - expected) > 0.01
+            sums = format_sums(mask)
+
+            issues.extend(self._build_issues(
+                self._flagged_rows(mask), fields_label, sums, str(expected_total),
+                [f'Sum of {fields_label} ({field_sum}) does not equal expected total ({expected_total})'
+                 for field_sum in sums],
+                'cross_field_sum_check'))
 
         return issues
 
@@ -641,65 +707,65 @@ class RegexValidator(RuleValidator):
         if not patterns:
             return issues
 
-        for column in target_columns:
-            if column not in self.df.columns:
+        # Compile the patterns once for all columns; invalid ones are skipped
+        compiled_patterns = []
+        for pattern_def in patterns:
+            pattern = pattern_def.get('pattern')
+            if not pattern:
                 continue
+            try:
+                compiled_pattern = _compile_pattern(pattern)
+            except re.error:
+                # Invalid regex pattern
+                continue
+            compiled_patterns.append((
+                compiled_pattern,
+                pattern_def.get('name', 'pattern'),
+                pattern_def.get('must_match', True),
+                pattern))
 
-            for pattern_def in patterns:
-                pattern = pattern_def.get('pattern')
-                pattern_name = pattern_def.get('name', 'pattern')
-                must_match = pattern_def.get('must_match', True)
-
-                if not pattern:
-                    continue
+        if not compiled_patterns:
+            return issues
 
-                try:
-                    compiled_pattern = re.compile(pattern)
-                    issues.extend(self._validate_pattern(
-                        column, compiled_pattern, pattern_name, must_match, pattern
-                    ))
-                except re.error as e:
-                    # Invalid regex pattern
-                    continue
+        for column in self._existing_columns(target_columns):
+            values = self._string_values(column)
+            for compiled_pattern, pattern_name, must_match, pattern in compiled_patterns:
+                issues.extend(self._validate_pattern(
+                    column, values, compiled_pattern, pattern_name, must_match, pattern
+                ))
 
         return issues
 
     def _validate_pattern(
         self,
         column: str,
+        values: pd.Series,
         compiled_pattern: re.Pattern,
         pattern_name: str,
         must_match: bool,
         original_pattern: str
     ) -> List[Dict[str, Any]]:
-        """Validate a specific regex pattern against a column"""
+        """Validate a specific regex pattern against a column's non-null string values"""
         issues = []
 
-        for idx, value in self.df[column].items():
-            if pd.isna(value):
-                continue
+        search = compiled_pattern.search
+        matches = np.fromiter(
+            (search(value) is not None for value in values.astype(object)),
+            dtype=bool, count=len(values))
+
+        if must_match:
+            flagged = ~matches
+            message = f'Value does not match required pattern "{pattern_name}" ({original_pattern})'
+        else:
+            flagged = matches
+            message = f'Value matches forbidden pattern "{pattern_name}" ({original_pattern})'
+
+        if not flagged.any():
+            return issues
 
-            value_str = str(value)
-            matches = bool(compiled_pattern.search(value_str))
-
-            if must_match and not matches:
-                issues.append({
-                    'row_index': int(str(idx)) if not isinstance(idx, int) else idx,
-                    'column_name': column,
-                    'current_value': value_str,
-                    'suggested_value': '',
-                    'message': f'Value does not match required pattern "{pattern_name}" ({original_pattern})',
-                    'category': 'regex_validation'
-                })
-            elif not must_match and matches:
-                issues.append({
-                    'row_index': int(str(idx)) if not isinstance(idx, int) else idx,
-                    'column_name': column,
-                    'current_value': value_str,
-                    'suggested_value': '',
-                    'message': f'Value matches forbidden pattern "{pattern_name}" ({original_pattern})',
-                    'category': 'regex_validation'
-                })
+        issues.extend(self._build_issues(
+            self._row_numbers(values.index[flagged]), column, values[flagged],
+            '', message, 'regex_validation'))
 
         return issues
 
@@ -707,13 +773,22 @@ class RegexValidator(RuleValidator):
 class CustomValidator(RuleValidator):
     """Validator for custom user-defined validation logic with enhanced security"""
 
-    def __init__(self, rule: Rule, df: pd.DataFrame, db: Session):
-        super().__init__(rule, df, db)
-        # Initialize secure code validator
-        from app.security.sandbox import CustomCodeValidator
-        self.code_validator = CustomCodeValidator(
-            security_level=getattr(rule, 'security_level', 'medium')
-        )
+    # Secure code validators per security level, shared across custom rules so
+    # the executor and its compiled-code cache are built once. Custom rules
+    # always run on the calling thread (see RuleEngineService.MAIN_THREAD_KINDS).
+    _code_validators: Dict[str, Any] = {}
+
+    def __init__(self, rule: Rule, df: pd.DataFrame, db: Session,
+                 col_ctx: Optional[Dict[str, Dict[str, Any]]] = None):
+        super().__init__(rule, df, db, col_ctx)
+        security_level = getattr(rule, 'security_level', 'medium')
+        self.code_validator = self._code_validators.get(security_level)
+        if self.code_validator is None:
+            # Initialize secure code validator
+            from app.security.sandbox import CustomCodeValidator
+            self.code_validator = CustomCodeValidator(
+                security_level=security_level)
+            self._code_validators[security_level] = self.code_validator
 
     def validate(self) -> List[Dict[str, Any]]:
         issues = []
@@ -745,39 +820,56 @@ class CustomValidator(RuleValidator):
                 f"Security validation failed for expression: {expression[:100]}")
             return issues
 
-        for idx in self.df.index:
-            try:
-                row = self.df.iloc[idx]
+        # Fast path: evaluate column-wise expressions over the whole frame at once
+        passed = self._evaluate_vectorized(expression)
+        if passed is not None:
+            df_columns = self._column_names()
+            issue_column = next(
+                (col for col in target_columns if col in df_columns), None)
+            if issue_column is None:
+                return issues
+
+            failed = ~passed
+            values = self.df[issue_column][failed]
+            current_values = np.where(values.notna().to_numpy(),
+                                      values.to_numpy().astype(str), None)
+            issues.extend(self._build_issues(
+                self._flagged_rows(failed), issue_column, current_values,
+                '', error_message, 'custom_validation'))
+            return issues
 
-                # Create safe context for execution
-                context = {
-                    'row': row.to_dict(),
-                    'pd': self._get_safe_pandas(),
-                }
+        # Bind names as the vectorized path does: the row is available as
+        # `row` and every column by its bare name (nulls as None). One context
+        # dict is reused and only the column values are overwritten per row.
+        columns = list(self.df.columns)
+        context_columns = [col for col in columns if col not in ('row', 'pd')]
+        issue_position = next(
+            (columns.index(col) for col in target_columns if col in columns), None)
+        column_values = {}
 
-                # Add column values to context
-                for col in self.df.columns:
-                    if col not in context:
-                        context[col] = row[col] if pd.notna(row[col]) else None
+        for idx, *values in self.df.itertuples(index=True, name=None):
+            try:
+                row = dict(zip(columns, values))
+                for col in context_columns:
+                    value = row[col]
+                    column_values[col] = value if pd.notna(value) else None
 
                 # Execute expression securely
                 result = self.code_validator.execute_custom_validation(
-                    expression, context
+                    expression, row, column_values
                 )
 
-                # If result is False, it's an issue
-                if not result:
-                    for column in target_columns:
-                        if column in self.df.columns:
-                            issues.append({
-                                'row_index': int(idx),
-                                'column_name': column,
-                                'current_value': str(row[column]) if pd.notna(row[column]) else None,
-                                'suggested_value': '',
-                                'message': error_message,
-                                'category': 'custom_validation'
-                            })
-                            break  # Only add issue once per row
+                # If result is False, it's an issue (only once per row)
+                if not result and issue_position is not None:
+                    value = values[issue_position]
+                    issues.append({
+                        'row_index': int(idx),
+                        'column_name': columns[issue_position],
+                        'current_value': str(value) if pd.notna(value) else None,
+                        'suggested_value': '',
+                        'message': error_message,
+                        'category': 'custom_validation'
+                    })
 
             except Exception as e:
                 # Log error but continue with other rows
@@ -787,23 +879,35 @@ class CustomValidator(RuleValidator):
 
         return issues
 
-    def _get_safe_pandas(self):
-        """Get a safe pandas-like interface for basic operations."""
-        class SafePandas:
-            @staticmethod
-            def isna(value):
-                """Safe version of pandas.isna"""
-                return value is None or value == ''
+    def _evaluate_vectorized(self, expression: str) -> Optional[np.ndarray]:
+        """
+        Evaluate the expression over all rows with DataFrame.eval.
+        Returns a boolean array of passing rows, or None if the expression
+        cannot be evaluated column-wise and needs the per-row path.
+        """
+        try:
+            tree = ast.parse(expression)
+        except SyntaxError:
+            return None
+
+        df_columns = self._column_names()
+        for node in ast.walk(tree):
+            if not isinstance(node, _VECTORIZABLE_NODES):
+                return None
+            if isinstance(node, ast.Name) and node.id not in df_columns:
+                return None
+
+        try:
+            result = self.df.eval(expression)
+        except Exception:
+            return None
 
-            @staticmethod
-            def to_numeric(value, errors='coerce'):
-                """Safe numeric conversion"""
-                try:
-                    return float(value)
-                except (ValueError, TypeError):
-                    return None if errors == 'coerce' else value
+        if not isinstance(result, pd.Series) or len(result) != len(self.df):
+            return None
+        if not pd.api.types.is_bool_dtype(result.dtype):
+            return None
 
-        return SafePandas()
+        return result.fillna(False).to_numpy(dtype=bool)
 
     def _validate_lookup_table(self) -> List[Dict[str, Any]]:
         """Validate using lookup table mappings"""
@@ -815,25 +919,29 @@ class CustomValidator(RuleValidator):
         if not lookup_table or not lookup_column or not target_column:
             return issues
 
-        if lookup_column not in self.df.columns or target_column not in self.df.columns:
+        df_columns = self._column_names()
+        if lookup_column not in df_columns or target_column not in df_columns:
             return issues
 
-        for idx, row in self.df.iterrows():
-            lookup_value = str(row[lookup_column]) if pd.notna(
-                row[lookup_column]) else ''
-            target_value = str(row[target_column]) if pd.notna(
-                row[target_column]) else ''
-            expected_value = lookup_table.get(lookup_value, '')
-
-            if expected_value and target_value != expected_value:
-                issues.append({
-                    'row_index': int(str(idx)) if not isinstance(idx, int) else idx,
-                    'column_name': target_column,
-                    'current_value': target_value,
-                    'suggested_value': expected_value,
-                    'message': f'Based on {lookup_column} value "{lookup_value}", {target_column} should be "{expected_value}"',
-                    'category': 'custom_lookup'
-                })
+        # Null cells compare as empty strings
+        lookup_col = self.df[lookup_column]
+        target_col = self.df[target_column]
+        lookup_values = np.where(lookup_col.isna().to_numpy(), '',
+                                 lookup_col.to_numpy().astype(str))
+        target_values = np.where(target_col.isna().to_numpy(), '',
+                                 target_col.to_numpy().astype(str))
+
+        expected_values = pd.Series(lookup_values).map(
+            lookup_table).fillna('').to_numpy(dtype=object)
+        mask = expected_values.astype(bool) & (target_values != expected_values)
+
+        flagged_expected = expected_values[mask].tolist()
+        issues.extend(self._build_issues(
+            self._flagged_rows(mask), target_column, target_values[mask],
+            flagged_expected,
+            [f'Based on {lookup_column} value "{lookup_value}", {target_column} should be "{expected_value}"'
+             for lookup_value, expected_value in zip(lookup_values[mask].tolist(), flagged_expected)],
+            'custom_lookup'))
 
         return issues
 
@@ -852,9 +960,58 @@ class CustomValidator(RuleValidator):
         return issues
 
 
+class IssueSummary:
+    """Running summary statistics over the issues of an execution or rule"""
+
+    def __init__(self):
+        self.total_issues = 0
+        self.rows = set()
+        self.columns = set()
+        self.by_severity = Counter()
+        self.by_category = Counter()
+
+    def add(self, issue: Dict[str, Any]) -> None:
+        """Count one issue mapping (row_index, column_name, severity, category)"""
+        severity = issue['severity']
+        self.total_issues += 1
+        self.rows.add(issue['row_index'])
+        self.columns.add(issue['column_name'])
+        self.by_severity[getattr(severity, 'value', str(severity))] += 1
+        self.by_category[issue['category'] or 'unknown'] += 1
+
+    def add_all(self, issues: List[Dict[str, Any]]) -> None:
+        for issue in issues:
+            self.add(issue)
+
+    def update(self, other: 'IssueSummary') -> None:
+        """Merge the totals of another summary into this one"""
+        self.total_issues += other.total_issues
+        self.rows.update(other.rows)
+        self.columns.update(other.columns)
+        self.by_severity.update(other.by_severity)
+        self.by_category.update(other.by_category)
+
+    @property
+    def rows_affected(self) -> int:
+        return len(self.rows)
+
+    @property
+    def columns_affected(self) -> int:
+        return len(self.columns)
+
+
+# Number of issue rows buffered before they are written in one bulk insert
+ISSUE_INSERT_BATCH_SIZE = 5000
+
+
 class RuleEngineService:
     """Main service for rule engine operations"""
 
+    # Validators that must stay on the calling thread: ML anomaly detection
+    # uses the session (SQLAlchemy sessions are not thread-safe) and custom
+    # rules run in the sandbox, which installs a SIGALRM handler
+    MAIN_THREAD_KINDS = frozenset({RuleKind.ml_anomaly, RuleKind.custom})
+
     def __init__(self, db: Session):
         self.db = db
         self.validators = {
@@ -872,6 +1029,59 @@ class RuleEngineService:
             RuleKind.ml_anomaly: MLAnomalyValidator,
         }
 
+    def run_rules(
+        self,
+        rules: List[Rule],
+        df: pd.DataFrame,
+        max_workers: Optional[int] = None,
+        col_ctx: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> Iterator[Tuple[int, Rule, Optional[List[Dict[str, Any]]], Optional[Exception]]]:
+        """
+        Run the validators for independent rules concurrently on a shared DataFrame.
+        Yields (position, rule, issues, error) tuples as each rule finishes, where
+        position is the rule's index in rules; callers needing input order sort on it.
+        """
+        def run(rule: Rule):
+            try:
+                validator_class = self.validators.get(getattr(rule, 'kind', None))
+                if not validator_class:
+                    raise ValueError(
+                        f"No validator available for rule kind: {getattr(rule, 'kind', None)}")
+                if issubclass(validator_class, RuleValidator):
+                    validator = validator_class(rule, df, self.db, col_ctx)
+                else:
+                    validator = validator_class(rule, df, self.db)
+                return rule, validator.validate(), None
+            except Exception as e:
+                return rule, None, e
+
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count() or 1) as executor:
+            pending = {
+                executor.submit(run, rule): position
+                for position, rule in enumerate(rules)
+                if getattr(rule, 'kind', None) not in self.MAIN_THREAD_KINDS
+            }
+            for position, rule in enumerate(rules):
+                if getattr(rule, 'kind', None) in self.MAIN_THREAD_KINDS:
+                    yield (position, *run(rule))
+            for future in as_completed(pending):
+                position = pending.pop(future)
+                yield (position, *future.result())
+                # Release the finished future (and its issues) before waiting
+                # on the next one
+                del future
+
+    @staticmethod
+    def build_column_context(df: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+        """
+        Precompute per-column values shared by all validators of an execution.
+        String views are added lazily by the first validator that needs them.
+        """
+        return {
+            column: {'dtype': df[column].dtype, 'isna': df[column].isna().to_numpy()}
+            for column in df.columns
+        }
+
     def get_active_rules(self) -> List[Rule]:
         """Get all active rules"""
         return self.db.query(Rule).filter(Rule.is_active == True).all()
@@ -913,7 +1123,11 @@ class RuleEngineService:
                 detail=f"An active rule with name '{name}' already exists in this organization"
             )
 
+        # The id is generated up front so rule_family_id (self for version 1)
+        # is set in the same INSERT
+        rule_id = str(uuid.uuid4())
         rule = Rule(
+            id=rule_id,
             organization_id=organization_id,
             name=name,
             description=description,
@@ -924,17 +1138,13 @@ class RuleEngineService:
             created_by=current_user.id,
             is_active=True,
             version=1,
-            is_latest=True
+            is_latest=True,
+            rule_family_id=rule_id
         )
 
+        # Server defaults come back through INSERT ... RETURNING; no refresh needed
         self.db.add(rule)
         self.db.commit()
-        self.db.refresh(rule)
-
-        # Set rule_family_id to self for new rules (version 1)
-        rule.rule_family_id = rule.id
-        self.db.commit()
-        self.db.refresh(rule)
 
         return rule
 
@@ -981,130 +1191,169 @@ class RuleEngineService:
             MemoryMonitor.log_memory_usage("after loading dataset")
 
             execution.total_rows = len(df)
-            all_issues = []
+            # Plain set of column names for the per-rule membership checks
+            df_columns = frozenset(df.columns)
+            # Running summary state; issues themselves are written out in
+            # batches rather than kept for the whole execution
+            pending_issues = []
+            summary = IssueSummary()
             successful_rules = 0
             failed_rules = 0
 
             logger.info(
                 f"Executing {len(rules)} rules on dataset with {len(df)} rows, {len(df.columns)} columns")
 
-            # Execute each rule
-            for rule in rules:
-                # Create snapshot of the rule for this execution
-                rule_snapshot = create_rule_snapshot(rule)
+            # Execute rules in three phases: pre-flight checks, concurrent
+            # validation, then all DB writes on this thread. Autoflush is
+            # disabled so validators that query the session don't flush
+            # pending rows mid-run; everything is written by the single
+            # commit below.
+            execution_rules = []
+            runnable = []
+            with self.db.no_autoflush:
+                for rule in rules:
+                    # Create snapshot of the rule for this execution
+                    rule_snapshot = create_rule_snapshot(rule)
+
+                    execution_rule = ExecutionRule(
+                        execution_id=execution.id,
+                        rule_id=rule.id,
+                        rule_snapshot=rule_snapshot  # Store complete rule snapshot
+                    )
+                    execution_rules.append(execution_rule)
 
-                execution_rule = ExecutionRule(
-                    execution_id=execution.id,
-                    rule_id=rule.id,
-                    rule_snapshot=rule_snapshot  # Store complete rule snapshot
-                )
-                self.db.add(execution_rule)
+                    try:
+                        # Validate rule has required attributes
+                        rule_kind = getattr(rule, 'kind', None)
+                        if rule_kind is None:
+                            execution_rule.note = "Rule has no kind specified"
+                            failed_rules += 1
+                            continue
 
-                try:
-                    # Validate rule has required attributes
-                    rule_kind = getattr(rule, 'kind', None)
-                    if rule_kind is None:
-                        execution_rule.note = "Rule has no kind specified"
-                        failed_rules += 1
-                        continue
+                        # Get validator for this rule type
+                        validator_class = self.validators.get(rule_kind)
+                        if not validator_class:
+                            execution_rule.note = f"No validator available for rule kind: {rule_kind}"
+                            failed_rules += 1
+                            continue
 
-                    # Get validator for this rule type
-                    validator_class = self.validators.get(rule_kind)
-                    if not validator_class:
-                        execution_rule.note = f"No validator available for rule kind: {rule_kind}"
-                        failed_rules += 1
-                        continue
+                        # Parse rule parameters and validate. The decoded JSON is
+                        # memoized on the rule and reused by the validator.
+                        try:
+                            params = decode_rule_json(rule, 'params', {})
+
+                            # Check if rule has required columns configured
+                            # Check both params['columns'] and target_columns field
+                            target_columns = params.get('columns', [])
+                            if not target_columns:
+                                # Try getting from target_columns field
+                                target_columns = decode_rule_json(
+                                    rule, 'target_columns', [])
+
+                            if not target_columns and rule_kind not in [RuleKind.custom]:
+                                execution_rule.note = "Rule has no target columns configured"
+                                failed_rules += 1
+                                continue
 
-                    # Parse rule parameters and validate
-                    try:
-                        params_str = getattr(rule, 'params', None)
-                        params = json.loads(params_str) if params_str else {}
-
-                        # Check if rule has required columns configured
-                        # Check both params['columns'] and target_columns field
-                        target_columns = params.get('columns', [])
-                        if not target_columns:
-                            # Try getting from target_columns field
-                            target_columns_str = getattr(
-                                rule, 'target_columns', None)
-                            if target_columns_str:
-                                target_columns = json.loads(target_columns_str) if isinstance(
-                                    target_columns_str, str) else target_columns_str
-
-                        if not target_columns and rule_kind not in [RuleKind.custom]:
-                            execution_rule.note = "Rule has no target columns configured"
+                            # Check if columns exist in dataset
+                            missing_columns = [
+                                col for col in target_columns if col not in df_columns]
+                            if missing_columns:
+                                execution_rule.note = f"Warning: Columns not found in dataset: {', '.join(missing_columns)}"
+                                # Don't fail completely, just note it and continue
+
+                        except json.JSONDecodeError as e:
+                            execution_rule.note = f"Invalid rule parameters JSON: {str(e)}"
                             failed_rules += 1
                             continue
 
-                        # Check if columns exist in dataset
-                        missing_columns = [
-                            col for col in target_columns if col not in df.columns]
-                        if missing_columns:
-                            execution_rule.note = f"Warning: Columns not found in dataset: {', '.join(missing_columns)}"
-                            # Don't fail completely, just note it and continue
+                        runnable.append((rule, execution_rule))
 
-                    except json.JSONDecodeError as e:
-                        execution_rule.note = f"Invalid rule parameters JSON: {str(e)}"
+                    except Exception as rule_error:
+                        execution_rule.note = f"Error executing rule: {str(rule_error)}"
                         failed_rules += 1
-                        continue
+                        print(
+                            f"Rule execution error for rule {rule.id}: {str(rule_error)}")
+
+                # Run validation on a bounded pool; the DataFrame is shared
+                # read-only. Each rule's issues are written as soon as it
+                # finishes, while the remaining validators keep running.
+                results = self.run_rules(
+                    [rule for rule, _ in runnable], df,
+                    max_workers=min(len(runnable), os.cpu_count() or 1) or 1,
+                    col_ctx=self.build_column_context(df))
+
+                for position, rule, issues, error in results:
+                    execution_rule = runnable[position][1]
+                    try:
+                        if error is not None:
+                            raise error
 
-                    # Run validation
-                    validator = validator_class(rule, df, self.db)
-                    issues = validator.validate()
+                        # Validate issues structure
+                        if not isinstance(issues, list):
+                            execution_rule.note = f"Validator returned invalid issues format: {type(issues)}"
+                            failed_rules += 1
+                            continue
 
-                    # Validate issues structure
-                    if not isinstance(issues, list):
-                        execution_rule.note = f"Validator returned invalid issues format: {type(issues)}"
-                        failed_rules += 1
-                        continue
+                        # Create lightweight snapshot for issues (we already have it in ExecutionRule)
+                        lightweight_snapshot = create_lightweight_rule_snapshot(
+                            rule)
+
+                        # Queue plain issue mappings (no ORM objects are tracked)
+                        # and write them out every ISSUE_INSERT_BATCH_SIZE rows;
+                        # only this rule's running stats are kept alongside
+                        rule_summary = IssueSummary()
+
+                        for issue_data in issues:
+                            try:
+                                # Validate required fields
+                                if 'row_index' not in issue_data or 'column_name' not in issue_data:
+                                    continue
+
+                                issue = {
+                                    'execution_id': execution.id,
+                                    'rule_id': rule.id,
+                                    'rule_snapshot': lightweight_snapshot,  # Store lightweight rule snapshot
+                                    'row_index': issue_data['row_index'],
+                                    'column_name': issue_data['column_name'],
+                                    'current_value': issue_data.get('current_value'),
+                                    'suggested_value': issue_data.get('suggested_value'),
+                                    'message': issue_data.get(
+                                        'message', 'Data quality issue found'),
+                                    'category': issue_data.get('category', 'unknown'),
+                                    'severity': rule.criticality
+                                }
+                            except Exception as issue_error:
+                                print(
+                                    f"Error creating issue record: {str(issue_error)}")
+                                continue
 
-                    # Create issue records with validation
-                    rule_issues = []
-                    # Create lightweight snapshot for issues (we already have it in ExecutionRule)
-                    lightweight_snapshot = create_lightweight_rule_snapshot(
-                        rule)
+                            pending_issues.append(issue)
+                            rule_summary.add(issue)
+                            if len(pending_issues) >= ISSUE_INSERT_BATCH_SIZE:
+                                self.db.bulk_insert_mappings(Issue, pending_issues)
+                                pending_issues = []
 
-                    for issue_data in issues:
-                        try:
-                            # Validate required fields
-                            if 'row_index' not in issue_data or 'column_name' not in issue_data:
-                                continue
+                        # The validator output is no longer needed once queued
+                        issues = None
 
-                            issue = Issue(
-                                execution_id=execution.id,
-                                rule_id=rule.id,
-                                rule_snapshot=lightweight_snapshot,  # Store lightweight rule snapshot
-                                row_index=issue_data['row_index'],
-                                column_name=issue_data['column_name'],
-                                current_value=issue_data.get('current_value'),
-                                suggested_value=issue_data.get(
-                                    'suggested_value'),
-                                message=issue_data.get(
-                                    'message', 'Data quality issue found'),
-                                category=issue_data.get('category', 'unknown'),
-                                severity=rule.criticality
-                            )
-                            self.db.add(issue)
-                            rule_issues.append(issue)
-                            all_issues.append(issue)
-                        except Exception as issue_error:
-                            print(
-                                f"Error creating issue record: {str(issue_error)}")
-                            continue
+                        # Update execution rule stats and the running totals
+                        execution_rule.error_count = rule_summary.total_issues
+                        execution_rule.rows_flagged = rule_summary.rows_affected
+                        execution_rule.cols_flagged = rule_summary.columns_affected
+                        summary.update(rule_summary)
+                        successful_rules += 1
+
+                    except Exception as rule_error:
+                        execution_rule.note = f"Error executing rule: {str(rule_error)}"
+                        failed_rules += 1
+                        print(
+                            f"Rule execution error for rule {rule.id}: {str(rule_error)}")
 
-                    # Update execution rule stats
-                    execution_rule.error_count = len(rule_issues)
-                    execution_rule.rows_flagged = len(
-                        set(i.row_index for i in rule_issues)) if rule_issues else 0
-                    execution_rule.cols_flagged = len(
-                        set(i.column_name for i in rule_issues)) if rule_issues else 0
-                    successful_rules += 1
+                if pending_issues:
+                    self.db.bulk_insert_mappings(Issue, pending_issues)
 
-                except Exception as rule_error:
-                    execution_rule.note = f"Error executing rule: {str(rule_error)}"
-                    failed_rules += 1
-                    print(
-                        f"Rule execution error for rule {rule.id}: {str(rule_error)}")
+            self.db.add_all(execution_rules)
 
             # Determine final execution status
             if failed_rules == 0:
@@ -1116,35 +1365,30 @@ class RuleEngineService:
 
             execution.finished_at = datetime.now(timezone.utc)
 
-            # Calculate summary statistics safely
-            if all_issues:
-                execution.rows_affected = len(
-                    set(issue.row_index for issue in all_issues))
-                execution.columns_affected = len(
-                    set(issue.column_name for issue in all_issues))
-            else:
-                execution.rows_affected = 0
-                execution.columns_affected = 0
+            execution.rows_affected = summary.rows_affected
+            execution.columns_affected = summary.columns_affected
 
             execution.summary = json.dumps({
-                'total_issues': len(all_issues),
+                'total_issues': summary.total_issues,
                 'successful_rules': successful_rules,
                 'failed_rules': failed_rules,
-                'issues_by_severity': self._count_issues_by_severity(all_issues),
-                'issues_by_category': self._count_issues_by_category(all_issues)
+                'issues_by_severity': dict(summary.by_severity),
+                'issues_by_category': dict(summary.by_category)
             })
 
             self.db.commit()
 
         except HTTPException as http_err:
             # Re-raise HTTPException without wrapping (maintains original status code)
+            self.db.rollback()
             execution.status = ExecutionStatus.failed
             execution.finished_at = datetime.now(timezone.utc)
             execution.summary = json.dumps({'error': str(http_err.detail)})
             self.db.commit()
             raise
         except Exception as e:
-            # Handle unexpected errors
+            # Handle unexpected errors; discard partially written results
+            self.db.rollback()
             execution.status = ExecutionStatus.failed
             execution.finished_at = datetime.now(timezone.utc)
             execution.summary = json.dumps({'error': str(e)})
@@ -1164,9 +1408,10 @@ class RuleEngineService:
         try:
             from app.services.data_import import DataImportService
 
-            # Use the data import service to load the dataset file
+            # Use the data import service to load the dataset file; repeated
+            # executions against an unchanged version reuse the parsed frame
             data_service = DataImportService(self.db)
-            df = data_service.load_dataset_file(
+            df = data_service.load_dataset_file_cached(
                 dataset_version.dataset_id,
                 dataset_version.version_no
             )
@@ -1195,20 +1440,3 @@ class RuleEngineService:
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Failed to load dataset: {str(e)}"
             )
-
-    def _count_issues_by_severity(self, issues: List[Issue]) -> Dict[str, int]:
-        """Count issues by severity level"""
-        counts = {}
-        for issue in issues:
-            severity = issue.severity.value if hasattr(
-                issue.severity, 'value') else str(issue.severity)
-            counts[severity] = counts.get(severity, 0) + 1
-        return counts
-
-    def _count_issues_by_category(self, issues: List[Issue]) -> Dict[str, int]:
-        """Count issues by category"""
-        counts = {}
-        for issue in issues:
-            category = issue.category or 'unknown'
-            counts[category] = counts.get(category, 0) + 1
-        return counts
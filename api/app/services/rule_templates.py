@@ -4,8 +4,10 @@ Provides pre-built validation patterns that can be customized for specific datas
 """
 
 import json
+import re
 import uuid
 from typing import List, Dict, Any, Optional
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from datetime import datetime, timezone
 
@@ -14,12 +16,21 @@ from app.models import (
     Dataset, User, DatasetColumn
 )
 
+# Column-name keywords that hint at a value format, matched against the
+# lowercased column name ('email_address' and 'telephone' are implied)
+_EMAIL_COLUMN_RE = re.compile(r'email|mail')
+_PHONE_COLUMN_RE = re.compile(r'phone|tel')
+_DATE_COLUMN_RE = re.compile(r'date|time|created|updated')
+
 
 class RuleTemplateService:
     """Service for managing rule templates and suggestions"""
 
     def __init__(self, db: Session):
         self.db = db
+        # Active templates indexed by category/kind while generating suggestions
+        self._templates_by_category: Optional[Dict[str, RuleTemplate]] = None
+        self._templates_by_kind: Optional[Dict[RuleKind, RuleTemplate]] = None
 
     def create_template(
         self,
@@ -43,7 +54,6 @@ class RuleTemplateService:
 
         self.db.add(template)
         self.db.commit()
-        self.db.refresh(template)
         return template
 
     def get_templates(
@@ -72,11 +82,14 @@ class RuleTemplateService:
 
     def update_template_usage(self, template_id: str) -> None:
         """Increment the usage count for a template"""
-        template = self.get_template(template_id)
-        if template:
-            template.usage_count = (template.usage_count or 0) + 1
-            template.updated_at = datetime.now(timezone.utc)
-            self.db.commit()
+        # Increment server-side so concurrent applies don't lose updates
+        self.db.query(RuleTemplate).filter(
+            RuleTemplate.id == template_id
+        ).update({
+            RuleTemplate.usage_count: func.coalesce(RuleTemplate.usage_count, 0) + 1,
+            RuleTemplate.updated_at: datetime.now(timezone.utc)
+        }, synchronize_session=False)
+        self.db.commit()
 
     def apply_template(
         self,
@@ -117,7 +130,6 @@ class RuleTemplateService:
 
         self.db.add(rule)
         self.db.commit()
-        self.db.refresh(rule)
 
         # Update template usage
         self.update_template_usage(template_id)
@@ -142,21 +154,42 @@ class RuleTemplateService:
 
         suggestions = []
 
-        # Generate suggestions based on column types and patterns
-        for column in columns:
-            column_suggestions = self._generate_column_suggestions(
-                dataset, column)
-            suggestions.extend(column_suggestions)
+        # Generate suggestions based on column types and patterns; templates
+        # are fetched once instead of queried per column
+        self._load_template_index()
+        try:
+            for column in columns:
+                column_suggestions = self._generate_column_suggestions(
+                    dataset, column)
+                suggestions.extend(column_suggestions)
+        finally:
+            self._templates_by_category = None
+            self._templates_by_kind = None
+
+        # Sort by confidence and limit, then persist only the kept ones
+        suggestions.sort(
+            key=lambda x: x['confidence_score'] or 0, reverse=True)
+        suggestions = suggestions[:max_suggestions]
+        if not suggestions:
+            return []
+
+        self.db.bulk_insert_mappings(RuleSuggestion, suggestions)
+        self.db.commit()
 
-        # Sort by confidence and limit
-        suggestions.sort(key=lambda x: x.confidence_score or 0, reverse=True)
-        return suggestions[:max_suggestions]
+        # Reload to pick up server-side defaults, keeping the ranked order
+        suggestion_ids = [suggestion['id'] for suggestion in suggestions]
+        saved = {
+            suggestion.id: suggestion
+            for suggestion in self.db.query(RuleSuggestion).filter(
+                RuleSuggestion.id.in_(suggestion_ids))
+        }
+        return [saved[suggestion_id] for suggestion_id in suggestion_ids]
 
     def _generate_column_suggestions(
         self,
         dataset: Dataset,
         column: DatasetColumn
-    ) -> List[RuleSuggestion]:
+    ) -> List[Dict[str, Any]]:
         """Generate suggestions for a specific column"""
         suggestions = []
         column_name = column.name
@@ -216,12 +249,12 @@ class RuleTemplateService:
         self,
         dataset: Dataset,
         column: DatasetColumn
-    ) -> Optional[RuleSuggestion]:
+    ) -> Optional[Dict[str, Any]]:
         """Suggest format validation based on column name patterns"""
         column_name = column.name.lower()
 
         # Email validation
-        if any(keyword in column_name for keyword in ['email', 'mail', 'email_address']):
+        if _EMAIL_COLUMN_RE.search(column_name):
             template = self._find_template_by_category('regex')
             if template:
                 return self._create_suggestion(
@@ -238,7 +271,7 @@ class RuleTemplateService:
                 )
 
         # Phone validation
-        if any(keyword in column_name for keyword in ['phone', 'tel', 'telephone']):
+        if _PHONE_COLUMN_RE.search(column_name):
             template = self._find_template_by_category('regex')
             if template:
                 return self._create_suggestion(
@@ -255,7 +288,7 @@ class RuleTemplateService:
                 )
 
         # Date validation
-        if any(keyword in column_name for keyword in ['date', 'time', 'created', 'updated']):
+        if _DATE_COLUMN_RE.search(column_name):
             template = self._find_template_by_category('standardization')
             if template:
                 return self._create_suggestion(
@@ -273,8 +306,20 @@ class RuleTemplateService:
 
         return None
 
+    def _load_template_index(self) -> None:
+        """Fetch active templates once and index them by category and kind"""
+        self._templates_by_category = {}
+        self._templates_by_kind = {}
+        for template in self.db.query(RuleTemplate).filter(RuleTemplate.is_active == True):
+            # Keep the first match, as the per-lookup .first() queries did
+            self._templates_by_category.setdefault(template.category, template)
+            self._templates_by_kind.setdefault(template.template_kind, template)
+
     def _find_template_by_category(self, category: str) -> Optional[RuleTemplate]:
         """Find a template by category"""
+        if self._templates_by_category is not None:
+            return self._templates_by_category.get(category)
+
         return self.db.query(RuleTemplate).filter(
             RuleTemplate.category == category,
             RuleTemplate.is_active == True
@@ -282,6 +327,9 @@ class RuleTemplateService:
 
     def _find_template_by_kind(self, kind: RuleKind) -> Optional[RuleTemplate]:
         """Find a template by rule kind"""
+        if self._templates_by_kind is not None:
+            return self._templates_by_kind.get(kind)
+
         return self.db.query(RuleTemplate).filter(
             RuleTemplate.template_kind == kind,
             RuleTemplate.is_active == True
@@ -296,23 +344,18 @@ class RuleTemplateService:
         suggestion_type: str,
         reasoning: str,
         customizations: Optional[Dict[str, Any]] = None
-    ) -> RuleSuggestion:
-        """Create a rule suggestion"""
-        suggestion = RuleSuggestion(
-            id=str(uuid.uuid4()),
-            dataset_id=dataset_id,
-            template_id=template_id,
-            suggested_rule_name=rule_name,
-            suggested_params=json.dumps(customizations or {}),
-            confidence_score=confidence_score,
-            suggestion_type=suggestion_type,
-            reasoning=reasoning
-        )
-
-        self.db.add(suggestion)
-        self.db.commit()
-        self.db.refresh(suggestion)
-        return suggestion
+    ) -> Dict[str, Any]:
+        """Build an unsaved rule suggestion as a RuleSuggestion column mapping"""
+        return {
+            'id': str(uuid.uuid4()),
+            'dataset_id': dataset_id,
+            'template_id': template_id,
+            'suggested_rule_name': rule_name,
+            'suggested_params': json.dumps(customizations or {}),
+            'confidence_score': confidence_score,
+            'suggestion_type': suggestion_type,
+            'reasoning': reasoning
+        }
 
     def get_suggestions_for_dataset(
         self,
@@ -442,17 +485,26 @@ class RuleTemplateService:
             }
         ]
 
-        for template_data in default_templates:
-            existing = self.db.query(RuleTemplate).filter(
-                RuleTemplate.name == template_data['name']
-            ).first()
-
-            if not existing:
-                self.create_template(
-                    name=template_data['name'],
-                    description=template_data['description'],
-                    category=template_data['category'],
-                    template_kind=template_data['kind'],
-                    template_params=template_data['params'],
-                    created_by=user_id
-                )
+        # One lookup for all names, then insert the missing ones in one batch.
+        # RuleTemplate.name has no unique constraint, so ON CONFLICT can't be used.
+        existing_names = {
+            name for (name,) in self.db.query(RuleTemplate.name).filter(
+                RuleTemplate.name.in_([t['name'] for t in default_templates]))
+        }
+        missing = [
+            {
+                'id': str(uuid.uuid4()),
+                'name': template_data['name'],
+                'description': template_data['description'],
+                'category': template_data['category'],
+                'template_kind': template_data['kind'],
+                'template_params': json.dumps(template_data['params']),
+                'created_by': user_id
+            }
+            for template_data in default_templates
+            if template_data['name'] not in existing_names
+        ]
+
+        if missing:
+            self.db.bulk_insert_mappings(RuleTemplate, missing)
+            self.db.commit()
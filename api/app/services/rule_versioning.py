@@ -4,18 +4,72 @@ Rule versioning helper functions and endpoints
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 from datetime import datetime, timezone
+import time
+from operator import attrgetter
+from threading import Lock
 from typing import Dict, Any
-import json
 
 from app.models import Rule, Execution, User
 from app.schemas import RuleUpdate, RuleResponse
+from app.utils import dumps_json, loads_json
+
+# Rule attributes stored as JSON text
+_JSON_FIELDS = frozenset({'target_columns', 'params'})
+
+# Rules known to have executions: rule_id -> monotonic expiry time. The TTL
+# bounds how long a rule whose executions were deleted still counts as used.
+_RULE_USAGE_TTL_SECONDS = 30.0
+_RULE_USAGE_CACHE_SIZE = 4096
+_rule_usage_cache: Dict[str, float] = {}
+_rule_usage_lock = Lock()
+
+
+def _audit_value(value: Any) -> Any:
+    """Value as recorded in a change log: containers as-is, scalars as strings"""
+    return value if isinstance(value, (dict, list)) else str(value)
+
+
+def _diff_rule_fields(rule: Rule, update_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Map each updated field whose value changes to its old and new audit values"""
+    if len(update_data) == 1:
+        # Most updates toggle a single plain attribute (is_active,
+        # criticality); those need no JSON decoding or batched lookup
+        (field, new_value), = update_data.items()
+        if field not in _JSON_FIELDS:
+            old_value = getattr(rule, field)
+            if old_value == new_value:
+                return {}
+            return {field: {'old': _audit_value(old_value), 'new': _audit_value(new_value)}}
+
+    changes = {}
+    fields = tuple(update_data)
+    if not fields:
+        return changes
+
+    # Read all old values in one pass
+    old_values = attrgetter(*fields)(rule)
+    if len(fields) == 1:
+        old_values = (old_values,)
+
+    for field, new_value, old_value in zip(fields, update_data.values(), old_values):
+        # Handle JSON fields
+        if field in _JSON_FIELDS:
+            old_value = loads_json(old_value) if old_value else None
+
+        if old_value != new_value:
+            changes[field] = {
+                'old': _audit_value(old_value),
+                'new': _audit_value(new_value)
+            }
+    return changes
 
 
 async def create_rule_version(
     original_rule: Rule,
     rule_data: RuleUpdate,
     current_user: User,
-    db: Session
+    db: Session,
+    commit: bool = True
 ) -> Rule:
     """
     Create a new version of an existing rule
@@ -25,6 +79,8 @@ async def create_rule_version(
         rule_data: Updated rule data
         current_user: User making the change
         db: Database session
+        commit: Commit here; pass False to only flush and leave the commit
+            to the caller's transaction (e.g. the request session)
         
     Returns:
         The newly created rule version
@@ -37,19 +93,7 @@ async def create_rule_version(
     update_data = rule_data.model_dump(exclude_unset=True)
     
     # Track changes for audit trail
-    changes = {}
-    for field, new_value in update_data.items():
-        old_value = getattr(original_rule, field)
-        
-        # Handle JSON fields
-        if field in ['target_columns', 'params']:
-            old_value = json.loads(old_value) if old_value else None
-            
-        if old_value != new_value:
-            changes[field] = {
-                'old': str(old_value) if not isinstance(old_value, (dict, list)) else old_value,
-                'new': str(new_value) if not isinstance(new_value, (dict, list)) else new_value
-            }
+    changes = _diff_rule_fields(original_rule, update_data)
     
     # Find the root rule ID (for tracking all versions of a rule)
     root_rule_id = original_rule.parent_rule_id if original_rule.parent_rule_id else original_rule.id
@@ -65,12 +109,12 @@ async def create_rule_version(
         criticality=update_data.get('criticality', original_rule.criticality),
         target_table=update_data.get('target_table', original_rule.target_table),
         target_columns=(
-            json.dumps(update_data['target_columns'])
+            dumps_json(update_data['target_columns'])
             if 'target_columns' in update_data
             else original_rule.target_columns
         ),
         params=(
-            json.dumps(update_data['params'])
+            dumps_json(update_data['params'])
             if 'params' in update_data
             else original_rule.params
         ),
@@ -80,7 +124,7 @@ async def create_rule_version(
         parent_rule_id=root_rule_id,  # Always point to root
         rule_family_id=family_id,  # Denormalized family ID for faster queries
         is_latest=True,
-        change_log=json.dumps({
+        change_log=dumps_json({
             'changed_by': str(current_user.id),
             'changed_by_name': current_user.name,
             'changed_at': datetime.now(timezone.utc).isoformat(),
@@ -90,9 +134,13 @@ async def create_rule_version(
         })
     )
     
+    # Server defaults (timestamps) come back with the INSERT, so the new
+    # version needs no refresh
     db.add(new_version)
-    db.commit()
-    db.refresh(new_version)
+    if commit:
+        db.commit()
+    else:
+        db.flush()
     
     return new_version
 
@@ -100,7 +148,8 @@ async def create_rule_version(
 async def update_rule_directly(
     rule: Rule,
     rule_data: RuleUpdate,
-    db: Session
+    db: Session,
+    commit: bool = True
 ) -> Rule:
     """
     Update rule directly when it hasn't been used in executions
@@ -109,6 +158,8 @@ async def update_rule_directly(
         rule: Rule to update
         rule_data: Updated rule data
         db: Database session
+        commit: Commit here; pass False to only flush and leave the commit
+            to the caller's transaction
         
     Returns:
         The updated rule
@@ -118,14 +169,16 @@ async def update_rule_directly(
     
     for field, value in update_data.items():
         if field == 'target_columns':
-            setattr(rule, field, json.dumps(value))
+            setattr(rule, field, dumps_json(value))
         elif field == 'params':
-            setattr(rule, field, json.dumps(value))
+            setattr(rule, field, dumps_json(value))
         else:
             setattr(rule, field, value)
     
-    db.commit()
-    db.refresh(rule)
+    if commit:
+        db.commit()
+    else:
+        db.flush()
     
     return rule
 
@@ -136,11 +189,33 @@ def get_rule_root_id(rule: Rule) -> str:
 
 
 def has_rule_been_used(rule_id: str, db: Session) -> bool:
-    """Check if a rule has been used in any executions"""
+    """
+    Check if a rule has been used in any executions.
+    Positive answers are cached for a short time: new executions can only
+    turn an unused rule into a used one, so only "unused" must be re-checked.
+    """
     from app.models import ExecutionRule
 
-    count = db.query(ExecutionRule).filter_by(rule_id=rule_id).count()
-    return count > 0
+    now = time.monotonic()
+    with _rule_usage_lock:
+        expires = _rule_usage_cache.get(rule_id)
+        if expires is not None:
+            if expires > now:
+                return True
+            del _rule_usage_cache[rule_id]
+
+    # EXISTS lets the database stop at the first matching row
+    used = bool(db.query(
+        db.query(ExecutionRule).filter_by(rule_id=rule_id).exists()
+    ).scalar())
+
+    if used:
+        with _rule_usage_lock:
+            if len(_rule_usage_cache) >= _RULE_USAGE_CACHE_SIZE:
+                # Drop the oldest entry (dicts keep insertion order)
+                _rule_usage_cache.pop(next(iter(_rule_usage_cache)))
+            _rule_usage_cache[rule_id] = now + _RULE_USAGE_TTL_SECONDS
+    return used
 
 
 def create_rule_snapshot(rule: Rule) -> str:
@@ -167,7 +242,7 @@ def create_rule_snapshot(rule: Rule) -> str:
         'created_by': rule.created_by,
         'created_at': rule.created_at.isoformat() if rule.created_at else None
     }
-    return json.dumps(snapshot)
+    return dumps_json(snapshot)
 
 
 def create_lightweight_rule_snapshot(rule: Rule) -> str:
@@ -187,7 +262,7 @@ def create_lightweight_rule_snapshot(rule: Rule) -> str:
         'version': rule.version,
         'criticality': rule.criticality.value if hasattr(rule.criticality, 'value') else str(rule.criticality)
     }
-    return json.dumps(snapshot)
+    return dumps_json(snapshot)
 
 
 def get_latest_version_by_family(rule_family_id: str, db: Session) -> Rule:
@@ -5,6 +5,6 @@ Provides a unified interface for object storage that works seamlessly
 with both MinIO (local development) and Google Cloud Storage (production).
 """
 
-from .factory import get_storage, storage
+from .factory import get_storage, init_storage, storage
 
-__all__ = ["get_storage", "storage"]
+__all__ = ["get_storage", "init_storage", "storage"]
@@ -4,10 +4,27 @@ Abstract base class for storage backends.
 Defines the interface that all storage implementations must follow.
 """
 
+import asyncio
+import queue
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Optional, BinaryIO
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, BinaryIO
 from datetime import datetime, timedelta
 
+# Shared pool for running blocking storage calls off the event loop
+_STORAGE_POOL = ThreadPoolExecutor(max_workers=32, thread_name_prefix="storage")
+
+# Upper bound on concurrent requests issued by the bulk helpers
+BULK_MAX_WORKERS = 16
+
+# Default chunk size for streamed downloads
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Chunks a prefetching download may read ahead of its consumer
+PREFETCH_QUEUE_SIZE = 4
+
 
 class StorageBackend(ABC):
     """Abstract base class for object storage backends."""
@@ -39,6 +56,37 @@ class StorageBackend(ABC):
         """
         pass
 
+    def upload_stream(
+        self,
+        bucket: str,
+        key: str,
+        fileobj: BinaryIO,
+        size: int,
+        content_type: str = "application/octet-stream",
+        metadata: Optional[dict] = None,
+    ) -> str:
+        """
+        Upload a file from a binary file-like object.
+
+        Backends that can stream override this; the default reads the
+        object into memory and calls upload_file.
+
+        Args:
+            bucket: Bucket/container name
+            key: Object key/path
+            fileobj: Readable binary file object, positioned at the start
+            size: Number of bytes to upload
+            content_type: MIME type of the file
+            metadata: Optional metadata dictionary
+
+        Returns:
+            URL or identifier of uploaded object
+
+        Raises:
+            StorageError: If upload fails
+        """
+        return self.upload_file(bucket, key, fileobj.read(size), content_type, metadata)
+
     @abstractmethod
     def download_file(self, bucket: str, key: str) -> bytes:
         """
@@ -57,6 +105,81 @@ class StorageBackend(ABC):
         """
         pass
 
+    def download_stream(
+        self, bucket: str, key: str, chunk_size: int = DOWNLOAD_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """
+        Download a file as an iterator of byte chunks.
+
+        Backends that can stream override this; the default downloads the
+        whole object and yields it in slices.
+
+        Args:
+            bucket: Bucket/container name
+            key: Object key/path
+            chunk_size: Maximum size of each yielded chunk
+
+        Yields:
+            Consecutive chunks of the file data
+
+        Raises:
+            FileNotFoundError: If object doesn't exist
+            StorageError: If download fails
+        """
+        data = self.download_file(bucket, key)
+        for start in range(0, len(data), chunk_size):
+            yield data[start : start + chunk_size]
+
+    def download_stream_prefetched(
+        self,
+        bucket: str,
+        key: str,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        queue_size: int = PREFETCH_QUEUE_SIZE,
+    ) -> Iterator[bytes]:
+        """
+        Like download_stream, but a background thread reads up to queue_size
+        chunks ahead so network transfer overlaps with processing of the
+        chunks already handed out. Stopping iteration early stops the reader.
+        """
+        chunks: queue.Queue = queue.Queue(maxsize=queue_size)
+        stop = threading.Event()
+        done = object()
+
+        def put(item: Any) -> bool:
+            # Poll so an abandoned consumer can't leave the reader blocked
+            while not stop.is_set():
+                try:
+                    chunks.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        def read_ahead() -> None:
+            try:
+                for chunk in self.download_stream(bucket, key, chunk_size):
+                    if not put(chunk):
+                        return
+                put(done)
+            except BaseException as e:
+                put(e)
+
+        reader = threading.Thread(
+            target=read_ahead, name="storage-prefetch", daemon=True
+        )
+        reader.start()
+        try:
+            while True:
+                item = chunks.get()
+                if item is done:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+
     @abstractmethod
     def delete_file(self, bucket: str, key: str) -> bool:
         """
@@ -150,6 +273,28 @@ class StorageBackend(ABC):
         """
         pass
 
+    def stat(self, bucket: str, key: str) -> Optional[dict]:
+        """
+        Get metadata about a file, or None if it doesn't exist.
+
+        Lets callers that need both an existence check and the metadata make
+        a single request instead of file_exists followed by get_file_metadata.
+
+        Args:
+            bucket: Bucket/container name
+            key: Object key/path
+
+        Returns:
+            Metadata dictionary as from get_file_metadata, or None
+
+        Raises:
+            StorageError: If operation fails
+        """
+        try:
+            return self.get_file_metadata(bucket, key)
+        except FileNotFoundError:
+            return None
+
     @abstractmethod
     def copy_file(
         self, source_bucket: str, source_key: str, dest_bucket: str, dest_key: str
@@ -172,6 +317,132 @@ class StorageBackend(ABC):
         """
         pass
 
+    def _fan_out(
+        self, func: Callable[[str, str], Any], bucket: str, keys: Iterable[str]
+    ) -> Dict[str, Any]:
+        """Apply a per-key operation concurrently and collect results by key."""
+        keys = list(dict.fromkeys(keys))
+        if len(keys) <= 1:
+            return {key: func(bucket, key) for key in keys}
+
+        workers = min(BULK_MAX_WORKERS, len(keys))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(partial(func, bucket), keys)
+            return dict(zip(keys, results))
+
+    def download_many(self, bucket: str, keys: Iterable[str]) -> Dict[str, bytes]:
+        """
+        Download several files concurrently.
+
+        Args:
+            bucket: Bucket/container name
+            keys: Object keys/paths
+
+        Returns:
+            Mapping of key to file content
+
+        Raises:
+            FileNotFoundError: If any object doesn't exist
+            StorageError: If any download fails
+        """
+        return self._fan_out(self.download_file, bucket, keys)
+
+    def delete_many(self, bucket: str, keys: Iterable[str]) -> Dict[str, bool]:
+        """
+        Delete several files concurrently.
+
+        Args:
+            bucket: Bucket/container name
+            keys: Object keys/paths
+
+        Returns:
+            Mapping of key to whether it was deleted. Backends that use a
+            batch delete API may report keys that were already missing as
+            deleted.
+
+        Raises:
+            StorageError: If any delete fails
+        """
+        return self._fan_out(self.delete_file, bucket, keys)
+
+    # Async variants for use from async request handlers. They run the
+    # blocking methods above in a shared thread pool so the event loop keeps
+    # serving other requests during storage round trips.
+
+    async def _run_blocking(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking backend call in the storage thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_STORAGE_POOL, partial(func, *args))
+
+    async def upload_file_async(
+        self,
+        bucket: str,
+        key: str,
+        data: bytes,
+        content_type: str = "application/octet-stream",
+        metadata: Optional[dict] = None,
+    ) -> str:
+        """Async variant of upload_file."""
+        return await self._run_blocking(
+            self.upload_file, bucket, key, data, content_type, metadata
+        )
+
+    async def upload_stream_async(
+        self,
+        bucket: str,
+        key: str,
+        fileobj: BinaryIO,
+        size: int,
+        content_type: str = "application/octet-stream",
+        metadata: Optional[dict] = None,
+    ) -> str:
+        """Async variant of upload_stream."""
+        return await self._run_blocking(
+            self.upload_stream, bucket, key, fileobj, size, content_type, metadata
+        )
+
+    async def download_file_async(self, bucket: str, key: str) -> bytes:
+        """Async variant of download_file."""
+        return await self._run_blocking(self.download_file, bucket, key)
+
+    async def delete_file_async(self, bucket: str, key: str) -> bool:
+        """Async variant of delete_file."""
+        return await self._run_blocking(self.delete_file, bucket, key)
+
+    async def list_files_async(
+        self, bucket: str, prefix: str = "", max_results: int = 1000
+    ) -> List[str]:
+        """Async variant of list_files."""
+        return await self._run_blocking(self.list_files, bucket, prefix, max_results)
+
+    async def get_signed_url_async(
+        self, bucket: str, key: str, expiration: int = 3600, method: str = "GET"
+    ) -> str:
+        """Async variant of get_signed_url."""
+        return await self._run_blocking(
+            self.get_signed_url, bucket, key, expiration, method
+        )
+
+    async def file_exists_async(self, bucket: str, key: str) -> bool:
+        """Async variant of file_exists."""
+        return await self._run_blocking(self.file_exists, bucket, key)
+
+    async def get_file_metadata_async(self, bucket: str, key: str) -> dict:
+        """Async variant of get_file_metadata."""
+        return await self._run_blocking(self.get_file_metadata, bucket, key)
+
+    async def stat_async(self, bucket: str, key: str) -> Optional[dict]:
+        """Async variant of stat."""
+        return await self._run_blocking(self.stat, bucket, key)
+
+    async def copy_file_async(
+        self, source_bucket: str, source_key: str, dest_bucket: str, dest_key: str
+    ) -> bool:
+        """Async variant of copy_file."""
+        return await self._run_blocking(
+            self.copy_file, source_bucket, source_key, dest_bucket, dest_key
+        )
+
 
 class StorageError(Exception):
     """Base exception for storage operations."""
@@ -5,12 +5,11 @@ Factory pattern to create appropriate storage backend based on configuration.
 """
 
 import logging
-import os
+from threading import Lock
 from typing import Optional
 
 from .base import StorageBackend, StorageError
-from .minio_backend import MinioStorage
-from .gcs_backend import GCSStorage
+from .config import storage_settings
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +27,7 @@ def get_storage(
     Factory function to return appropriate storage backend based on configuration.
 
     Args:
-        storage_type: Type of storage ('minio', 'gcs'). If None, read from STORAGE_TYPE env var
+        storage_type: Type of storage ('minio', 'gcs'). If None, taken from storage_settings
         endpoint_url: MinIO endpoint URL (for MinIO backend)
         access_key: Access key (for MinIO backend)
         secret_key: Secret key (for MinIO backend)
@@ -43,11 +42,10 @@ def get_storage(
         ValueError: If storage type is unknown or configuration is invalid
         StorageError: If backend initialization fails
     """
-    # Determine storage type
+    # Unset arguments fall back to the validated settings loaded at import
     if storage_type is None:
-        storage_type = os.getenv("STORAGE_TYPE", "minio").lower()
-    else:
-        storage_type = storage_type.lower()
+        storage_type = storage_settings.storage_type
+    storage_type = storage_type.lower()
 
     logger.info(f"Initializing storage backend: {storage_type}")
 
@@ -55,24 +53,27 @@ def get_storage(
         if storage_type == "gcs":
             # Google Cloud Storage
             if project_id is None:
-                project_id = os.getenv("GOOGLE_CLOUD_PROJECT") or os.getenv("GCP_PROJECT_ID")
+                project_id = storage_settings.project_id
+
+            # Imported here so only the configured backend's SDK is loaded
+            from .gcs_backend import GCSStorage
 
             return GCSStorage(project_id=project_id)
 
         elif storage_type == "minio":
             # MinIO (S3-compatible)
             if endpoint_url is None:
-                endpoint_url = os.getenv("STORAGE_ENDPOINT", "http://localhost:9000")
+                endpoint_url = storage_settings.storage_endpoint
             if access_key is None:
-                access_key = os.getenv("STORAGE_ACCESS_KEY", "minioadmin")
+                access_key = storage_settings.storage_access_key
             if secret_key is None:
-                secret_key = os.getenv("STORAGE_SECRET_KEY", "minioadmin")
+                secret_key = storage_settings.storage_secret_key
             if region is None:
-                region = os.getenv("STORAGE_REGION", "us-east-1")
+                region = storage_settings.storage_region
+
+            use_ssl = use_ssl or storage_settings.storage_use_ssl
 
-            # Check for SSL configuration
-            if os.getenv("STORAGE_USE_SSL", "").lower() in ("true", "1", "yes"):
-                use_ssl = True
+            from .minio_backend import MinioStorage
 
             return MinioStorage(
                 endpoint_url=endpoint_url,
@@ -92,9 +93,8 @@ def get_storage(
         raise StorageError(f"Storage initialization failed: {e}")
 
 
-# Singleton instance - initialized on first import
-# This can be used directly: from app.storage import storage
-storage: Optional[StorageBackend] = None
+_storage: Optional[StorageBackend] = None
+_storage_lock = Lock()
 
 
 def init_storage() -> StorageBackend:
@@ -104,19 +104,30 @@ def init_storage() -> StorageBackend:
     This function can be called multiple times safely - it will only
     initialize once and return the same instance.
     """
-    global storage
+    global _storage
+
+    if _storage is None:
+        with _storage_lock:
+            if _storage is None:
+                _storage = get_storage()
+                logger.info("Storage backend initialized successfully")
 
-    if storage is None:
-        storage = get_storage()
-        logger.info("Storage backend initialized successfully")
+    return _storage
 
-    return storage
 
+class _LazyStorage:
+    """Proxy for the singleton backend that initializes it on first use."""
 
-# Auto-initialize on import (can be disabled if needed)
-try:
-    storage = get_storage()
-except Exception as e:
-    logger.warning(f"Storage backend auto-initialization failed: {e}")
-    logger.warning("Call init_storage() explicitly when ready to initialize")
-    storage = None
+    def __getattr__(self, name):
+        return getattr(init_storage(), name)
+
+    def __repr__(self) -> str:
+        if _storage is None:
+            return "<storage (not initialized)>"
+        return repr(_storage)
+
+
+# Singleton proxy - the backend (and its credentials/network setup) is created
+# on first attribute access rather than at import time.
+# This can be used directly: from app.storage import storage
+storage = _LazyStorage()
@@ -4,18 +4,79 @@ Google Cloud Storage backend implementation.
 Uses GCS for production object storage.
 """
 
+import base64
+import io
 import logging
-from typing import List, Optional
+import time
+from threading import Lock
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
 from datetime import timedelta
 
 from google.cloud import storage
 from google.cloud.exceptions import NotFound, GoogleCloudError
 from google.auth.exceptions import DefaultCredentialsError
+import google_crc32c
+from requests.adapters import HTTPAdapter
 
 from .base import StorageBackend, StorageError
 
 logger = logging.getLogger(__name__)
 
+# Chunk size for resumable uploads; GCS requires a multiple of 256 KiB
+RESUMABLE_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Smallest upload worth a metadata lookup to detect unchanged content
+CRC32C_PRECHECK_MIN_BYTES = 64 * 1024
+
+# Signed read URLs are reused for up to half their validity, so a cached
+# URL always has at least half its lifetime left when handed out
+SIGNED_URL_CACHE_SIZE = 10000
+SIGNED_URL_CACHEABLE_METHODS = frozenset({"GET", "HEAD"})
+
+# Listing fetches up to 1000 names per request (the API maximum) and asks
+# only for the fields it reads
+LIST_PAGE_SIZE = 1000
+LIST_FIELDS = "items(name),nextPageToken"
+
+# Connection pool for the shared client's HTTP session; sized for concurrent
+# requests in one worker rather than the requests default of 10
+HTTP_POOL_CONNECTIONS = 32
+HTTP_POOL_MAXSIZE = 64
+
+# One client (and HTTP session) per project for the whole process
+_clients: Dict[Optional[str], storage.Client] = {}
+_clients_lock = Lock()
+
+
+def _get_client(project_id: Optional[str]) -> storage.Client:
+    """Return the process-wide GCS client for a project, creating it once."""
+    with _clients_lock:
+        client = _clients.get(project_id)
+        if client is None:
+            if project_id:
+                client = storage.Client(project=project_id)
+            else:
+                # Will use default credentials (service account, ADC, etc.)
+                client = storage.Client()
+            _configure_http_pool(client)
+            _clients[project_id] = client
+        return client
+
+
+def _configure_http_pool(client: storage.Client) -> None:
+    """Let concurrent requests reuse keep-alive connections to the GCS API."""
+    http = getattr(client, "_http", None)
+    if not hasattr(http, "mount"):
+        return
+    http.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            pool_block=False,
+        ),
+    )
+
 
 class GCSStorage(StorageBackend):
     """Google Cloud Storage backend."""
@@ -28,13 +89,15 @@ class GCSStorage(StorageBackend):
             project_id: GCP project ID (optional, can be inferred from environment)
         """
         try:
-            if project_id:
-                self.client = storage.Client(project=project_id)
-            else:
-                # Will use default credentials (service account, ADC, etc.)
-                self.client = storage.Client()
-
+            self.client = _get_client(project_id)
             self.project_id = self.client.project
+
+            # Bucket handles by name; they hold no per-request state
+            self._buckets: Dict[str, storage.Bucket] = {}
+
+            # (bucket, key, method, expiration) -> (reuse deadline, URL)
+            self._signed_url_cache: Dict[Tuple[str, str, str, int], Tuple[float, str]] = {}
+            self._signed_url_lock = Lock()
             logger.info(f"Initialized GCS storage backend for project {self.project_id}")
 
         except DefaultCredentialsError as e:
@@ -43,6 +106,13 @@ class GCSStorage(StorageBackend):
                 f"GCS authentication failed. Ensure credentials are configured: {e}"
             )
 
+    def _bucket(self, name: str) -> storage.Bucket:
+        """Return the cached handle for a bucket, creating it on first use."""
+        bucket_obj = self._buckets.get(name)
+        if bucket_obj is None:
+            bucket_obj = self._buckets.setdefault(name, self.client.bucket(name))
+        return bucket_obj
+
     def upload_file(
         self,
         bucket: str,
@@ -52,8 +122,61 @@ class GCSStorage(StorageBackend):
         metadata: Optional[dict] = None,
     ) -> str:
         """Upload a file to GCS."""
+        # Re-uploads of identical content are skipped; below the threshold the
+        # metadata lookup costs about as much as the upload itself
+        if len(data) >= CRC32C_PRECHECK_MIN_BYTES and self._is_unchanged(
+            bucket, key, data, content_type, metadata
+        ):
+            url = f"gs://{bucket}/{key}"
+            logger.info(f"Skipped upload of unchanged file {url}")
+            return url
+
+        return self.upload_stream(
+            bucket, key, io.BytesIO(data), len(data), content_type, metadata
+        )
+
+    def _is_unchanged(
+        self,
+        bucket: str,
+        key: str,
+        data: bytes,
+        content_type: str,
+        metadata: Optional[dict],
+    ) -> bool:
+        """Check whether the stored object already has this content and metadata."""
+        blob = self._bucket(bucket).blob(key)
         try:
-            bucket_obj = self.client.bucket(bucket)
+            blob.reload(projection="noAcl")
+        except NotFound:
+            return False
+        except GoogleCloudError as e:
+            # The precheck is only an optimization; fall back to uploading
+            logger.warning(f"Could not check existing file {key} in bucket {bucket}: {e}")
+            return False
+
+        # GCS reports CRC32C as base64 of the big-endian 32-bit value
+        checksum = base64.b64encode(
+            google_crc32c.value(data).to_bytes(4, "big")
+        ).decode("ascii")
+        return (
+            blob.crc32c == checksum
+            and blob.size == len(data)
+            and blob.content_type == content_type
+            and (blob.metadata or {}) == (metadata or {})
+        )
+
+    def upload_stream(
+        self,
+        bucket: str,
+        key: str,
+        fileobj: BinaryIO,
+        size: int,
+        content_type: str = "application/octet-stream",
+        metadata: Optional[dict] = None,
+    ) -> str:
+        """Upload a file to GCS from a file object without buffering it whole."""
+        try:
+            bucket_obj = self._bucket(bucket)
             blob = bucket_obj.blob(key)
 
             # Set content type
@@ -63,8 +186,12 @@ class GCSStorage(StorageBackend):
             if metadata:
                 blob.metadata = metadata
 
+            # Large files go up as a chunked resumable upload
+            if size > RESUMABLE_CHUNK_SIZE:
+                blob.chunk_size = RESUMABLE_CHUNK_SIZE
+
             # Upload the file
-            blob.upload_from_string(data, content_type=content_type)
+            blob.upload_from_file(fileobj, size=size, content_type=content_type)
 
             # Return the public URL (gs:// format)
             url = f"gs://{bucket}/{key}"
@@ -78,7 +205,7 @@ class GCSStorage(StorageBackend):
     def download_file(self, bucket: str, key: str) -> bytes:
         """Download a file from GCS."""
         try:
-            bucket_obj = self.client.bucket(bucket)
+            bucket_obj = self._bucket(bucket)
             blob = bucket_obj.blob(key)
 
             data = blob.download_as_bytes()
@@ -94,18 +221,17 @@ class GCSStorage(StorageBackend):
     def delete_file(self, bucket: str, key: str) -> bool:
         """Delete a file from GCS."""
         try:
-            bucket_obj = self.client.bucket(bucket)
+            bucket_obj = self._bucket(bucket)
             blob = bucket_obj.blob(key)
 
-            # Check if file exists
-            if not blob.exists():
-                logger.warning(f"File {key} does not exist in bucket {bucket}")
-                return False
-
+            # Delete directly; a missing object surfaces as NotFound
             blob.delete()
             logger.info(f"Deleted file {key} from bucket {bucket}")
             return True
 
+        except NotFound:
+            logger.warning(f"File {key} does not exist in bucket {bucket}")
+            return False
         except GoogleCloudError as e:
             logger.error(f"Failed to delete file {key} from bucket {bucket}: {e}")
             raise StorageError(f"Delete failed: {e}")
@@ -114,15 +240,30 @@ class GCSStorage(StorageBackend):
         self, bucket: str, prefix: str = "", max_results: int = 1000
     ) -> List[str]:
         """List files in GCS bucket."""
+        files = list(self.iter_files(bucket, prefix, max_results))
+        logger.info(
+            f"Listed {len(files)} files in bucket {bucket} with prefix '{prefix}'"
+        )
+        return files
+
+    def iter_files(
+        self, bucket: str, prefix: str = "", max_results: Optional[int] = None
+    ) -> Iterator[str]:
+        """
+        Lazily yield object names in a GCS bucket, fetching pages on demand.
+        Only names are requested from the API, not full object metadata.
+        """
+        page_size = min(max_results, LIST_PAGE_SIZE) if max_results else LIST_PAGE_SIZE
         try:
-            bucket_obj = self.client.bucket(bucket)
-            blobs = bucket_obj.list_blobs(prefix=prefix, max_results=max_results)
-
-            files = [blob.name for blob in blobs]
-            logger.info(
-                f"Listed {len(files)} files in bucket {bucket} with prefix '{prefix}'"
+            bucket_obj = self._bucket(bucket)
+            blobs = bucket_obj.list_blobs(
+                prefix=prefix,
+                max_results=max_results,
+                page_size=page_size,
+                fields=LIST_FIELDS,
             )
-            return files
+            for blob in blobs:
+                yield blob.name
 
         except GoogleCloudError as e:
             logger.error(
@@ -134,28 +275,48 @@ class GCSStorage(StorageBackend):
         self, bucket: str, key: str, expiration: int = 3600, method: str = "GET"
     ) -> str:
         """Generate a signed URL for GCS object."""
+        method = method.upper()
+        cacheable = method in SIGNED_URL_CACHEABLE_METHODS
+        cache_key = (bucket, key, method, expiration)
+
+        if cacheable:
+            now = time.monotonic()
+            with self._signed_url_lock:
+                cached = self._signed_url_cache.get(cache_key)
+            if cached is not None and cached[0] > now:
+                return cached[1]
+
         try:
-            bucket_obj = self.client.bucket(bucket)
+            bucket_obj = self._bucket(bucket)
             blob = bucket_obj.blob(key)
 
             # Generate signed URL
             url = blob.generate_signed_url(
                 version="v4",
                 expiration=timedelta(seconds=expiration),
-                method=method.upper(),
+                method=method,
             )
 
             logger.info(f"Generated signed URL for {key} in bucket {bucket}")
-            return url
 
         except GoogleCloudError as e:
             logger.error(f"Failed to generate signed URL for {key}: {e}")
             raise StorageError(f"Signed URL generation failed: {e}")
 
+        # Write URLs are signed per request; only reads are shared
+        if cacheable:
+            with self._signed_url_lock:
+                if len(self._signed_url_cache) >= SIGNED_URL_CACHE_SIZE:
+                    # Drop the oldest entry (dicts keep insertion order)
+                    self._signed_url_cache.pop(next(iter(self._signed_url_cache)))
+                self._signed_url_cache[cache_key] = (now + expiration / 2, url)
+
+        return url
+
     def file_exists(self, bucket: str, key: str) -> bool:
         """Check if file exists in GCS."""
         try:
-            bucket_obj = self.client.bucket(bucket)
+            bucket_obj = self._bucket(bucket)
             blob = bucket_obj.blob(key)
             return blob.exists()
 
@@ -166,14 +327,11 @@ class GCSStorage(StorageBackend):
     def get_file_metadata(self, bucket: str, key: str) -> dict:
         """Get file metadata from GCS."""
         try:
-            bucket_obj = self.client.bucket(bucket)
+            bucket_obj = self._bucket(bucket)
             blob = bucket_obj.blob(key)
 
-            # Reload blob to get latest metadata
-            if not blob.exists():
-                raise FileNotFoundError(f"File {key} not found in bucket {bucket}")
-
-            blob.reload()
+            # Single metadata GET without ACLs; raises NotFound if missing
+            blob.reload(projection="noAcl")
 
             metadata = {
                 "size": blob.size,
@@ -199,18 +357,11 @@ class GCSStorage(StorageBackend):
     ) -> bool:
         """Copy file within or between GCS buckets."""
         try:
-            source_bucket_obj = self.client.bucket(source_bucket)
+            source_bucket_obj = self._bucket(source_bucket)
             source_blob = source_bucket_obj.blob(source_key)
+            dest_bucket_obj = self._bucket(dest_bucket)
 
-            # Check if source file exists
-            if not source_blob.exists():
-                raise FileNotFoundError(
-                    f"Source file {source_key} not found in bucket {source_bucket}"
-                )
-
-            dest_bucket_obj = self.client.bucket(dest_bucket)
-
-            # Copy the blob
+            # Copy the blob; a missing source surfaces as NotFound
             source_bucket_obj.copy_blob(
                 source_blob, dest_bucket_obj, new_name=dest_key
             )
@@ -220,8 +371,10 @@ class GCSStorage(StorageBackend):
             )
             return True
 
-        except FileNotFoundError:
-            raise
+        except NotFound:
+            raise FileNotFoundError(
+                f"Source file {source_key} not found in bucket {source_bucket}"
+            )
         except GoogleCloudError as e:
             logger.error(f"Failed to copy file: {e}")
             raise StorageError(f"Copy failed: {e}")
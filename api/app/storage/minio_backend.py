@@ -4,18 +4,164 @@ MinIO storage backend implementation.
 Uses MinIO (S3-compatible) for local development and testing.
 """
 
+import io
 import logging
-from typing import List, Optional
-from datetime import timedelta
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from threading import Lock
+from typing import (
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+from urllib.parse import quote
 
 import boto3
-from botocore.client import Config
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
+from botocore.client import BaseClient, Config
 from botocore.exceptions import ClientError, BotoCoreError
 
-from .base import StorageBackend, StorageError
+from .base import BULK_MAX_WORKERS, DOWNLOAD_CHUNK_SIZE, StorageBackend, StorageError
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Size of the urllib3 connection pool behind the S3 client. Keep this at or
+# above the number of threads that may call the backend concurrently (the
+# FastAPI threadpool and the storage executor), otherwise extra requests
+# discard pooled connections and pay a fresh TCP/TLS handshake.
+MAX_POOL_CONNECTIONS = 50
+
+# Keepalive probe timings (seconds) for pooled sockets. The OS default waits
+# two hours before probing, long after NATs and load balancers have dropped
+# an idle connection, which then fails or has to be re-established.
+TCP_KEEPALIVE_IDLE = 30
+TCP_KEEPALIVE_INTERVAL = 10
+TCP_KEEPALIVE_COUNT = 3
+
+# Payloads from this size up are sent as multipart uploads with parts
+# transferred in parallel; smaller ones go up in a single put_object
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+MULTIPART_MAX_CONCURRENCY = 10
+
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=MULTIPART_THRESHOLD,
+    multipart_chunksize=MULTIPART_CHUNK_SIZE,
+    max_concurrency=MULTIPART_MAX_CONCURRENCY,
+    use_threads=True,
+)
+
+# Presigned read URLs are reused for up to half their validity, so a cached
+# URL always has at least half its lifetime left when handed out
+SIGNED_URL_CACHE_SIZE = 10000
+SIGNED_URL_CACHEABLE_METHODS = frozenset({"GET"})
+
+# HTTP methods that can be presigned, mapped to S3 client methods
+SIGNED_URL_CLIENT_METHODS = {
+    "GET": "get_object",
+    "PUT": "put_object",
+    "POST": "post_object",
+    "DELETE": "delete_object",
+}
+
+# Listing fetches up to 1000 keys per request (the S3 maximum)
+LIST_PAGE_SIZE = 1000
+
+# delete_objects accepts at most 1000 keys per request
+DELETE_BATCH_SIZE = 1000
+
+# Error codes meaning the requested object doesn't exist; GetObject reports
+# NoSuchKey, while HEAD responses carry no body and only give the status
+NOT_FOUND_ERRORS = frozenset({"NoSuchKey", "404"})
+
+# Error codes for a copy source above the 5 GiB CopyObject limit
+COPY_SIZE_LIMIT_ERRORS = frozenset({"InvalidRequest", "EntityTooLarge"})
+
+# One client (and connection pool) per connection settings for the whole
+# process, so backend instances share keep-alive sockets
+_clients: Dict[Tuple[str, str, str, str, bool, int], BaseClient] = {}
+_clients_lock = Lock()
+
+
+def _get_client(
+    endpoint_url: str,
+    access_key: str,
+    secret_key: str,
+    region: str,
+    use_ssl: bool,
+    max_pool_connections: int,
+) -> BaseClient:
+    """Return the process-wide S3 client for these settings, creating it once."""
+    key = (endpoint_url, access_key, secret_key, region, use_ssl, max_pool_connections)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            # S3 client with signature version v4 and a connection pool
+            # sized for concurrent request handlers. Over TLS the transport
+            # already protects the body, so uploads skip the SHA-256 pass
+            # over the whole payload (UNSIGNED-PAYLOAD); plain HTTP keeps it.
+            secure = endpoint_url.lower().startswith("https://")
+            client = boto3.client(
+                "s3",
+                endpoint_url=endpoint_url,
+                aws_access_key_id=access_key,
+                aws_secret_access_key=secret_key,
+                region_name=region,
+                config=Config(
+                    signature_version="s3v4",
+                    max_pool_connections=max_pool_connections,
+                    retries={"max_attempts": 5, "mode": "adaptive"},
+                    tcp_keepalive=True,
+                    s3={"payload_signing_enabled": False} if secure else None,
+                ),
+                use_ssl=use_ssl,
+            )
+            _configure_keepalive(client)
+            _clients[key] = client
+        return client
+
+
+def _configure_keepalive(client: BaseClient) -> None:
+    """Tune keepalive probes on the client's pooled sockets where the OS allows."""
+    http_session = getattr(getattr(client, "_endpoint", None), "http_session", None)
+    socket_options = getattr(http_session, "_socket_options", None)
+    if not isinstance(socket_options, list):
+        return
+    # The pool manager holds this same list and applies it to new connections
+    for name, value in (
+        ("TCP_KEEPIDLE", TCP_KEEPALIVE_IDLE),
+        ("TCP_KEEPINTVL", TCP_KEEPALIVE_INTERVAL),
+        ("TCP_KEEPCNT", TCP_KEEPALIVE_COUNT),
+    ):
+        option = getattr(socket, name, None)
+        if option is not None:
+            socket_options.append((socket.IPPROTO_TCP, option, value))
+
+
+def _error_code(e: ClientError) -> str:
+    """Return the S3 error code of a ClientError, or "" if it has none."""
+    return e.response.get("Error", {}).get("Code", "")
+
+
+def _is_missing_bucket(e: Exception) -> bool:
+    """Whether an upload or copy failed because the bucket doesn't exist."""
+    if isinstance(e, ClientError):
+        return _error_code(e) == "NoSuchBucket"
+    # upload_fileobj can wrap the ClientError, keeping only its message
+    return isinstance(e, S3UploadFailedError) and "NoSuchBucket" in str(e)
+
 
 class MinioStorage(StorageBackend):
     """MinIO storage backend (S3-compatible)."""
@@ -27,6 +173,7 @@ class MinioStorage(StorageBackend):
         secret_key: str,
         region: str = "us-east-1",
         use_ssl: bool = False,
+        max_pool_connections: int = MAX_POOL_CONNECTIONS,
     ):
         """
         Initialize MinIO storage backend.
@@ -37,34 +184,45 @@ class MinioStorage(StorageBackend):
             secret_key: Secret key
             region: Region name (default: us-east-1)
             use_ssl: Whether to use SSL/TLS
+            max_pool_connections: Maximum pooled HTTP connections to MinIO
         """
         self.endpoint_url = endpoint_url
         self.region = region
 
-        # Create S3 client with signature version v4
-        self.client = boto3.client(
-            "s3",
-            endpoint_url=endpoint_url,
-            aws_access_key_id=access_key,
-            aws_secret_access_key=secret_key,
-            region_name=region,
-            config=Config(signature_version="s3v4"),
-            use_ssl=use_ssl,
+        # Base for object URLs returned by uploads
+        self._url_base = endpoint_url.rstrip("/") + "/"
+
+        # Buckets already confirmed to exist, so uploads skip head_bucket
+        self._known_buckets: Set[str] = set()
+        self._known_buckets_lock = Lock()
+
+        # (bucket, key, method, expiration) -> (reuse deadline, presigned URL)
+        self._signed_url_cache: Dict[Tuple[str, str, str, int], Tuple[float, str]] = {}
+        self._signed_url_lock = Lock()
+
+        self.client = _get_client(
+            endpoint_url, access_key, secret_key, region, use_ssl, max_pool_connections
         )
 
-        logger.info(f"Initialized MinIO storage backend at {endpoint_url}")
+        logger.info("Initialized MinIO storage backend at %s", endpoint_url)
+
+    def _object_url(self, bucket: str, key: str) -> str:
+        """Return the path-style URL of an object, percent-encoding the key."""
+        return self._url_base + quote(bucket, safe="") + "/" + quote(key, safe="/")
 
     def _ensure_bucket_exists(self, bucket: str) -> None:
         """Create bucket if it doesn't exist."""
+        if bucket in self._known_buckets:
+            return
+
         try:
             self.client.head_bucket(Bucket=bucket)
-            logger.debug(f"Bucket {bucket} exists")
+            logger.debug("Bucket %s exists", bucket)
         except ClientError as e:
-            error_code = e.response.get("Error", {}).get("Code", "")
-            if error_code == "404":
+            if _error_code(e) == "404":
                 try:
                     self.client.create_bucket(Bucket=bucket)
-                    logger.info(f"Created bucket {bucket}")
+                    logger.info("Created bucket %s", bucket)
                 except ClientError as create_error:
                     raise StorageError(
                         f"Failed to create bucket {bucket}: {create_error}"
@@ -72,6 +230,29 @@ class MinioStorage(StorageBackend):
             else:
                 raise StorageError(f"Failed to check bucket {bucket}: {e}")
 
+        with self._known_buckets_lock:
+            self._known_buckets.add(bucket)
+
+    def _in_bucket(
+        self, bucket: str, operation: Callable[[], T], retry: bool = True
+    ) -> T:
+        """
+        Run a write into bucket, creating the bucket first if needed. A bucket
+        deleted outside the app since it was cached is forgotten, recreated
+        and the operation retried once.
+        """
+        self._ensure_bucket_exists(bucket)
+        try:
+            return operation()
+        except (ClientError, S3UploadFailedError) as e:
+            if not retry or not _is_missing_bucket(e):
+                raise
+            with self._known_buckets_lock:
+                self._known_buckets.discard(bucket)
+            logger.warning("Bucket %s no longer exists, recreating it", bucket)
+            self._ensure_bucket_exists(bucket)
+            return operation()
+
     def upload_file(
         self,
         bucket: str,
@@ -81,24 +262,70 @@ class MinioStorage(StorageBackend):
         metadata: Optional[dict] = None,
     ) -> str:
         """Upload a file to MinIO."""
-        try:
-            self._ensure_bucket_exists(bucket)
+        if len(data) >= MULTIPART_THRESHOLD:
+            return self.upload_stream(
+                bucket, key, io.BytesIO(data), len(data), content_type, metadata
+            )
 
+        try:
             extra_args = {"ContentType": content_type}
             if metadata:
                 extra_args["Metadata"] = metadata
 
-            self.client.put_object(
-                Bucket=bucket, Key=key, Body=data, **extra_args
+            self._in_bucket(
+                bucket,
+                partial(
+                    self.client.put_object,
+                    Bucket=bucket,
+                    Key=key,
+                    Body=data,
+                    **extra_args,
+                ),
             )
 
-            # Return the object URL
-            url = f"{self.endpoint_url}/{bucket}/{key}"
-            logger.info(f"Uploaded file to {url}")
+            url = self._object_url(bucket, key)
+            logger.debug("Uploaded file to %s", url)
             return url
 
         except (ClientError, BotoCoreError) as e:
-            logger.error(f"Failed to upload file {key} to bucket {bucket}: {e}")
+            logger.error("Failed to upload file %s to bucket %s: %s", key, bucket, e)
+            raise StorageError(f"Upload failed: {e}")
+
+    def upload_stream(
+        self,
+        bucket: str,
+        key: str,
+        fileobj: BinaryIO,
+        size: int,
+        content_type: str = "application/octet-stream",
+        metadata: Optional[dict] = None,
+    ) -> str:
+        """Upload a file to MinIO from a file object, in parallel parts if large."""
+        try:
+            extra_args = {"ContentType": content_type}
+            if metadata:
+                extra_args["Metadata"] = metadata
+
+            # A failed attempt may have consumed the stream, so it is only
+            # retried when it can be rewound
+            seekable = getattr(fileobj, "seekable", None)
+            start = fileobj.tell() if seekable is not None and seekable() else None
+
+            def upload() -> None:
+                if start is not None:
+                    fileobj.seek(start)
+                self.client.upload_fileobj(
+                    fileobj, bucket, key, ExtraArgs=extra_args, Config=TRANSFER_CONFIG
+                )
+
+            self._in_bucket(bucket, upload, retry=start is not None)
+
+            url = self._object_url(bucket, key)
+            logger.debug("Uploaded file to %s", url)
+            return url
+
+        except (ClientError, BotoCoreError, S3UploadFailedError) as e:
+            logger.error("Failed to upload file %s to bucket %s: %s", key, bucket, e)
             raise StorageError(f"Upload failed: {e}")
 
     def download_file(self, bucket: str, key: str) -> bytes:
@@ -106,53 +333,137 @@ class MinioStorage(StorageBackend):
         try:
             response = self.client.get_object(Bucket=bucket, Key=key)
             data = response["Body"].read()
-            logger.info(f"Downloaded file {key} from bucket {bucket}")
+            logger.debug("Downloaded file %s from bucket %s", key, bucket)
             return data
 
         except ClientError as e:
-            error_code = e.response.get("Error", {}).get("Code", "")
-            if error_code == "NoSuchKey":
+            if _error_code(e) in NOT_FOUND_ERRORS:
                 raise FileNotFoundError(f"File {key} not found in bucket {bucket}")
-            logger.error(f"Failed to download file {key} from bucket {bucket}: {e}")
+            logger.error(
+                "Failed to download file %s from bucket %s: %s", key, bucket, e
+            )
+            raise StorageError(f"Download failed: {e}")
+
+    def download_stream(
+        self, bucket: str, key: str, chunk_size: int = DOWNLOAD_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """Stream a file from MinIO in chunks without buffering it whole."""
+        try:
+            response = self.client.get_object(Bucket=bucket, Key=key)
+        except ClientError as e:
+            if _error_code(e) in NOT_FOUND_ERRORS:
+                raise FileNotFoundError(f"File {key} not found in bucket {bucket}")
+            logger.error(
+                "Failed to download file %s from bucket %s: %s", key, bucket, e
+            )
+            raise StorageError(f"Download failed: {e}")
+
+        body = response["Body"]
+        try:
+            yield from body.iter_chunks(chunk_size)
+            logger.debug("Streamed file %s from bucket %s", key, bucket)
+        except (ClientError, BotoCoreError) as e:
+            logger.error("Failed to stream file %s from bucket %s: %s", key, bucket, e)
             raise StorageError(f"Download failed: {e}")
+        finally:
+            body.close()
 
     def delete_file(self, bucket: str, key: str) -> bool:
         """Delete a file from MinIO."""
         try:
-            # Check if file exists first
+            # S3 reports success for deleting a missing key, so existence has
+            # to be checked up front for callers that rely on the False result
             if not self.file_exists(bucket, key):
-                logger.warning(f"File {key} does not exist in bucket {bucket}")
+                logger.warning("File %s does not exist in bucket %s", key, bucket)
                 return False
 
             self.client.delete_object(Bucket=bucket, Key=key)
-            logger.info(f"Deleted file {key} from bucket {bucket}")
+            logger.debug("Deleted file %s from bucket %s", key, bucket)
             return True
 
         except (ClientError, BotoCoreError) as e:
-            logger.error(f"Failed to delete file {key} from bucket {bucket}: {e}")
+            logger.error("Failed to delete file %s from bucket %s: %s", key, bucket, e)
             raise StorageError(f"Delete failed: {e}")
 
+    def delete_many(self, bucket: str, keys: Iterable[str]) -> Dict[str, bool]:
+        """
+        Delete several files from MinIO with batched delete_objects requests.
+        Keys that were already missing are reported as deleted; only keys
+        the server rejected map to False.
+        """
+        keys = list(dict.fromkeys(keys))
+        batches = [
+            keys[start : start + DELETE_BATCH_SIZE]
+            for start in range(0, len(keys), DELETE_BATCH_SIZE)
+        ]
+
+        if len(batches) > 1:
+            workers = min(BULK_MAX_WORKERS, len(batches))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                delete_batch = partial(self._delete_batch, bucket)
+                failed_batches = list(pool.map(delete_batch, batches))
+        else:
+            failed_batches = [self._delete_batch(bucket, batch) for batch in batches]
+
+        failed = set().union(*failed_batches)
+        logger.info("Deleted %d files from bucket %s", len(keys) - len(failed), bucket)
+        return {key: key not in failed for key in keys}
+
+    def _delete_batch(self, bucket: str, keys: List[str]) -> Set[str]:
+        """Delete up to DELETE_BATCH_SIZE keys in one request; return failed keys."""
+        try:
+            response = self.client.delete_objects(
+                Bucket=bucket,
+                Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+            )
+        except (ClientError, BotoCoreError) as e:
+            logger.error("Failed to delete files from bucket %s: %s", bucket, e)
+            raise StorageError(f"Delete failed: {e}")
+
+        errors = response.get("Errors", ())
+        for error in errors:
+            logger.warning(
+                "Failed to delete file %s from bucket %s: %s",
+                error.get("Key"),
+                bucket,
+                error.get("Message", error.get("Code")),
+            )
+        return {error.get("Key") for error in errors}
+
     def list_files(
         self, bucket: str, prefix: str = "", max_results: int = 1000
     ) -> List[str]:
         """List files in MinIO bucket."""
-        try:
-            response = self.client.list_objects_v2(
-                Bucket=bucket, Prefix=prefix, MaxKeys=max_results
-            )
-
-            files = []
-            if "Contents" in response:
-                files = [obj["Key"] for obj in response["Contents"]]
+        files = list(self.iter_files(bucket, prefix, max_results))
+        logger.debug(
+            "Listed %d files in bucket %s with prefix '%s'", len(files), bucket, prefix
+        )
+        return files
 
-            logger.info(
-                f"Listed {len(files)} files in bucket {bucket} with prefix '{prefix}'"
+    def iter_files(
+        self, bucket: str, prefix: str = "", max_results: Optional[int] = None
+    ) -> Iterator[str]:
+        """
+        Lazily yield object keys in a MinIO bucket, following continuation
+        tokens so listings are not truncated at one page.
+        """
+        pagination = {"PageSize": LIST_PAGE_SIZE}
+        if max_results:
+            pagination["MaxItems"] = max_results
+        try:
+            pages = self.client.get_paginator("list_objects_v2").paginate(
+                Bucket=bucket, Prefix=prefix, PaginationConfig=pagination
             )
-            return files
+            for page in pages:
+                for obj in page.get("Contents", ()):
+                    yield obj["Key"]
 
         except (ClientError, BotoCoreError) as e:
             logger.error(
-                f"Failed to list files in bucket {bucket} with prefix '{prefix}': {e}"
+                "Failed to list files in bucket %s with prefix '%s': %s",
+                bucket,
+                prefix,
+                e,
             )
             raise StorageError(f"List failed: {e}")
 
@@ -160,16 +471,19 @@ class MinioStorage(StorageBackend):
         self, bucket: str, key: str, expiration: int = 3600, method: str = "GET"
     ) -> str:
         """Generate a presigned URL for MinIO object."""
+        method = method.upper()
+        cacheable = method in SIGNED_URL_CACHEABLE_METHODS
+        cache_key = (bucket, key, method, expiration)
+
+        if cacheable:
+            now = time.monotonic()
+            with self._signed_url_lock:
+                cached = self._signed_url_cache.get(cache_key)
+            if cached is not None and cached[0] > now:
+                return cached[1]
+
         try:
-            # Map HTTP methods to S3 client methods
-            method_map = {
-                "GET": "get_object",
-                "PUT": "put_object",
-                "POST": "post_object",
-                "DELETE": "delete_object",
-            }
-
-            client_method = method_map.get(method.upper())
+            client_method = SIGNED_URL_CLIENT_METHODS.get(method)
             if not client_method:
                 raise ValueError(f"Unsupported HTTP method: {method}")
 
@@ -179,75 +493,96 @@ class MinioStorage(StorageBackend):
                 ExpiresIn=expiration,
             )
 
-            logger.info(f"Generated signed URL for {key} in bucket {bucket}")
-            return url
+            logger.debug("Generated signed URL for %s in bucket %s", key, bucket)
 
         except (ClientError, BotoCoreError) as e:
-            logger.error(f"Failed to generate signed URL for {key}: {e}")
+            logger.error("Failed to generate signed URL for %s: %s", key, e)
             raise StorageError(f"Signed URL generation failed: {e}")
 
+        # Write URLs are signed per request; only reads are shared
+        if cacheable:
+            with self._signed_url_lock:
+                if len(self._signed_url_cache) >= SIGNED_URL_CACHE_SIZE:
+                    # Drop the oldest entry (dicts keep insertion order)
+                    self._signed_url_cache.pop(next(iter(self._signed_url_cache)))
+                self._signed_url_cache[cache_key] = (now + expiration / 2, url)
+
+        return url
+
     def file_exists(self, bucket: str, key: str) -> bool:
         """Check if file exists in MinIO."""
-        try:
-            self.client.head_object(Bucket=bucket, Key=key)
-            return True
-        except ClientError as e:
-            error_code = e.response.get("Error", {}).get("Code", "")
-            if error_code == "404":
-                return False
-            logger.error(f"Failed to check if file {key} exists in bucket {bucket}: {e}")
-            raise StorageError(f"Existence check failed: {e}")
+        return self.stat(bucket, key) is not None
 
     def get_file_metadata(self, bucket: str, key: str) -> dict:
         """Get file metadata from MinIO."""
-        try:
-            response = self.client.head_object(Bucket=bucket, Key=key)
+        metadata = self.stat(bucket, key)
+        if metadata is None:
+            raise FileNotFoundError(f"File {key} not found in bucket {bucket}")
 
-            metadata = {
-                "size": response.get("ContentLength", 0),
-                "content_type": response.get("ContentType", ""),
-                "last_modified": response.get("LastModified"),
-                "etag": response.get("ETag", "").strip('"'),
-                "metadata": response.get("Metadata", {}),
-            }
-
-            logger.info(f"Retrieved metadata for {key} from bucket {bucket}")
-            return metadata
+        logger.debug("Retrieved metadata for %s from bucket %s", key, bucket)
+        return metadata
 
+    def stat(self, bucket: str, key: str) -> Optional[dict]:
+        """Get file metadata from MinIO with a single head_object request."""
+        try:
+            response = self.client.head_object(Bucket=bucket, Key=key)
         except ClientError as e:
-            error_code = e.response.get("Error", {}).get("Code", "")
-            if error_code == "404":
-                raise FileNotFoundError(f"File {key} not found in bucket {bucket}")
-            logger.error(f"Failed to get metadata for {key} from bucket {bucket}: {e}")
+            if _error_code(e) in NOT_FOUND_ERRORS:
+                return None
+            logger.error(
+                "Failed to get metadata for %s from bucket %s: %s", key, bucket, e
+            )
             raise StorageError(f"Metadata retrieval failed: {e}")
 
+        return {
+            "size": response.get("ContentLength", 0),
+            "content_type": response.get("ContentType", ""),
+            "last_modified": response.get("LastModified"),
+            "etag": response.get("ETag", "").strip('"'),
+            "metadata": response.get("Metadata", {}),
+        }
+
     def copy_file(
         self, source_bucket: str, source_key: str, dest_bucket: str, dest_key: str
     ) -> bool:
         """Copy file within or between MinIO buckets."""
-        try:
-            # Check if source file exists
-            if not self.file_exists(source_bucket, source_key):
-                raise FileNotFoundError(
-                    f"Source file {source_key} not found in bucket {source_bucket}"
-                )
+        # Copy the object; a missing source surfaces as NoSuchKey
+        copy_source = {"Bucket": source_bucket, "Key": source_key}
 
-            # Ensure destination bucket exists
-            self._ensure_bucket_exists(dest_bucket)
-
-            # Copy the object
-            copy_source = {"Bucket": source_bucket, "Key": source_key}
-            self.client.copy_object(
-                CopySource=copy_source, Bucket=dest_bucket, Key=dest_key
-            )
+        def copy() -> None:
+            try:
+                self.client.copy_object(
+                    CopySource=copy_source, Bucket=dest_bucket, Key=dest_key
+                )
+            except ClientError as e:
+                if _error_code(e) not in COPY_SIZE_LIMIT_ERRORS:
+                    raise
+                # Too large for a single CopyObject; the transfer manager
+                # copies it server-side as parallel UploadPartCopy parts
+                self.client.copy(
+                    copy_source, dest_bucket, dest_key, Config=TRANSFER_CONFIG
+                )
 
-            logger.info(
-                f"Copied file from {source_bucket}/{source_key} to {dest_bucket}/{dest_key}"
+        try:
+            # The destination bucket is created if it doesn't exist
+            self._in_bucket(dest_bucket, copy)
+
+            logger.debug(
+                "Copied file from %s/%s to %s/%s",
+                source_bucket,
+                source_key,
+                dest_bucket,
+                dest_key,
             )
             return True
 
-        except FileNotFoundError:
-            raise
-        except (ClientError, BotoCoreError) as e:
-            logger.error(f"Failed to copy file: {e}")
+        except ClientError as e:
+            if _error_code(e) in NOT_FOUND_ERRORS:
+                raise FileNotFoundError(
+                    f"Source file {source_key} not found in bucket {source_bucket}"
+                )
+            logger.error("Failed to copy file: %s", e)
+            raise StorageError(f"Copy failed: {e}")
+        except BotoCoreError as e:
+            logger.error("Failed to copy file: %s", e)
             raise StorageError(f"Copy failed: {e}")
@@ -5,6 +5,7 @@ from .memory_optimization import (
     OptimizedDataFrameOperations,
     estimate_file_memory,
 )
+from .rule_json import decode_rule_json, dumps_json, loads_json
 from .sanitization import (
     sanitize_input,
     sanitize_identifier,
@@ -17,6 +18,9 @@ __all__ = [
     'ChunkedDataFrameReader',
     'OptimizedDataFrameOperations',
     'estimate_file_memory',
+    'decode_rule_json',
+    'dumps_json',
+    'loads_json',
     'sanitize_input',
     'sanitize_identifier',
     'ensure_max_length',
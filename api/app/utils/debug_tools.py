@@ -3,31 +3,197 @@ Debug tools and utilities for enhanced testing and debugging capabilities.
 Provides comprehensive debugging, profiling, and testing utilities for the data hygiene toolkit.
 """
 
-import json
+import os
 import uuid
 import time
+import random
 import psutil
+import threading
 import traceback
+from collections import defaultdict
 from typing import List, Dict, Any, Optional, Callable
 from datetime import datetime, timezone
 from pathlib import Path
 import pandas as pd
 import numpy as np
+from sqlalchemy import bindparam
 from sqlalchemy.orm import Session
-from functools import wraps
+from functools import partial, wraps
 
-from app.models import DebugSession, Execution, Rule
+from app.models import DebugEvent, DebugSession, Execution, Rule
 from app.utils.logging_service import get_logger
+from app.utils.rule_json import dumps_json, loads_json
+
+# Bounds on what a variable snapshot stores per variable
+SNAPSHOT_MAX_ITEMS = 100
+SNAPSHOT_MAX_STR_LENGTH = 200
+
+
+def _keep(value: Any) -> Any:
+    return value
+
+
+def _serialize_sequence(value: Any) -> List[str]:
+    return [str(v) for v in value[:SNAPSHOT_MAX_ITEMS]]
+
+
+def _serialize_mapping(value: Dict[Any, Any]) -> Dict[Any, str]:
+    items = value.items()
+    if len(value) > SNAPSHOT_MAX_ITEMS:
+        items = list(items)[:SNAPSHOT_MAX_ITEMS]
+    return {k: str(v) for k, v in items}
+
+
+def _serialize_other(value: Any) -> Any:
+    # Subclasses of the dispatched types are handled like their base type
+    if isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return _serialize_sequence(value)
+    if isinstance(value, dict):
+        return _serialize_mapping(value)
+    return str(value)[:SNAPSHOT_MAX_STR_LENGTH]
+
+
+# debug_data list that each kind of DebugEvent is read back into
+DEBUG_EVENT_KEYS = {
+    'breakpoint': 'breakpoints',
+    'snapshot': 'variable_snapshots',
+    'trace': 'execution_trace',
+}
+
+# Pending debug events are written once a session has this many queued,
+# or once the oldest has waited this many seconds
+DEBUG_EVENT_FLUSH_SIZE = 64
+DEBUG_EVENT_FLUSH_INTERVAL = 1.0
+
+# Snapshots and trace events kept per session, in memory and in debug_events;
+# past this, a uniform random sample of that size is kept
+DEBUG_RESERVOIR_SIZE = 500
+
+# Seconds between the profiler's background memory samples
+MEMORY_SAMPLE_INTERVAL = 0.05
+
+# A profile's sampler thread stops after this many seconds even if the
+# profile is never ended
+PROFILE_MAX_SAMPLING_SECONDS = 3600
+
+# When set, debug_function returns functions undecorated
+DEBUG_FUNCTIONS_DISABLED = os.getenv(
+    "DEBUG_FUNCTIONS_DISABLED", "").lower() in ("1", "true", "yes")
+
+
+class _Lazy:
+    """Snapshot value computed only if the snapshot is kept"""
+
+    __slots__ = ('compute',)
+
+    def __init__(self, compute: Callable[[], Any]):
+        self.compute = compute
+
+
+def _format_exception(error: BaseException) -> str:
+    return ''.join(traceback.format_exception(
+        type(error), error, error.__traceback__))
+
+
+def _serialize_lazy(value: _Lazy) -> Any:
+    return _serialize_other(value.compute())
+
+
+# Snapshot serializers by exact type; anything else goes to _serialize_other
+_SERIALIZERS: Dict[type, Callable[[Any], Any]] = {
+    str: _keep,
+    int: _keep,
+    float: _keep,
+    bool: _keep,
+    type(None): _keep,
+    list: _serialize_sequence,
+    tuple: _serialize_sequence,
+    dict: _serialize_mapping,
+    _Lazy: _serialize_lazy,
+}
+
+# Handle for the current process, replaced after a fork
+_process: Optional[psutil.Process] = None
+
+
+def _current_rss() -> int:
+    """Resident set size of this process, reusing one psutil handle"""
+    global _process
+    if _process is None or _process.pid != os.getpid():
+        _process = psutil.Process()
+    return _process.memory_info().rss
+
+# Last whole second formatted by _now_iso, as (epoch seconds, text)
+_iso_second = (None, '')
+
+
+def _now_iso() -> str:
+    """Current UTC time in ISO 8601, reformatting the date part once a second"""
+    global _iso_second
+    seconds, micros = divmod(time.time_ns() // 1000, 1_000_000)
+    cached_seconds, prefix = _iso_second
+    if seconds != cached_seconds:
+        prefix = datetime.fromtimestamp(seconds, timezone.utc).strftime(
+            '%Y-%m-%dT%H:%M:%S')
+        _iso_second = (seconds, prefix)
+    return f"{prefix}.{micros:06d}+00:00"
+
+
+def _elapsed_since(start_ns: int) -> float:
+    """Seconds elapsed since a time.perf_counter_ns() reading"""
+    return (time.perf_counter_ns() - start_ns) / 1e9
+
+
+def _reservoir_slot(items: List[Any], seen: int) -> Optional[int]:
+    """
+    Slot in a reservoir sample for item number `seen` (0-based) of a stream,
+    or None if the item is not kept. Deciding first lets callers skip
+    building items that would be dropped.
+    """
+    if len(items) < DEBUG_RESERVOIR_SIZE:
+        return len(items)
+    slot = random.randint(0, seen)
+    return slot if slot < DEBUG_RESERVOIR_SIZE else None
+
+
+def _reservoir_put(items: List[Any], slot: int, item: Any) -> None:
+    if slot == len(items):
+        items.append(item)
+    else:
+        items[slot] = item
+
+
+def _synchronized(method: Callable) -> Callable:
+    """Run a DebugSessionManager method while holding the manager's lock"""
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
 
 
 class DebugSessionManager:
-    """Manager for debug sessions and debugging utilities"""
+    """
+    Manager for debug sessions and debugging utilities.
+    One instance is shared across requests, so methods that touch
+    active_sessions, the event queue or the DB session hold self._lock.
+    """
 
     def __init__(self, db: Session):
         self.db = db
+        self._lock = threading.RLock()
         self.logger = get_logger()
         self.active_sessions: Dict[str, Dict[str, Any]] = {}
-
+        self._pending: Dict[str, List[DebugEvent]] = defaultdict(list)
+        self._pending_since: Dict[str, float] = {}
+        # Queued events by (kind, slot), and payloads for slots whose row
+        # is already written, per session
+        self._pending_slots: Dict[str, Dict[tuple, DebugEvent]] = defaultdict(dict)
+        self._pending_updates: Dict[str, Dict[tuple, str]] = defaultdict(dict)
+
+    @_synchronized
     def create_debug_session(
         self,
         execution_id: str,
@@ -35,16 +201,17 @@ class DebugSessionManager:
         created_by: str
     ) -> DebugSession:
         """Create a new debug session"""
+        debug_data = {
+            'created_at': _now_iso(),
+            'breakpoints': [],
+            'variable_snapshots': [],
+            'execution_trace': []
+        }
         session = DebugSession(
             id=str(uuid.uuid4()),
             execution_id=execution_id,
             session_name=session_name,
-            debug_data=json.dumps({
-                'created_at': datetime.now(timezone.utc).isoformat(),
-                'breakpoints': [],
-                'variable_snapshots': [],
-                'execution_trace': []
-            }),
+            debug_data=dumps_json(debug_data),
             created_by=created_by
         )
 
@@ -52,16 +219,22 @@ class DebugSessionManager:
         self.db.commit()
         self.db.refresh(session)
 
-        # Initialize session tracking
+        # Initialize session tracking; the row and its debug_data are kept
+        # so ending the session doesn't need to read them back
         self.active_sessions[session.id] = {
-            'start_time': time.time(),
+            'row': session,
+            'debug_data': debug_data,
+            'start_ns': time.perf_counter_ns(),
             'breakpoints': [],
             'snapshots': [],
-            'trace': []
+            'trace': [],
+            'snapshot_count': 0,
+            'trace_count': 0
         }
 
         return session
 
+    @_synchronized
     def add_breakpoint(
         self,
         session_id: str,
@@ -73,38 +246,96 @@ class DebugSessionManager:
             breakpoint_data = {
                 'location': location,
                 'condition': condition,
-                'created_at': datetime.now(timezone.utc).isoformat()
+                'created_at': _now_iso()
             }
             self.active_sessions[session_id]['breakpoints'].append(
                 breakpoint_data)
+            self._record_event(session_id, 'breakpoint', breakpoint_data)
 
-            # Update database
-            session = self.db.query(DebugSession).filter(
-                DebugSession.id == session_id
-            ).first()
-            if session:
-                debug_data = json.loads(session.debug_data)
-                debug_data['breakpoints'].append(breakpoint_data)
-                session.debug_data = json.dumps(debug_data)
-                self.db.commit()
+    def _record_event(
+        self,
+        session_id: str,
+        kind: str,
+        payload: Dict[str, Any],
+        slot: Optional[int] = None,
+        replaces: bool = False
+    ) -> None:
+        """
+        Queue an event row, writing the session's queue in batches. An event
+        that replaces a reservoir slot overwrites that slot's row instead.
+        """
+        payload_json = dumps_json(payload, default=str)
+        pending = self._pending[session_id]
+        updates = self._pending_updates[session_id]
+        slots = self._pending_slots[session_id]
+        queued = slots.get((kind, slot)) if replaces else None
+        if queued is not None:
+            queued.payload = payload_json
+        elif replaces:
+            updates[(kind, slot)] = payload_json
+        else:
+            event = DebugEvent(
+                session_id=session_id,
+                kind=kind,
+                slot=slot,
+                payload=payload_json
+            )
+            pending.append(event)
+            if slot is not None:
+                slots[(kind, slot)] = event
+
+        now = time.monotonic()
+        since = self._pending_since.setdefault(session_id, now)
+        if (len(pending) + len(updates) >= DEBUG_EVENT_FLUSH_SIZE
+                or now - since >= DEBUG_EVENT_FLUSH_INTERVAL):
+            self.flush_events(session_id)
+
+    @_synchronized
+    def flush_events(self, session_id: Optional[str] = None) -> None:
+        """Write queued events for one session, or for all sessions"""
+        session_ids = ([session_id] if session_id
+                       else list(self._pending.keys() | self._pending_updates.keys()))
+        events = []
+        updates = []
+        for sid in session_ids:
+            events.extend(self._pending.pop(sid, ()))
+            self._pending_slots.pop(sid, None)
+            self._pending_since.pop(sid, None)
+            updates.extend(
+                {'b_session_id': sid, 'b_kind': kind, 'b_slot': slot,
+                 'b_payload': payload}
+                for (kind, slot), payload
+                in self._pending_updates.pop(sid, {}).items())
+        if not events and not updates:
+            return
+
+        self.db.add_all(events)
+        if updates:
+            # Rows for these slots were inserted by an earlier flush
+            self.db.flush()
+            table = DebugEvent.__table__
+            self.db.execute(
+                table.update().where(
+                    (table.c.session_id == bindparam('b_session_id'))
+                    & (table.c.kind == bindparam('b_kind'))
+                    & (table.c.slot == bindparam('b_slot'))
+                ).values(payload=bindparam('b_payload')),
+                updates
+            )
+        self.db.commit()
 
     def _serialize_variables(self, variables: Dict[str, Any]) -> Dict[str, Any]:
         """Serialize variables for storage (convert complex objects to strings)"""
         serialized = {}
         for key, value in variables.items():
             try:
-                if isinstance(value, (str, int, float, bool, type(None))):
-                    serialized[key] = value
-                elif isinstance(value, (list, tuple)):
-                    serialized[key] = [str(v) for v in value]
-                elif isinstance(value, dict):
-                    serialized[key] = {k: str(v) for k, v in value.items()}
-                else:
-                    serialized[key] = str(value)
+                serializer = _SERIALIZERS.get(type(value), _serialize_other)
+                serialized[key] = serializer(value)
             except Exception:
                 serialized[key] = f"<{type(value).__name__}>"
         return serialized
 
+    @_synchronized
     def capture_variable_snapshot(
         self,
         session_id: str,
@@ -113,24 +344,25 @@ class DebugSessionManager:
     ) -> None:
         """Capture a snapshot of variables at a specific point"""
         if session_id in self.active_sessions:
+            state = self.active_sessions[session_id]
+            seen = state['snapshot_count']
+            state['snapshot_count'] += 1
+            slot = _reservoir_slot(state['snapshots'], seen)
+            if slot is None:
+                return
+
             snapshot_data = {
                 'variables': self._serialize_variables(variables),
                 'context': context,
-                'timestamp': datetime.now(timezone.utc).isoformat(),
-                'memory_usage': psutil.Process().memory_info().rss
+                'timestamp': _now_iso(),
+                'memory_usage': _current_rss()
             }
-            self.active_sessions[session_id]['snapshots'].append(snapshot_data)
-
-            # Update database
-            session = self.db.query(DebugSession).filter(
-                DebugSession.id == session_id
-            ).first()
-            if session:
-                debug_data = json.loads(session.debug_data)
-                debug_data['variable_snapshots'].append(snapshot_data)
-                session.debug_data = json.dumps(debug_data)
-                self.db.commit()
+            replaces = slot < len(state['snapshots'])
+            _reservoir_put(state['snapshots'], slot, snapshot_data)
+            self._record_event(
+                session_id, 'snapshot', snapshot_data, slot, replaces)
 
+    @_synchronized
     def add_execution_trace(
         self,
         session_id: str,
@@ -139,47 +371,83 @@ class DebugSessionManager:
     ) -> None:
         """Add an event to the execution trace"""
         if session_id in self.active_sessions:
+            state = self.active_sessions[session_id]
+            seen = state['trace_count']
+            state['trace_count'] += 1
+            slot = _reservoir_slot(state['trace'], seen)
+            if slot is None:
+                return
+
             trace_event = {
                 'event': event,
                 'data': data or {},
-                'timestamp': datetime.now(timezone.utc).isoformat(),
-                'elapsed_time': time.time() - self.active_sessions[session_id]['start_time']
+                'timestamp': _now_iso(),
+                'elapsed_time': _elapsed_since(state['start_ns'])
             }
-            self.active_sessions[session_id]['trace'].append(trace_event)
+            replaces = slot < len(state['trace'])
+            _reservoir_put(state['trace'], slot, trace_event)
+            self._record_event(session_id, 'trace', trace_event, slot, replaces)
 
+    @_synchronized
     def get_session(self, session_id: str) -> Optional[DebugSession]:
         """Get a debug session by ID"""
         return self.db.query(DebugSession).filter(
             DebugSession.id == session_id
         ).first()
 
+    @_synchronized
     def get_sessions_for_execution(self, execution_id: str) -> List[DebugSession]:
         """Get all debug sessions for an execution"""
         return self.db.query(DebugSession).filter(
             DebugSession.execution_id == execution_id
         ).order_by(DebugSession.created_at.desc()).all()
 
+    @_synchronized
+    def load_debug_data(
+        self,
+        sessions: List[DebugSession]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Build each session's debug_data, including its events, by session ID"""
+        self.flush_events()
+        debug_data = {
+            session.id: loads_json(session.debug_data or '{}')
+            for session in sessions
+        }
+        if not debug_data:
+            return debug_data
+
+        events = self.db.query(DebugEvent).filter(
+            DebugEvent.session_id.in_(list(debug_data))
+        ).order_by(DebugEvent.id).all()
+        for event in events:
+            key = DEBUG_EVENT_KEYS.get(event.kind)
+            if key:
+                debug_data[event.session_id].setdefault(key, []).append(
+                    loads_json(event.payload))
+        return debug_data
+
+    @_synchronized
     def end_session(self, session_id: str) -> None:
         """End a debug session and save final data"""
         if session_id in self.active_sessions:
             session_data = self.active_sessions[session_id]
+            self.flush_events(session_id)
 
             # Update database with final data
-            session = self.db.query(DebugSession).filter(
-                DebugSession.id == session_id
-            ).first()
-            if session:
-                debug_data = json.loads(session.debug_data)
-                debug_data.update({
-                    'ended_at': datetime.now(timezone.utc).isoformat(),
-                    'total_duration': time.time() - session_data['start_time'],
-                    'total_breakpoints': len(session_data['breakpoints']),
-                    'total_snapshots': len(session_data['snapshots']),
-                    'total_trace_events': len(session_data['trace'])
-                })
-                session.debug_data = json.dumps(debug_data)
-                session.is_active = False
-                self.db.commit()
+            session = session_data['row']
+            if session not in self.db:
+                session = self.db.merge(session)
+            debug_data = session_data['debug_data']
+            debug_data.update({
+                'ended_at': _now_iso(),
+                'total_duration': _elapsed_since(session_data['start_ns']),
+                'total_breakpoints': len(session_data['breakpoints']),
+                'total_snapshots': session_data['snapshot_count'],
+                'total_trace_events': session_data['trace_count']
+            })
+            session.debug_data = dumps_json(debug_data)
+            session.is_active = False
+            self.db.commit()
 
             # Remove from active sessions
             del self.active_sessions[session_id]
@@ -193,13 +461,65 @@ class PerformanceProfiler:
         self.profiles: Dict[str, Dict[str, Any]] = {}
 
     def start_profile(self, profile_id: str) -> None:
-        """Start a new performance profile"""
-        self.profiles[profile_id] = {
-            'start_time': time.time(),
-            'start_memory': psutil.Process().memory_info().rss,
+        """Start a new performance profile and its memory sampling thread"""
+        if profile_id in self.profiles:
+            self.profiles[profile_id]['stop_sampling'].set()
+
+        start_memory = _current_rss()
+        stop_sampling = threading.Event()
+        profile = {
+            'start_ns': time.perf_counter_ns(),
+            'start_memory': start_memory,
+            'last_memory': start_memory,
+            'peak_memory': start_memory,
             'events': [],
-            'memory_samples': []
+            'memory_samples': [],
+            'memory_sample_count': 0,
+            'sample_lock': threading.Lock(),
+            'stop_sampling': stop_sampling
         }
+        sampler = threading.Thread(
+            target=self._sample_until_stopped,
+            args=(profile, stop_sampling),
+            name=f"profile-{profile_id}",
+            daemon=True
+        )
+        profile['sampler'] = sampler
+        self.profiles[profile_id] = profile
+        sampler.start()
+
+    def _sample_until_stopped(
+        self,
+        profile: Dict[str, Any],
+        stop_sampling: threading.Event
+    ) -> None:
+        """
+        Background loop taking a memory sample every MEMORY_SAMPLE_INTERVAL,
+        until the profile ends or PROFILE_MAX_SAMPLING_SECONDS have passed
+        """
+        while not stop_sampling.wait(MEMORY_SAMPLE_INTERVAL):
+            if _elapsed_since(profile['start_ns']) > PROFILE_MAX_SAMPLING_SECONDS:
+                return
+            self._append_memory_sample(profile)
+
+    def _append_memory_sample(self, profile: Dict[str, Any]) -> None:
+        """Update the running memory figures and offer a sample to the reservoir"""
+        current_memory = _current_rss()
+        with profile['sample_lock']:
+            profile['last_memory'] = current_memory
+            if current_memory > profile['peak_memory']:
+                profile['peak_memory'] = current_memory
+
+            samples = profile['memory_samples']
+            seen = profile['memory_sample_count']
+            profile['memory_sample_count'] += 1
+            slot = _reservoir_slot(samples, seen)
+            if slot is not None:
+                _reservoir_put(samples, slot, {
+                    'timestamp': time.time(),
+                    'memory_usage': current_memory,
+                    'elapsed_time': _elapsed_since(profile['start_ns'])
+                })
 
     def record_event(
         self,
@@ -207,31 +527,26 @@ class PerformanceProfiler:
         event_name: str,
         metadata: Optional[Dict[str, Any]] = None
     ) -> None:
-        """Record an event in the profile"""
+        """Record an event in the profile, using the latest memory sample"""
         if profile_id in self.profiles:
-            current_time = time.time()
-            current_memory = psutil.Process().memory_info().rss
+            profile = self.profiles[profile_id]
+            current_memory = profile['last_memory']
 
             event_data = {
                 'name': event_name,
-                'timestamp': current_time,
-                'elapsed_time': current_time - self.profiles[profile_id]['start_time'],
+                'timestamp': time.time(),
+                'elapsed_time': _elapsed_since(profile['start_ns']),
                 'memory_usage': current_memory,
-                'memory_delta': current_memory - self.profiles[profile_id]['start_memory'],
+                'memory_delta': current_memory - profile['start_memory'],
                 'metadata': metadata or {}
             }
 
-            self.profiles[profile_id]['events'].append(event_data)
+            profile['events'].append(event_data)
 
     def sample_memory(self, profile_id: str) -> None:
-        """Sample memory usage during profiling"""
+        """Take an extra memory sample outside the background schedule"""
         if profile_id in self.profiles:
-            current_memory = psutil.Process().memory_info().rss
-            self.profiles[profile_id]['memory_samples'].append({
-                'timestamp': time.time(),
-                'memory_usage': current_memory,
-                'elapsed_time': time.time() - self.profiles[profile_id]['start_time']
-            })
+            self._append_memory_sample(self.profiles[profile_id])
 
     def end_profile(self, profile_id: str) -> Dict[str, Any]:
         """End profiling and return results"""
@@ -239,17 +554,20 @@ class PerformanceProfiler:
             return {}
 
         profile_data = self.profiles[profile_id]
-        end_time = time.time()
-        end_memory = psutil.Process().memory_info().rss
+        profile_data['stop_sampling'].set()
+        profile_data['sampler'].join(timeout=1)
+        end_memory = _current_rss()
 
         results = {
             'profile_id': profile_id,
-            'total_duration': end_time - profile_data['start_time'],
+            'total_duration': _elapsed_since(profile_data['start_ns']),
             'memory_delta': end_memory - profile_data['start_memory'],
-            'peak_memory': max([s['memory_usage'] for s in profile_data['memory_samples']]) if profile_data['memory_samples'] else end_memory,
+            'peak_memory': max(profile_data['peak_memory'], end_memory),
             'total_events': len(profile_data['events']),
             'events': profile_data['events'],
-            'memory_samples': profile_data['memory_samples']
+            'memory_samples': sorted(
+                profile_data['memory_samples'],
+                key=lambda sample: sample['elapsed_time'])
         }
 
         # Clean up
@@ -261,6 +579,9 @@ class PerformanceProfiler:
 def debug_function(session_name: Optional[str] = None):
     """Decorator to add debugging to functions"""
     def decorator(func: Callable) -> Callable:
+        if DEBUG_FUNCTIONS_DISABLED:
+            return func
+
         @wraps(func)
         def wrapper(*args, **kwargs):
             # Get debug session from kwargs or create one
@@ -288,7 +609,7 @@ def debug_function(session_name: Optional[str] = None):
                     f"function_{func.__name__}_args"
                 )
 
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             try:
                 result = func(*args, **kwargs)
 
@@ -305,7 +626,7 @@ def debug_function(session_name: Optional[str] = None):
                     f"function_success",
                     {
                         'function': func.__name__,
-                        'duration': time.time() - start_time
+                        'duration': _elapsed_since(start_ns)
                     }
                 )
 
@@ -317,7 +638,7 @@ def debug_function(session_name: Optional[str] = None):
                     debug_session.id,
                     {
                         'error': str(e),
-                        'traceback': traceback.format_exc()
+                        'traceback': _Lazy(partial(_format_exception, e))
                     },
                     f"function_{func.__name__}_error"
                 )
@@ -329,7 +650,7 @@ def debug_function(session_name: Optional[str] = None):
                     {
                         'function': func.__name__,
                         'error': str(e),
-                        'duration': time.time() - start_time
+                        'duration': _elapsed_since(start_ns)
                     }
                 )
 
@@ -384,6 +705,19 @@ class TestDataGenerator:
 
         return pd.DataFrame(data)
 
+    @staticmethod
+    def _null_mask(rows: int, null_rate: float) -> np.ndarray:
+        """Draw which rows of a column are null"""
+        return np.random.random(rows) < null_rate
+
+    @staticmethod
+    def _with_nulls(values: np.ndarray, null_mask: np.ndarray) -> List[Any]:
+        """Convert generated values to a list with None at the null positions"""
+        if null_mask.any():
+            values = values.astype(object)
+            values[null_mask] = None
+        return values.tolist()
+
     @staticmethod
     def _generate_string_column(rows: int, config: Dict[str, Any]) -> List[str]:
         """Generate string column with specified characteristics"""
@@ -392,18 +726,18 @@ class TestDataGenerator:
         null_rate = config.get('null_rate', 0.1)
         prefix = config.get('prefix', '')
 
-        data = []
-        for _ in range(rows):
-            if np.random.random() < null_rate:
-                data.append(None)
-            else:
-                length = np.random.randint(min_length, max_length + 1)
-                # Generate random string
-                chars = np.random.choice(
-                    list('abcdefghijklmnopqrstuvwxyz'), length)
-                data.append(prefix + ''.join(chars))
+        null_mask = TestDataGenerator._null_mask(rows, null_rate)
+        values = np.empty(rows, dtype=object)
+
+        # Draw every character in one call, then cut the block into strings
+        lengths = np.random.randint(min_length, max_length + 1, size=int((~null_mask).sum()))
+        chars = np.random.randint(ord('a'), ord('z') + 1, size=int(lengths.sum()), dtype=np.uint8)
+        text = chars.tobytes().decode('ascii')
+        ends = np.cumsum(lengths).tolist()
+        starts = [0] + ends[:-1]
+        values[~null_mask] = [prefix + text[start:end] for start, end in zip(starts, ends)]
 
-        return data
+        return values.tolist()
 
     @staticmethod
     def _generate_int_column(rows: int, config: Dict[str, Any]) -> List[int]:
@@ -412,14 +746,9 @@ class TestDataGenerator:
         max_val = config.get('max_value', 100)
         null_rate = config.get('null_rate', 0.1)
 
-        data = []
-        for _ in range(rows):
-            if np.random.random() < null_rate:
-                data.append(None)
-            else:
-                data.append(np.random.randint(min_val, max_val + 1))
-
-        return data
+        null_mask = TestDataGenerator._null_mask(rows, null_rate)
+        values = np.random.randint(min_val, max_val + 1, size=rows)
+        return TestDataGenerator._with_nulls(values, null_mask)
 
     @staticmethod
     def _generate_float_column(rows: int, config: Dict[str, Any]) -> List[float]:
@@ -429,15 +758,9 @@ class TestDataGenerator:
         null_rate = config.get('null_rate', 0.1)
         decimal_places = config.get('decimal_places', 2)
 
-        data = []
-        for _ in range(rows):
-            if np.random.random() < null_rate:
-                data.append(None)
-            else:
-                value = np.random.uniform(min_val, max_val)
-                data.append(round(value, decimal_places))
-
-        return data
+        null_mask = TestDataGenerator._null_mask(rows, null_rate)
+        values = np.round(np.random.uniform(min_val, max_val, size=rows), decimal_places)
+        return TestDataGenerator._with_nulls(values, null_mask)
 
     @staticmethod
     def _generate_datetime_column(rows: int, config: Dict[str, Any]) -> List[str]:
@@ -448,19 +771,13 @@ class TestDataGenerator:
 
         start_timestamp = pd.Timestamp(start_date)
         end_timestamp = pd.Timestamp(end_date)
+        span_seconds = int((end_timestamp - start_timestamp).total_seconds())
 
-        data = []
-        for _ in range(rows):
-            if np.random.random() < null_rate:
-                data.append(None)
-            else:
-                random_timestamp = start_timestamp + pd.Timedelta(
-                    seconds=np.random.randint(
-                        0, int((end_timestamp - start_timestamp).total_seconds()))
-                )
-                data.append(random_timestamp.strftime('%Y-%m-%d %H:%M:%S'))
-
-        return data
+        null_mask = TestDataGenerator._null_mask(rows, null_rate)
+        offsets = np.random.randint(0, span_seconds, size=rows)
+        timestamps = start_timestamp + pd.to_timedelta(offsets, unit='s')
+        values = np.asarray(timestamps.strftime('%Y-%m-%d %H:%M:%S'), dtype=object)
+        return TestDataGenerator._with_nulls(values, null_mask)
 
     @staticmethod
     def _generate_boolean_column(rows: int, config: Dict[str, Any]) -> List[bool]:
@@ -468,14 +785,9 @@ class TestDataGenerator:
         true_rate = config.get('true_rate', 0.5)
         null_rate = config.get('null_rate', 0.0)
 
-        data = []
-        for _ in range(rows):
-            if np.random.random() < null_rate:
-                data.append(None)
-            else:
-                data.append(np.random.random() < true_rate)
-
-        return data
+        null_mask = TestDataGenerator._null_mask(rows, null_rate)
+        values = np.random.random(rows) < true_rate
+        return TestDataGenerator._with_nulls(values, null_mask)
 
     @staticmethod
     def _generate_categorical_column(rows: int, config: Dict[str, Any]) -> List[str]:
@@ -483,14 +795,12 @@ class TestDataGenerator:
         categories = config.get('categories', ['A', 'B', 'C'])
         null_rate = config.get('null_rate', 0.1)
 
-        data = []
-        for _ in range(rows):
-            if np.random.random() < null_rate:
-                data.append(None)
-            else:
-                data.append(np.random.choice(categories))
-
-        return data
+        null_mask = TestDataGenerator._null_mask(rows, null_rate)
+        # Index into an object array so categories keep their original types
+        choices = np.empty(len(categories), dtype=object)
+        choices[:] = categories
+        values = choices[np.random.randint(0, len(categories), size=rows)]
+        return TestDataGenerator._with_nulls(values, null_mask)
 
     @staticmethod
     def generate_test_scenarios() -> Dict[str, Dict[str, Any]]:
@@ -539,13 +849,16 @@ class TestDataGenerator:
 # Global instances
 debug_manager = None
 profiler = PerformanceProfiler()
+_debug_manager_lock = threading.Lock()
 
 
 def get_debug_manager(db: Session) -> DebugSessionManager:
     """Get or create debug session manager"""
     global debug_manager
     if debug_manager is None:
-        debug_manager = DebugSessionManager(db)
+        with _debug_manager_lock:
+            if debug_manager is None:
+                debug_manager = DebugSessionManager(db)
     return debug_manager
 
 
@@ -185,43 +185,51 @@ class ChunkedDataFrameReader:
         Returns:
             Combined results or generator of results
         """
-        logger.info(f"Processing DataFrame in chunks (chunk_size={self.chunk_size})")
-        MemoryMonitor.log_memory_usage("before processing")
+        chunk_results = self._iter_chunk_results(df, processor_func)
+        if not combine_results:
+            return chunk_results
         
+        # Built eagerly: a generator function would hand back an empty
+        # generator here instead of the combined list
         results = []
+        for chunk_result in chunk_results:
+            if isinstance(chunk_result, list):
+                results.extend(chunk_result)
+            else:
+                results.append(chunk_result)
+        return results
+    
+    def _iter_chunk_results(self, df: pd.DataFrame, processor_func) -> Iterator:
+        """Yield processor_func's result for each chunk of the DataFrame"""
+        logger.info(f"Processing DataFrame in chunks (chunk_size={self.chunk_size})")
+        MemoryMonitor.log_memory_usage("before processing")
         
         for i in range(0, len(df), self.chunk_size):
             chunk = df.iloc[i:i + self.chunk_size]
             logger.debug(f"Processing chunk {i//self.chunk_size + 1}")
             
-            chunk_result = processor_func(chunk)
-            
-            if combine_results:
-                if isinstance(chunk_result, list):
-                    results.extend(chunk_result)
-                else:
-                    results.append(chunk_result)
-            else:
-                yield chunk_result
+            yield processor_func(chunk)
             
             # Check memory after each chunk
             MemoryMonitor.check_memory_limit()
         
         MemoryMonitor.log_memory_usage("after processing")
-        
-        if combine_results:
-            return results
 
 
 class OptimizedDataFrameOperations:
     """Optimized pandas operations for memory efficiency"""
     
     @staticmethod
-    def optimize_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    def optimize_dtypes(df: pd.DataFrame, downcast_floats: bool = True) -> pd.DataFrame:
         """
         Optimize DataFrame dtypes to reduce memory usage.
         Downcasts numeric types and converts objects where possible.
+        Pass downcast_floats=False when float values must keep full precision,
+        e.g. before comparing them against user-supplied bounds.
         """
+        if df.empty:
+            return df
+
         logger.info("Optimizing DataFrame dtypes")
         initial_memory = df.memory_usage(deep=True).sum() / 1024 / 1024
         
@@ -229,8 +237,9 @@ class OptimizedDataFrameOperations:
         for col in df.select_dtypes(include=['int']).columns:
             df[col] = pd.to_numeric(df[col], downcast='integer')
         
-        for col in df.select_dtypes(include=['float']).columns:
-            df[col] = pd.to_numeric(df[col], downcast='float')
+        if downcast_floats:
+            for col in df.select_dtypes(include=['float']).columns:
+                df[col] = pd.to_numeric(df[col], downcast='float')
         
         # Convert object columns to category if cardinality is low
         for col in df.select_dtypes(include=['object']).columns:
@@ -17,6 +17,7 @@ from sqlalchemy.orm import Session, sessionmaker
 from app.models import Rule, RuleKind, Execution, ExecutionRule, ExecutionStatus
 from app.services.rule_engine import RuleValidator
 from app.utils.memory_optimization import MemoryMonitor
+from app.utils.rule_json import decode_rule_json
 
 logger = logging.getLogger(__name__)
 
@@ -95,9 +96,7 @@ class DependencyAnalyzer:
         """Analyze dependencies for custom rules"""
         # Check if custom rule params specify dependencies
         try:
-            import json
-            params_str = getattr(rule, 'params', None) or ''
-            params = json.loads(params_str) if params_str else {}
+            params = decode_rule_json(rule, 'params', {})
             return set(params.get('dependencies', []))
         except:
             return set()
@@ -0,0 +1,64 @@
+"""
+JSON helpers for rule attributes (params, target_columns, change_log).
+Encoding and decoding go through orjson when it is installed.
+Values are stored as JSON text, but already-decoded values are accepted too so
+callers work unchanged with in-memory rules and native JSON columns.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_json(value: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """
+    Encode a value as compact JSON text, using orjson when it is installed.
+    `default` converts objects that are not natively serializable.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            value,
+            default=default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        ).decode()
+    return json.dumps(value, separators=(",", ":"), default=default)
+
+
+def loads_json(raw: str | bytes) -> Any:
+    """Decode JSON text, using orjson when it is installed"""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity literals json.dumps can emit
+            pass
+    return json.loads(raw)
+
+
+def decode_rule_json(rule: Any, attr: str, default: Any) -> Any:
+    """
+    Decode a JSON attribute of a rule, memoizing the result on the instance.
+    The cache is keyed by the raw value so edits to the rule invalidate it.
+    The returned object is shared; copy it before mutating.
+    """
+    raw = getattr(rule, attr, None)
+    cache_attr = f"_{attr}_decoded"
+    cached = getattr(rule, cache_attr, None)
+    if cached is not None and cached[0] == raw:
+        return cached[1]
+
+    if not raw:
+        value = default
+    elif isinstance(raw, str):
+        value = loads_json(raw)
+    else:
+        value = raw
+
+    setattr(rule, cache_attr, (raw, value))
+    return value
@@ -7,14 +7,25 @@ length limits, and recursive cleaning across common container types.
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Any, Mapping
 
 CONTROL_CHARS_RE = re.compile(r"[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]")
 WHITESPACE_RE = re.compile(r"\s+")
+IDENTIFIER_DISALLOWED_RE = re.compile(r"[^a-zA-Z0-9\-_.:]")
 MAX_STRING_LENGTH = 10_000
 
+# Short strings (keys, categorical values) repeat heavily in bulk payloads,
+# so their cleaned form is memoized; longer free text is cleaned directly
+CACHED_STRING_MAX_LENGTH = 256
+STRING_CACHE_SIZE = 8192
 
-def _sanitize_string(value: str) -> str:
+# Scalar types that never need cleaning; checked by exact type so bulk JSON
+# payloads skip the container checks for every number, flag and null
+_PASSTHROUGH_TYPES = frozenset({int, float, bool, type(None)})
+
+
+def _clean_string(value: str) -> str:
     """Strip dangerous characters while keeping useful whitespace semantics."""
     # Remove ASCII control characters (NUL, bell, etc.)
     cleaned = CONTROL_CHARS_RE.sub("", value)
@@ -27,15 +38,28 @@ def _sanitize_string(value: str) -> str:
     return cleaned
 
 
+_clean_short_string = lru_cache(maxsize=STRING_CACHE_SIZE)(_clean_string)
+
+
+def _sanitize_string(value: str) -> str:
+    """Clean a string, reusing earlier results for short repeated values."""
+    if len(value) <= CACHED_STRING_MAX_LENGTH:
+        return _clean_short_string(value)
+    return _clean_string(value)
+
+
 def sanitize_input(data: Any) -> Any:
     """
     Recursively sanitize supported data structures. Unknown types are returned
     verbatim so that Pydantic or downstream validators can handle them.
     """
+    if type(data) in _PASSTHROUGH_TYPES:
+        return data
+
     if isinstance(data, str):
         return _sanitize_string(data)
 
-    if isinstance(data, Mapping):
+    if type(data) is dict or isinstance(data, Mapping):
         return {sanitize_input(key): sanitize_input(value) for key, value in data.items()}
 
     if isinstance(data, (list, tuple, set, frozenset)):
@@ -65,7 +89,7 @@ def sanitize_identifier(identifier: str, max_length: int = 255) -> str:
     """
     if not isinstance(identifier, str):
         return identifier
-    sanitized = re.sub(r"[^a-zA-Z0-9\-_.:]", "", identifier)
+    sanitized = IDENTIFIER_DISALLOWED_RE.sub("", identifier)
     return sanitized[:max_length]
 
 
@@ -11,7 +11,7 @@ from sqlalchemy.orm import Session
 from datetime import datetime, timezone
 
 from app.models import Rule, RuleKind
-from app.utils import ChunkedDataFrameReader, MemoryMonitor
+from app.utils import ChunkedDataFrameReader, MemoryMonitor, decode_rule_json
 from app.utils.logging_service import get_logger
 from .parameter_schemas import ParameterValidator
 
@@ -117,8 +117,7 @@ class BaseValidator(ABC):
         """Parse and validate rule parameters."""
         try:
             # Get parameters from rule
-            params_str = getattr(self.rule, 'params', None)
-            params = json.loads(params_str) if params_str else {}
+            params = dict(decode_rule_json(self.rule, 'params', {}))
 
             # Validate parameters against schema
             rule_kind = getattr(self.rule, 'kind', None)
@@ -152,17 +151,14 @@ class BaseValidator(ABC):
 
         if not columns:
             # Try getting from target_columns field
-            target_columns_str = getattr(self.rule, 'target_columns', None)
-            if target_columns_str:
-                try:
-                    columns = json.loads(target_columns_str) if isinstance(
-                        target_columns_str, str) else target_columns_str
-                except json.JSONDecodeError:
-                    self.logger.log_warning(
-                        f"Invalid JSON in target_columns field",
-                        rule_id=getattr(self.rule, 'id', 'unknown')
-                    )
-                    columns = []
+            try:
+                columns = decode_rule_json(self.rule, 'target_columns', [])
+            except json.JSONDecodeError:
+                self.logger.log_warning(
+                    f"Invalid JSON in target_columns field",
+                    rule_id=getattr(self.rule, 'id', 'unknown')
+                )
+                columns = []
 
         return columns if isinstance(columns, list) else []
 
@@ -49,22 +49,27 @@ class StatisticalOutlierValidator(BaseValidator):
             if len(column_data) < 3:  # Need minimum data points
                 continue
 
-            outlier_indices = self._detect_outliers(column_data)
+            outlier_mask = self._detect_outliers(column_data)
+            if not outlier_mask.any():
+                continue
 
-            for idx in outlier_indices:
+            # Take the flagged values in one slice instead of a label
+            # lookup per outlier
+            outliers = column_data[outlier_mask]
+            for idx, value in zip(outliers.index, outliers.to_numpy()):
                 issues.append({
                     'row_index': int(idx),
                     'column_name': column,
-                    'current_value': str(self.df.loc[idx, column]),
-                    'message': f'Statistical outlier detected in {column} (value: {self.df.loc[idx, column]}, method: {self.method})',
+                    'current_value': str(value),
+                    'message': f'Statistical outlier detected in {column} (value: {value}, method: {self.method})',
                     'category': 'statistical_outlier',
                     'suggested_value': None
                 })
 
         return issues
 
-    def _detect_outliers(self, data: pd.Series) -> List[int]:
-        """Detect outliers using the specified method"""
+    def _detect_outliers(self, data: pd.Series) -> np.ndarray:
+        """Detect outliers using the specified method; returns a boolean mask over data"""
         if self.method == 'iqr':
             return self._detect_iqr_outliers(data)
         elif self.method == 'zscore':
@@ -74,37 +79,34 @@ class StatisticalOutlierValidator(BaseValidator):
         elif self.method == 'one_class_svm':
             return self._detect_one_class_svm_outliers(data)
         else:
-            return []
+            return np.zeros(len(data), dtype=bool)
 
-    def _detect_iqr_outliers(self, data: pd.Series) -> List[int]:
+    def _detect_iqr_outliers(self, data: pd.Series) -> np.ndarray:
         """Detect outliers using IQR method"""
-        Q1 = data.quantile(0.25)
-        Q3 = data.quantile(0.75)
+        values = data.to_numpy(dtype=float)
+        Q1, Q3 = np.quantile(values, [0.25, 0.75])
         IQR = Q3 - Q1
         lower_bound = Q1 - self.iqr_multiplier * IQR
         upper_bound = Q3 + self.iqr_multiplier * IQR
 
-        outlier_mask = (data < lower_bound) | (data > upper_bound)
-        return data[outlier_mask].index.tolist()
+        return (values < lower_bound) | (values > upper_bound)
 
-    def _detect_zscore_outliers(self, data: pd.Series) -> List[int]:
+    def _detect_zscore_outliers(self, data: pd.Series) -> np.ndarray:
         """Detect outliers using Z-score method"""
-        z_scores = np.abs(stats.zscore(data))
-        outlier_mask = z_scores > self.threshold
-        return data[outlier_mask].index.tolist()
+        z_scores = np.abs(stats.zscore(data.to_numpy(dtype=float)))
+        return z_scores > self.threshold
 
-    def _detect_isolation_forest_outliers(self, data: pd.Series) -> List[int]:
+    def _detect_isolation_forest_outliers(self, data: pd.Series) -> np.ndarray:
         """Detect outliers using Isolation Forest"""
         try:
             clf = IsolationForest(
                 contamination=self.contamination, random_state=42)
             outlier_pred = clf.fit_predict(data.values.reshape(-1, 1))
-            outlier_mask = outlier_pred == -1
-            return data[outlier_mask].index.tolist()
+            return outlier_pred == -1
         except Exception:
-            return []
+            return np.zeros(len(data), dtype=bool)
 
-    def _detect_one_class_svm_outliers(self, data: pd.Series) -> List[int]:
+    def _detect_one_class_svm_outliers(self, data: pd.Series) -> np.ndarray:
         """Detect outliers using One-Class SVM"""
         try:
             # Scale the data
@@ -113,10 +115,9 @@ class StatisticalOutlierValidator(BaseValidator):
 
             clf = OneClassSVM(nu=self.contamination)
             outlier_pred = clf.fit_predict(scaled_data)
-            outlier_mask = outlier_pred == -1
-            return data[outlier_mask].index.tolist()
+            return outlier_pred == -1
         except Exception:
-            return []
+            return np.zeros(len(data), dtype=bool)
 
 
 class DistributionCheckValidator(BaseValidator):
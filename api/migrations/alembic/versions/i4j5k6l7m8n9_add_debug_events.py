@@ -0,0 +1,56 @@
+"""add debug events
+
+Revision ID: i4j5k6l7m8n9
+Revises: h3i4j5k6l7m8
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'i4j5k6l7m8n9'
+down_revision = 'h3i4j5k6l7m8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # debug_sessions was only created by the backup advanced-features
+    # migrations, so create it here when missing (IF NOT EXISTS for idempotency)
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS debug_sessions (
+            id VARCHAR NOT NULL,
+            execution_id VARCHAR NOT NULL REFERENCES executions (id),
+            session_name VARCHAR NOT NULL,
+            debug_data TEXT,
+            breakpoints TEXT,
+            variable_snapshots TEXT,
+            created_by VARCHAR NOT NULL REFERENCES users (id),
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+            is_active BOOLEAN,
+            PRIMARY KEY (id)
+        )
+    """)
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_debug_sessions_id ON debug_sessions (id)")
+
+    # Breakpoints, snapshots and traces are stored one row per event
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS debug_events (
+            id SERIAL NOT NULL,
+            session_id VARCHAR NOT NULL REFERENCES debug_sessions (id) ON DELETE CASCADE,
+            kind VARCHAR NOT NULL,
+            slot INTEGER,
+            payload TEXT,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+            PRIMARY KEY (id)
+        )
+    """)
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_debug_events_session_id ON debug_events (session_id)")
+
+
+def downgrade() -> None:
+    # debug_sessions may predate this revision, so only debug_events is dropped
+    op.execute("DROP INDEX IF EXISTS ix_debug_events_session_id")
+    op.execute("DROP TABLE IF EXISTS debug_events")
@@ -0,0 +1,20 @@
+import contextlib
+import os
+import sys
+
+import pytest
+
+# The application package lives under api/ and reads its settings at import
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), "api"))
+
+
+@pytest.fixture(autouse=True)
+def unlimited_sandbox(monkeypatch):
+    # The sandbox caps RLIMIT_AS for the whole process, which the test process
+    # (with pandas and scikit-learn loaded) already exceeds
+    from app.security.sandbox import SecureExecutor
+
+    monkeypatch.setattr(
+        SecureExecutor, "_resource_limits", lambda self: contextlib.nullcontext()
+    )
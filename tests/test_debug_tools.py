@@ -0,0 +1,66 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models import DebugEvent
+from app.utils import debug_tools
+from app.utils.debug_tools import DebugSessionManager
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    # A small reservoir and flush size so slots are overwritten both while
+    # queued and after their rows have been written
+    monkeypatch.setattr(debug_tools, "DEBUG_RESERVOIR_SIZE", 5)
+    monkeypatch.setattr(debug_tools, "DEBUG_EVENT_FLUSH_SIZE", 3)
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine, expire_on_commit=False)()
+    yield DebugSessionManager(session)
+    session.close()
+
+
+def stored_events(manager, session_id, kind):
+    return (
+        manager.db.query(DebugEvent)
+        .filter(DebugEvent.session_id == session_id, DebugEvent.kind == kind)
+        .order_by(DebugEvent.slot)
+        .all()
+    )
+
+
+def test_reservoir_overwrites_slots_instead_of_adding_rows(manager):
+    session = manager.create_debug_session("exec", "reservoir", "user")
+    for i in range(200):
+        manager.add_execution_trace(session.id, "step", {"i": i})
+        manager.capture_variable_snapshot(session.id, {"i": i})
+
+    state = manager.active_sessions[session.id]
+    assert state["trace_count"] == 200
+    assert state["snapshot_count"] == 200
+    assert len(state["trace"]) == 5
+    assert len(state["snapshots"]) == 5
+    # Later events must have replaced some of the first five
+    assert [e["data"]["i"] for e in state["trace"]] != [0, 1, 2, 3, 4]
+
+    debug_data = manager.load_debug_data([session])[session.id]
+    assert debug_data["execution_trace"] == state["trace"]
+    assert debug_data["variable_snapshots"] == state["snapshots"]
+
+    for kind in ("trace", "snapshot"):
+        events = stored_events(manager, session.id, kind)
+        assert [event.slot for event in events] == [0, 1, 2, 3, 4]
+
+
+def test_reservoir_keeps_every_event_below_its_size(manager):
+    session = manager.create_debug_session("exec", "small", "user")
+    for i in range(4):
+        manager.add_execution_trace(session.id, "step", {"i": i})
+    manager.end_session(session.id)
+
+    events = stored_events(manager, session.id, "trace")
+    assert [event.slot for event in events] == [0, 1, 2, 3]
+    debug_data = manager.load_debug_data([session])[session.id]
+    assert [e["data"]["i"] for e in debug_data["execution_trace"]] == [0, 1, 2, 3]
+    assert debug_data["total_trace_events"] == 4
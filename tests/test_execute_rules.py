@@ -0,0 +1,163 @@
+import json
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models import (
+    Criticality,
+    ExecutionRule,
+    ExecutionStatus,
+    Issue,
+    Rule,
+    RuleKind,
+)
+from app.services import rule_engine
+from app.services.rule_engine import RuleEngineService
+
+FRAME = pd.DataFrame(
+    {
+        "name": ["Alice", None, "Zoë", "x1", None, "Ωmega", "bob", ""],
+        "status": ["active", "Active", None, "closed", "pending", "actíve", 1, ""],
+        "a": [1, 2, np.nan, 4, 5, 1, 0, 3],
+        "b": [1.0, np.nan, 2.5, 0, 1, "3", "x", None],
+    }
+)
+
+RULES = [
+    ("missing", RuleKind.missing_data, Criticality.high, ["name", "b"], {}),
+    (
+        "statuses",
+        RuleKind.value_list,
+        Criticality.low,
+        ["status"],
+        {"allowed_values": ["active", "closed"]},
+    ),
+    (
+        "short",
+        RuleKind.length_range,
+        Criticality.medium,
+        ["name"],
+        {"min_length": 3, "max_length": 4},
+    ),
+    (
+        "depends",
+        RuleKind.cross_field,
+        Criticality.critical,
+        ["a", "b"],
+        {
+            "rules": [
+                {"type": "dependency", "dependent_field": "b", "required_field": "a"}
+            ]
+        },
+    ),
+    (
+        "positive",
+        RuleKind.custom,
+        Criticality.medium,
+        ["a"],
+        {"expression": "a > 1", "error_message": "a must be above 1"},
+    ),
+    # Fails the pre-flight check: no target columns
+    ("unconfigured", RuleKind.missing_data, Criticality.low, [], {}),
+]
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine, expire_on_commit=False)()
+    for name, kind, criticality, columns, params in RULES:
+        session.add(
+            Rule(
+                id=name,
+                organization_id="org",
+                name=name,
+                kind=kind,
+                criticality=criticality,
+                target_columns=json.dumps(columns),
+                params=json.dumps(params),
+                created_by="user",
+                is_active=True,
+            )
+        )
+    session.commit()
+    yield session
+    session.close()
+
+
+def expected_summary(service, rules):
+    """Summary computed the way the original per-issue loops did"""
+    issues = []
+    for rule in rules:
+        if rule.id == "unconfigured":
+            continue
+        validator_class = service.validators[rule.kind]
+        for issue in validator_class(rule, FRAME, None).validate():
+            issues.append(dict(issue, severity=rule.criticality.value))
+
+    by_severity, by_category = {}, {}
+    for issue in issues:
+        by_severity[issue["severity"]] = by_severity.get(issue["severity"], 0) + 1
+        category = issue["category"] or "unknown"
+        by_category[category] = by_category.get(category, 0) + 1
+
+    return {
+        "rows_affected": len({issue["row_index"] for issue in issues}),
+        "columns_affected": len({issue["column_name"] for issue in issues}),
+        "total_issues": len(issues),
+        "issues_by_severity": by_severity,
+        "issues_by_category": by_category,
+    }
+
+
+@pytest.mark.parametrize("batch_size", [3, 5000])
+def test_execution_summary_matches_per_issue_counts(db, monkeypatch, batch_size):
+    monkeypatch.setattr(rule_engine, "ISSUE_INSERT_BATCH_SIZE", batch_size)
+    service = RuleEngineService(db)
+    monkeypatch.setattr(service, "_load_dataset_as_dataframe", lambda version: FRAME)
+    expected = expected_summary(service, db.query(Rule).all())
+
+    execution = service.execute_rules_on_dataset(
+        SimpleNamespace(id="version"), None, SimpleNamespace(id="user")
+    )
+    summary = json.loads(execution.summary)
+
+    assert execution.status == ExecutionStatus.partially_succeeded
+    assert execution.total_rows == len(FRAME)
+    assert execution.rows_affected == expected["rows_affected"]
+    assert execution.columns_affected == expected["columns_affected"]
+    assert summary == {
+        "total_issues": expected["total_issues"],
+        "successful_rules": 5,
+        "failed_rules": 1,
+        "issues_by_severity": expected["issues_by_severity"],
+        "issues_by_category": expected["issues_by_category"],
+    }
+    assert db.query(Issue).count() == expected["total_issues"]
+
+
+def test_execution_rule_stats_match_stored_issues(db, monkeypatch):
+    monkeypatch.setattr(rule_engine, "ISSUE_INSERT_BATCH_SIZE", 2)
+    service = RuleEngineService(db)
+    monkeypatch.setattr(service, "_load_dataset_as_dataframe", lambda version: FRAME)
+
+    execution = service.execute_rules_on_dataset(
+        SimpleNamespace(id="version"), None, SimpleNamespace(id="user")
+    )
+
+    execution_rules = db.query(ExecutionRule).filter_by(execution_id=execution.id)
+    for execution_rule in execution_rules:
+        issues = db.query(Issue).filter_by(rule_id=execution_rule.rule_id).all()
+        if execution_rule.rule_id == "unconfigured":
+            assert execution_rule.note == "Rule has no target columns configured"
+            assert not issues
+            continue
+        assert execution_rule.error_count == len(issues)
+        assert execution_rule.rows_flagged == len({i.row_index for i in issues})
+        assert execution_rule.cols_flagged == len({i.column_name for i in issues})
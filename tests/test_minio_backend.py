@@ -0,0 +1,74 @@
+import io
+
+import pytest
+
+pytest.importorskip("boto3")
+
+from botocore.exceptions import ClientError  # noqa: E402
+
+from app.storage.minio_backend import MinioStorage  # noqa: E402
+
+
+def client_error(code, operation):
+    return ClientError({"Error": {"Code": code, "Message": code}}, operation)
+
+
+class FakeS3Client:
+    """In-memory stand-in for the S3 client calls the backend makes"""
+
+    def __init__(self, buckets=()):
+        self.buckets = set(buckets)
+        self.objects = {}
+        self.head_bucket_calls = 0
+
+    def head_bucket(self, Bucket):
+        self.head_bucket_calls += 1
+        if Bucket not in self.buckets:
+            raise client_error("404", "HeadBucket")
+
+    def create_bucket(self, Bucket):
+        self.buckets.add(Bucket)
+
+    def put_object(self, Bucket, Key, Body, **extra_args):
+        if Bucket not in self.buckets:
+            raise client_error("NoSuchBucket", "PutObject")
+        self.objects[Bucket, Key] = Body
+
+    def upload_fileobj(self, fileobj, bucket, key, **kwargs):
+        data = fileobj.read()
+        if bucket not in self.buckets:
+            raise client_error("NoSuchBucket", "PutObject")
+        self.objects[bucket, key] = data
+
+
+@pytest.fixture
+def storage():
+    backend = MinioStorage("http://minio.test:9000", "key", "secret")
+    backend.client = FakeS3Client()
+    return backend
+
+
+def test_known_bucket_skips_head_bucket(storage):
+    storage.upload_file("data", "a.csv", b"a")
+    storage.upload_file("data", "b.csv", b"b")
+
+    assert storage.client.head_bucket_calls == 1
+
+
+def test_upload_recreates_bucket_deleted_after_it_was_cached(storage):
+    storage.upload_file("data", "a.csv", b"a")
+    storage.client.buckets.clear()
+
+    storage.upload_file("data", "b.csv", b"b")
+
+    assert "data" in storage.client.buckets
+    assert storage.client.objects["data", "b.csv"] == b"b"
+
+
+def test_stream_upload_is_rewound_before_the_retry(storage):
+    storage.upload_file("data", "a.csv", b"a")
+    storage.client.buckets.clear()
+
+    storage.upload_stream("data", "b.csv", io.BytesIO(b"payload"), 7)
+
+    assert storage.client.objects["data", "b.csv"] == b"payload"
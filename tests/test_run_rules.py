@@ -0,0 +1,110 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pandas as pd
+
+from app.models import RuleKind
+from app.services.rule_engine import RuleEngineService
+
+
+class RecordingValidator:
+    """Stand-in validator that records the thread it ran on"""
+
+    def __init__(self, rule, df, db):
+        self.rule = rule
+
+    def validate(self):
+        time.sleep(self.rule.delay)
+        return [{"rule": self.rule.name, "thread": threading.get_ident()}]
+
+
+class FailingValidator(RecordingValidator):
+    def validate(self):
+        raise RuntimeError(f"{self.rule.name} failed")
+
+
+def make_rule(name, kind, delay=0.0):
+    return SimpleNamespace(name=name, kind=kind, delay=delay)
+
+
+def make_service(validators):
+    service = RuleEngineService(db=None)
+    service.validators = validators
+    return service
+
+
+def test_results_are_yielded_as_rules_finish_with_their_position():
+    kinds = [
+        RuleKind.missing_data,
+        RuleKind.regex,
+        RuleKind.value_list,
+        RuleKind.length_range,
+    ]
+    service = make_service({kind: RecordingValidator for kind in kinds})
+    # Earlier rules sleep longer so the pool finishes them last
+    rules = [
+        make_rule(f"rule-{i}", kind, delay=0.05 * (len(kinds) - i))
+        for i, kind in enumerate(kinds)
+    ]
+
+    results = list(service.run_rules(rules, pd.DataFrame(), max_workers=len(rules)))
+
+    assert [position for position, _, _, _ in results] == [3, 2, 1, 0]
+    for position, rule, issues, error in results:
+        assert rule is rules[position]
+        assert issues[0]["rule"] == rule.name
+        assert error is None
+
+
+def test_main_thread_kinds_run_on_calling_thread():
+    kinds = [RuleKind.custom, RuleKind.ml_anomaly, RuleKind.regex]
+    service = make_service({kind: RecordingValidator for kind in kinds})
+    rules = [make_rule(kind.value, kind) for kind in kinds]
+
+    results = service.run_rules(rules, pd.DataFrame(), max_workers=2)
+    threads = {rule.kind: issues[0]["thread"] for _, rule, issues, _ in results}
+
+    caller = threading.get_ident()
+    assert threads[RuleKind.custom] == caller
+    assert threads[RuleKind.ml_anomaly] == caller
+    assert threads[RuleKind.regex] != caller
+
+
+def test_failing_validator_does_not_stop_other_rules():
+    service = make_service(
+        {
+            RuleKind.missing_data: RecordingValidator,
+            RuleKind.regex: FailingValidator,
+            RuleKind.custom: RecordingValidator,
+        }
+    )
+    rules = [
+        make_rule("before", RuleKind.missing_data),
+        make_rule("broken", RuleKind.regex),
+        make_rule("after", RuleKind.custom),
+    ]
+
+    results = sorted(service.run_rules(rules, pd.DataFrame()), key=lambda r: r[0])
+
+    _, rule, issues, error = results[1]
+    assert rule is rules[1]
+    assert issues is None
+    assert isinstance(error, RuntimeError)
+    assert [issues[0]["rule"] for _, _, issues, _ in (results[0], results[2])] == [
+        "before",
+        "after",
+    ]
+    assert results[0][3] is None and results[2][3] is None
+
+
+def test_unknown_rule_kind_is_reported_as_error():
+    service = make_service({})
+    rule = make_rule("unknown", RuleKind.regex)
+
+    [(position, returned, issues, error)] = service.run_rules([rule], pd.DataFrame())
+
+    assert position == 0
+    assert returned is rule
+    assert issues is None
+    assert isinstance(error, ValueError)
@@ -0,0 +1,103 @@
+import pytest
+
+from app.storage.base import StorageBackend
+
+
+class MemoryStorage(StorageBackend):
+    """Backend implementing only the abstract methods, so the base class
+    fallbacks are what get exercised"""
+
+    def __init__(self, objects=None):
+        self.objects = dict(objects or {})
+        self.calls = []
+
+    def upload_file(self, bucket, key, data, content_type="", metadata=None):
+        self.objects[bucket, key] = data
+        return f"{bucket}/{key}"
+
+    def download_file(self, bucket, key):
+        self.calls.append(("download_file", key))
+        try:
+            return self.objects[bucket, key]
+        except KeyError:
+            raise FileNotFoundError(key) from None
+
+    def delete_file(self, bucket, key):
+        self.calls.append(("delete_file", key))
+        return self.objects.pop((bucket, key), None) is not None
+
+    def list_files(self, bucket, prefix="", max_results=1000):
+        keys = [k for b, k in self.objects if b == bucket and k.startswith(prefix)]
+        return keys[:max_results]
+
+    def get_signed_url(self, bucket, key, expiration=3600, method="GET"):
+        return f"memory://{bucket}/{key}"
+
+    def file_exists(self, bucket, key):
+        return (bucket, key) in self.objects
+
+    def get_file_metadata(self, bucket, key):
+        self.calls.append(("get_file_metadata", key))
+        if (bucket, key) not in self.objects:
+            raise FileNotFoundError(key)
+        return {"size": len(self.objects[bucket, key])}
+
+    def copy_file(self, source_bucket, source_key, dest_bucket, dest_key):
+        self.objects[dest_bucket, dest_key] = self.objects[source_bucket, source_key]
+        return True
+
+
+def test_stat_returns_metadata_in_one_call():
+    storage = MemoryStorage({("b", "k"): b"abc"})
+    assert storage.stat("b", "k") == {"size": 3}
+    assert storage.calls == [("get_file_metadata", "k")]
+
+
+def test_stat_returns_none_for_missing_file():
+    assert MemoryStorage().stat("b", "missing") is None
+
+
+def test_stat_propagates_other_errors():
+    storage = MemoryStorage()
+    storage.get_file_metadata = lambda bucket, key: 1 / 0
+    with pytest.raises(ZeroDivisionError):
+        storage.stat("b", "k")
+
+
+def test_delete_many_reports_each_key_once():
+    storage = MemoryStorage({("b", "x"): b"1", ("b", "y"): b"2", ("c", "x"): b"3"})
+    result = storage.delete_many("b", ["x", "y", "missing", "x"])
+    assert result == {"x": True, "y": True, "missing": False}
+    assert sorted(storage.calls) == sorted(
+        [("delete_file", "x"), ("delete_file", "y"), ("delete_file", "missing")]
+    )
+    assert storage.objects == {("c", "x"): b"3"}
+
+
+def test_delete_many_handles_single_and_empty_key_lists():
+    storage = MemoryStorage({("b", "x"): b"1"})
+    assert storage.delete_many("b", []) == {}
+    assert storage.delete_many("b", ["x"]) == {"x": True}
+    assert storage.calls == [("delete_file", "x")]
+
+
+@pytest.mark.parametrize("size", [0, 1, 4, 5, 11])
+def test_download_stream_yields_slices_of_the_file(size):
+    data = bytes(range(size))
+    storage = MemoryStorage({("b", "k"): data})
+    chunks = list(storage.download_stream("b", "k", chunk_size=4))
+    assert b"".join(chunks) == data
+    assert all(len(chunk) == 4 for chunk in chunks[:-1])
+    assert all(0 < len(chunk) <= 4 for chunk in chunks)
+
+
+def test_download_stream_raises_for_missing_file():
+    with pytest.raises(FileNotFoundError):
+        list(MemoryStorage().download_stream("b", "missing"))
+
+
+def test_download_stream_prefetched_matches_download_stream():
+    data = bytes(range(256)) * 10
+    storage = MemoryStorage({("b", "k"): data})
+    chunks = list(storage.download_stream_prefetched("b", "k", chunk_size=100))
+    assert chunks == list(storage.download_stream("b", "k", chunk_size=100))
@@ -0,0 +1,571 @@
+"""
+Validator output on a small frame with nulls, non-ASCII text and mixed-type
+columns. The expected issues are those of the original row-by-row validators,
+except where noted on the case.
+"""
+
+import json
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.rule_engine import (
+    CharRestrictionValidator,
+    CrossFieldValidator,
+    CustomValidator,
+    LengthRangeValidator,
+    MissingDataValidator,
+    RegexValidator,
+    RuleEngineService,
+    RuleValidator,
+    StandardizationValidator,
+    ValueListValidator,
+)
+from app.utils import ChunkedDataFrameReader
+
+FRAME = pd.DataFrame(
+    {
+        "name": [
+            "Alice",
+            "bob",
+            None,
+            "Zoë",
+            "İstanbul",
+            "a b",
+            "x1",
+            "  ",
+            "Ωmega",
+            "Al\xa0ice",
+        ],
+        "email": [
+            "a@b.co",
+            "bad",
+            None,
+            "ÉLODIE@Example.FR",
+            " x@y.org ",
+            "a@@b.c",
+            "no@dot",
+            "İ@x.io",
+            "a b@c.de",
+            "u@d.com\xa0",
+        ],
+        "phone": [
+            "+15551234567",
+            "5551234567",
+            None,
+            "+1 555",
+            15551234567,
+            "+33 1 23 45 67 89",
+            "",
+            "+٣٣١٢٣٤٥٦٧٨",
+            1.5,
+            "+1-555-123-4567",
+        ],
+        "code": ["A1", "b2", None, "é3", 42, 3.5, "C", "", "ÀB", "z9z"],
+        "mixed": [1, "2", None, 3.0, "x", True, "4.5", "", -1, "1e3"],
+        "a": [1, 2, np.nan, 4, 5, 1, 0, 3, 2, 1],
+        "b": [1.0, np.nan, 2.5, 0, 1, "3", "x", None, 2, 2],
+        "total": [2, 2, 3, 4, 7, 4, 0, np.nan, 4, 9],
+        "date": [
+            "2024-01-31",
+            "31/01/2024",
+            None,
+            "2024-1-5",
+            "2024-02-30",
+            20240101,
+            "2024-12-01",
+            "",
+            "2023-07-04 ",
+            "2024-03-15",
+        ],
+        "status": [
+            "active",
+            "Active",
+            None,
+            "ACTIVE",
+            "closed",
+            "actíve",
+            "pending",
+            "",
+            1,
+            "closed",
+        ],
+    }
+)
+
+CASES = {
+    "missing_data": (
+        MissingDataValidator,
+        {"columns": ["name", "a", "b", "status"], "default_value": "n/a"},
+    ),
+    "date": (
+        StandardizationValidator,
+        {"columns": ["date"], "type": "date", "format": "%Y-%m-%d"},
+    ),
+    "phone": (StandardizationValidator, {"columns": ["phone"], "type": "phone"}),
+    # Stricter than the original '@' and domain-dot check: embedded whitespace
+    # and repeated '@' are rejected too
+    "email": (StandardizationValidator, {"columns": ["email"], "type": "email"}),
+    "value_list_cs": (
+        ValueListValidator,
+        {"columns": ["status"], "allowed_values": ["active", "closed"]},
+    ),
+    "value_list_ci": (
+        ValueListValidator,
+        {
+            "columns": ["status"],
+            "allowed_values": ["Active", "closed"],
+            "case_sensitive": False,
+        },
+    ),
+    "length_range": (
+        LengthRangeValidator,
+        {"columns": ["name", "code", "mixed"], "min_length": 2, "max_length": 4},
+    ),
+    "alphabetic": (
+        CharRestrictionValidator,
+        {"columns": ["name", "status"], "type": "alphabetic"},
+    ),
+    "numeric": (
+        CharRestrictionValidator,
+        {"columns": ["mixed", "phone"], "type": "numeric"},
+    ),
+    "alphanumeric": (
+        CharRestrictionValidator,
+        {"columns": ["code", "name"], "type": "alphanumeric"},
+    ),
+    "dependency": (
+        CrossFieldValidator,
+        {
+            "rules": [
+                {"type": "dependency", "dependent_field": "b", "required_field": "a"}
+            ]
+        },
+    ),
+    "mutual_exclusion": (
+        CrossFieldValidator,
+        {"rules": [{"type": "mutual_exclusion", "fields": ["name", "b", "status"]}]},
+    ),
+    "conditional_value": (
+        CrossFieldValidator,
+        {
+            "rules": [
+                {
+                    "type": "conditional",
+                    "condition_field": "a",
+                    "condition_value": "1.0",
+                    "target_field": "status",
+                    "expected_value": "active",
+                }
+            ]
+        },
+    ),
+    "conditional_present": (
+        CrossFieldValidator,
+        {
+            "rules": [
+                {
+                    "type": "conditional",
+                    "condition_field": "a",
+                    "condition_value": "3.0",
+                    "target_field": "total",
+                }
+            ]
+        },
+    ),
+    # Whole sums are shown as ints (6, not 6.0) even when a column has nulls
+    "sum_total": (
+        CrossFieldValidator,
+        {
+            "rules": [
+                {"type": "sum_check", "sum_fields": ["a", "b"], "total_field": "total"}
+            ]
+        },
+    ),
+    "sum_expected": (
+        CrossFieldValidator,
+        {
+            "rules": [
+                {
+                    "type": "sum_check",
+                    "sum_fields": ["a", "b", "mixed"],
+                    "expected_total": 3,
+                }
+            ]
+        },
+    ),
+    "regex": (
+        RegexValidator,
+        {
+            "columns": ["code", "email"],
+            "patterns": [
+                {"name": "word", "pattern": r"^\w+$"},
+                {"name": "digit", "pattern": r"\d", "must_match": False},
+                {"name": "bad", "pattern": "("},
+            ],
+        },
+    ),
+    # The original per-row path left bare column names unbound and flagged
+    # every row; these are the rows that actually fail the expression
+    "custom_expr": (
+        CustomValidator,
+        {"columns": ["a"], "type": "python_expression", "expression": "a > 1"},
+    ),
+    "custom_row": (
+        CustomValidator,
+        {
+            "columns": ["status"],
+            "type": "python_expression",
+            "expression": "status is not None",
+        },
+    ),
+    "lookup": (
+        CustomValidator,
+        {
+            "type": "lookup_table",
+            "lookup_column": "status",
+            "target_column": "code",
+            "lookup_table": {"active": "A1", "closed": "z9z", "1": "ÀB", "ACTIVE": "x"},
+        },
+    ),
+}
+
+# case -> (sorted (row_index, column_name, current_value, suggested_value),
+#          distinct messages, distinct categories)
+EXPECTED = {
+    "missing_data": (
+        [
+            (1, "b", None, "n/a"),
+            (2, "a", None, "n/a"),
+            (2, "name", None, "n/a"),
+            (2, "status", None, "n/a"),
+            (7, "b", None, "n/a"),
+        ],
+        [
+            "Missing value in required field a",
+            "Missing value in required field b",
+            "Missing value in required field name",
+            "Missing value in required field status",
+        ],
+        ["missing_data"],
+    ),
+    "date": (
+        [
+            (1, "date", "31/01/2024", ""),
+            (3, "date", "2024-1-5", "2024-01-05"),
+            (4, "date", "2024-02-30", ""),
+            (5, "date", "20240101", ""),
+            (7, "date", "", ""),
+            (8, "date", "2023-07-04 ", ""),
+        ],
+        ["Date format should be %Y-%m-%d", "Invalid date format, expected %Y-%m-%d"],
+        ["date_standardization"],
+    ),
+    "phone": (
+        [
+            (1, "phone", "5551234567", "+1-5551234567"),
+            (3, "phone", "+1 555", "+1-+1 555"),
+            (4, "phone", "15551234567", "+1-15551234567"),
+            (6, "phone", "", "+1-"),
+            (8, "phone", "1.5", "+1-1.5"),
+        ],
+        ["Phone format should be +1-XXX-XXX-XXXX"],
+        ["phone_standardization"],
+    ),
+    "email": (
+        [
+            (1, "email", "bad", "bad"),
+            (5, "email", "a@@b.c", "a@@b.c"),
+            (6, "email", "no@dot", "no@dot"),
+            (8, "email", "a b@c.de", "a b@c.de"),
+        ],
+        ["Invalid email format"],
+        ["email_standardization"],
+    ),
+    "value_list_cs": (
+        [
+            (1, "status", "Active", "active"),
+            (3, "status", "ACTIVE", "active"),
+            (5, "status", "actíve", "active"),
+            (6, "status", "pending", "active"),
+            (7, "status", "", "active"),
+            (8, "status", "1", "active"),
+        ],
+        ["Value must be one of: active, closed"],
+        ["value_list"],
+    ),
+    "value_list_ci": (
+        [
+            (5, "status", "actíve", "Active"),
+            (6, "status", "pending", "Active"),
+            (7, "status", "", "Active"),
+            (8, "status", "1", "Active"),
+        ],
+        ["Value must be one of: Active, closed"],
+        ["value_list"],
+    ),
+    "length_range": (
+        [
+            (0, "mixed", "1", ""),
+            (0, "name", "Alice", "Alic"),
+            (1, "mixed", "2", ""),
+            (4, "mixed", "x", ""),
+            (4, "name", "İstanbul", "İsta"),
+            (6, "code", "C", ""),
+            (7, "code", "", ""),
+            (7, "mixed", "", ""),
+            (8, "name", "Ωmega", "Ωmeg"),
+            (9, "name", "Al\xa0ice", "Al\xa0i"),
+        ],
+        ["Value too long. Maximum length: 4", "Value too short. Minimum length: 2"],
+        ["length_range"],
+    ),
+    "alphabetic": (
+        [
+            (6, "name", "x1", ""),
+            (7, "name", "  ", ""),
+            (7, "status", "", ""),
+            (8, "status", "1", ""),
+            (9, "name", "Al\xa0ice", ""),
+        ],
+        ["Value must contain only alphabetic characters"],
+        ["char_restriction"],
+    ),
+    "numeric": (
+        [
+            (0, "phone", "+15551234567", ""),
+            (3, "phone", "+1 555", ""),
+            (4, "mixed", "x", ""),
+            (5, "mixed", "True", ""),
+            (5, "phone", "+33 1 23 45 67 89", ""),
+            (6, "phone", "", ""),
+            (7, "mixed", "", ""),
+            (7, "phone", "+٣٣١٢٣٤٥٦٧٨", ""),
+            (9, "mixed", "1e3", ""),
+            (9, "phone", "+1-555-123-4567", ""),
+        ],
+        ["Value must contain only numeric characters"],
+        ["char_restriction"],
+    ),
+    "alphanumeric": (
+        [
+            (5, "code", "3.5", ""),
+            (7, "code", "", ""),
+            (7, "name", "  ", ""),
+            (9, "name", "Al\xa0ice", ""),
+        ],
+        ["Value must contain only alphanumeric characters"],
+        ["char_restriction"],
+    ),
+    "dependency": (
+        [(1, "b", None, ""), (7, "b", None, "")],
+        ["b is required when a has a value"],
+        ["cross_field_dependency"],
+    ),
+    "mutual_exclusion": (
+        [
+            (
+                0,
+                "name, b, status",
+                "Multiple fields filled: name, b, status",
+                "Only one field should have a value",
+            ),
+            (
+                1,
+                "name, status",
+                "Multiple fields filled: name, status",
+                "Only one field should have a value",
+            ),
+            (
+                3,
+                "name, b, status",
+                "Multiple fields filled: name, b, status",
+                "Only one field should have a value",
+            ),
+            (
+                4,
+                "name, b, status",
+                "Multiple fields filled: name, b, status",
+                "Only one field should have a value",
+            ),
+            (
+                5,
+                "name, b, status",
+                "Multiple fields filled: name, b, status",
+                "Only one field should have a value",
+            ),
+            (
+                6,
+                "name, b, status",
+                "Multiple fields filled: name, b, status",
+                "Only one field should have a value",
+            ),
+            (
+                7,
+                "name, status",
+                "Multiple fields filled: name, status",
+                "Only one field should have a value",
+            ),
+            (
+                8,
+                "name, b, status",
+                "Multiple fields filled: name, b, status",
+                "Only one field should have a value",
+            ),
+            (
+                9,
+                "name, b, status",
+                "Multiple fields filled: name, b, status",
+                "Only one field should have a value",
+            ),
+        ],
+        ["Fields name, b, status are mutually exclusive"],
+        ["cross_field_mutual_exclusion"],
+    ),
+    "conditional_value": (
+        [(5, "status", "actíve", "active"), (9, "status", "closed", "active")],
+        ["When a is 1.0, status must be active"],
+        ["cross_field_conditional"],
+    ),
+    "conditional_present": (
+        [(7, "total", None, "")],
+        ["When a is 3.0, total must have a value"],
+        ["cross_field_conditional"],
+    ),
+    "sum_total": (
+        [
+            (2, "total", "3.0", "2.5"),
+            (4, "total", "7.0", "6"),
+            (9, "total", "9.0", "3"),
+        ],
+        [
+            "Sum of a, b (2.5) does not match total",
+            "Sum of a, b (3) does not match total",
+            "Sum of a, b (6) does not match total",
+        ],
+        ["cross_field_sum_check"],
+    ),
+    "sum_expected": (
+        [
+            (1, "a, b, mixed", "4", "3"),
+            (2, "a, b, mixed", "2.5", "3"),
+            (3, "a, b, mixed", "7", "3"),
+            (4, "a, b, mixed", "6", "3"),
+            (5, "a, b, mixed", "5", "3"),
+            (6, "a, b, mixed", "4.5", "3"),
+            (9, "a, b, mixed", "1003", "3"),
+        ],
+        [
+            "Sum of a, b, mixed (1003) does not equal expected total (3)",
+            "Sum of a, b, mixed (2.5) does not equal expected total (3)",
+            "Sum of a, b, mixed (4) does not equal expected total (3)",
+            "Sum of a, b, mixed (4.5) does not equal expected total (3)",
+            "Sum of a, b, mixed (5) does not equal expected total (3)",
+            "Sum of a, b, mixed (6) does not equal expected total (3)",
+            "Sum of a, b, mixed (7) does not equal expected total (3)",
+        ],
+        ["cross_field_sum_check"],
+    ),
+    "regex": (
+        [
+            (0, "code", "A1", ""),
+            (0, "email", "a@b.co", ""),
+            (1, "code", "b2", ""),
+            (3, "code", "é3", ""),
+            (3, "email", "ÉLODIE@Example.FR", ""),
+            (4, "code", "42", ""),
+            (4, "email", " x@y.org ", ""),
+            (5, "code", "3.5", ""),
+            (5, "code", "3.5", ""),
+            (5, "email", "a@@b.c", ""),
+            (6, "email", "no@dot", ""),
+            (7, "code", "", ""),
+            (7, "email", "İ@x.io", ""),
+            (8, "email", "a b@c.de", ""),
+            (9, "code", "z9z", ""),
+            (9, "email", "u@d.com\xa0", ""),
+        ],
+        [
+            'Value does not match required pattern "word" (^\\w+$)',
+            'Value matches forbidden pattern "digit" (\\d)',
+        ],
+        ["regex_validation"],
+    ),
+    "custom_expr": (
+        [
+            (0, "a", "1.0", ""),
+            (2, "a", None, ""),
+            (5, "a", "1.0", ""),
+            (6, "a", "0.0", ""),
+            (9, "a", "1.0", ""),
+        ],
+        ["Custom validation failed"],
+        ["custom_validation"],
+    ),
+    "custom_row": (
+        [(2, "status", None, "")],
+        ["Custom validation failed"],
+        ["custom_validation"],
+    ),
+    "lookup": (
+        [(3, "code", "é3", "x"), (4, "code", "42", "z9z")],
+        [
+            'Based on status value "ACTIVE", code should be "x"',
+            'Based on status value "closed", code should be "z9z"',
+        ],
+        ["custom_lookup"],
+    ),
+}
+
+
+def make_rule(params):
+    params = dict(params)
+    columns = params.pop("columns", [])
+    return SimpleNamespace(
+        name="rule", params=json.dumps(params), target_columns=json.dumps(columns)
+    )
+
+
+def summarize(issues):
+    rows = sorted(
+        (
+            (
+                issue["row_index"],
+                issue["column_name"],
+                issue["current_value"],
+                issue["suggested_value"],
+            )
+            for issue in issues
+        ),
+        key=repr,
+    )
+    return (
+        rows,
+        sorted({issue["message"] for issue in issues}),
+        sorted({issue["category"] for issue in issues}),
+    )
+
+
+@pytest.mark.parametrize("shared_context", [False, True], ids=["plain", "col_ctx"])
+@pytest.mark.parametrize("case", sorted(CASES))
+def test_validator_matches_expected_issues(case, shared_context):
+    validator_class, params = CASES[case]
+    frame = FRAME.copy()
+    if issubclass(validator_class, RuleValidator) and shared_context:
+        col_ctx = RuleEngineService.build_column_context(frame)
+        validator = validator_class(make_rule(params), frame, None, col_ctx)
+    else:
+        validator = validator_class(make_rule(params), frame, None)
+
+    assert summarize(validator.validate()) == EXPECTED[case]
+
+
+@pytest.mark.parametrize("case", ["missing_data", "value_list_ci", "length_range"])
+def test_chunked_validation_matches_full_validation(case):
+    validator_class, params = CASES[case]
+    validator = validator_class(make_rule(params), FRAME, None)
+    validator.chunked_reader = ChunkedDataFrameReader(chunk_size=3)
+
+    assert summarize(validator.validate_chunked()) == EXPECTED[case]
@@ -0,0 +1,71 @@
+import json
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.rule_engine import CrossFieldValidator, CustomValidator
+
+
+def make_rule(name="rule", columns=None, **params):
+    return SimpleNamespace(
+        name=name, params=json.dumps(params), target_columns=json.dumps(columns or [])
+    )
+
+
+def flagged_rows(issues):
+    return [(issue["row_index"], issue["current_value"]) for issue in issues]
+
+
+@pytest.fixture
+def frame():
+    return pd.DataFrame(
+        {
+            "a": [1, 5, np.nan, -2, 3],
+            "b": ["x", None, "yy", "é", "z"],
+        }
+    )
+
+
+def run_custom(frame, expression, vectorized):
+    validator = CustomValidator(
+        make_rule(columns=["a"], expression=expression), frame, None
+    )
+    if not vectorized:
+        validator._evaluate_vectorized = lambda expression: None
+    return validator.validate()
+
+
+@pytest.mark.parametrize("expression", ["a > 0", "a > 0 and a < 4", "not (a == 5)"])
+def test_custom_expression_flags_same_rows_on_both_paths(frame, expression):
+    vectorized = run_custom(frame, expression, vectorized=True)
+    per_row = run_custom(frame, expression, vectorized=False)
+
+    assert vectorized
+    assert flagged_rows(vectorized) == flagged_rows(per_row)
+
+
+def test_custom_expression_per_row_path_binds_bare_column_names(frame):
+    # `is not None` cannot be evaluated column-wise, so this takes the per-row path
+    issues = run_custom(frame, "b is not None", vectorized=True)
+
+    assert [issue["row_index"] for issue in issues] == [1]
+
+
+def test_custom_expression_per_row_path_exposes_row(frame):
+    issues = run_custom(frame, "row['a'] > 0", vectorized=True)
+
+    assert [issue["row_index"] for issue in issues] == [2, 3]
+
+
+def test_sum_check_shows_whole_sums_as_ints_when_columns_have_nulls():
+    frame = pd.DataFrame({"a": [1, np.nan, 1.5], "b": [1, 2, 1], "total": [5, 5, 5]})
+    rule = make_rule(
+        rules=[{"type": "sum_check", "sum_fields": ["a", "b"], "total_field": "total"}]
+    )
+
+    issues = CrossFieldValidator(rule, frame, None).validate()
+
+    assert [issue["suggested_value"] for issue in issues] == ["2", "2", "2.5"]
+    assert issues[0]["message"] == "Sum of a, b (2) does not match total"